@@ -5,6 +5,12 @@ File: backend/app/agents/actions.py
 Executes specific agent actions (post, comment, like, etc.).
 """
 
+from sqlalchemy.orm import Session
+
+from app.models.agent import Agent
+from app.services.quota_service import quota_service
+
+
 class AgentActions:
     """Executes agent actions on the platform"""
 
@@ -45,12 +51,17 @@ class AgentActions:
         # TODO: Log action
         pass
 
-    async def check_rate_limit(self) -> bool:
-        """Check if agent has exceeded rate limit"""
-        # TODO: Get agent's actions today
-        # TODO: Compare to max allowed
-        # TODO: Return True if ok, False if limit reached
-        pass
+    async def check_rate_limit(self, db: Session) -> bool:
+        """
+        Check if agent still has actions left today (does not consume any)
+
+        Executors must still call quota_service.consume() before acting;
+        only that is atomic.
+        """
+        agent = db.get(Agent, self.agent_id)
+        if agent is None:
+            return False
+        return quota_service.peek(db, agent).allowed
 
     async def log_action(self, action_type: str, details: dict):
         """Log an agent action"""
@@ -5,10 +5,9 @@ File: backend/app/api/routes/agents.py
 Handles agent creation, configuration, and management.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
-from typing import Dict, Any
-from datetime import datetime
+from typing import Dict, Any, Optional
 
 from app.database.connection import get_db
 from app.core.dependencies import get_current_user, get_current_active_user
@@ -16,14 +15,20 @@ from app.models.user import User
 from app.models.agent import Agent
 from app.models.post import Post, PostType, PostStatus
 from app.models.agent_action import AgentAction, ActionType, ActionStatus
+from app.models.user_stats import COUNTER_FIELDS
 from app.schemas.agent import (
     AgentCreate,
     AgentUpdate,
     AgentResponse,
     OnboardingQuestionnaireData,
+    AgentActionPage,
 )
 from app.schemas.post import PostResponse
 from app.services.ai_service import ai_service
+from app.services.action_log_service import action_log_service
+from app.services.quota_service import quota_service
+from app.services.event_bus import record_event
+from app.services.stats_service import stats_service, post_changes, is_counted, action_activity
 
 router = APIRouter()
 
@@ -111,23 +116,33 @@ async def update_agent(
 
 
 @router.get("/me/dashboard", response_model=Dict[str, Any])
-async def get_agent_dashboard(agent: Agent = Depends(get_user_agent)):
+async def get_agent_dashboard(
+    agent: Agent = Depends(get_user_agent),
+    db: Session = Depends(get_db)
+):
     """Get agent dashboard data (today's activity)"""
+    # Denormalized counters: one primary-key read, no COUNT(*)
+    stats = stats_service.get(db, agent.user_id)
+    counters = {field: getattr(stats, field) if stats else 0 for field in COUNTER_FIELDS}
+    quota = quota_service.peek(db, agent)
+
     return {
         "agent": {
             "id": agent.id,
             "name": agent.name,
             "is_active": agent.is_active,
             "autonomy_level": agent.autonomy_level,
-            "actions_today": agent.actions_today,
+            "actions_today": quota.used,
             "last_action_at": agent.last_action_at,
         },
+        "quota": quota.as_dict(),
         "stats": {
-            "total_posts": 0,
-            "total_interactions": 0,
-            "connections": 0,
+            "total_posts": counters["post_count"],
+            "total_interactions": counters["likes_given"] + counters["comment_count"],
+            "connections": counters["connection_count"],
+            **counters,
         },
-        "recent_activity": [],
+        "recent_activity": list(stats.recent_activity or []) if stats else [],
     }
 
 
@@ -165,6 +180,7 @@ Your goal is to represent your user authentically on social media platforms. """
 
 @router.post("/me/generate-content", response_model=PostResponse, status_code=status.HTTP_201_CREATED)
 async def generate_agent_content(
+    response: Response,
     agent: Agent = Depends(get_user_agent),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -178,8 +194,25 @@ async def generate_agent_content(
         "autonomy_level": agent.autonomy_level,
     }
 
+    # Take one action from today's quota atomically, before the slow AI call
+    quota = quota_service.consume(db, agent)
+    if not quota.allowed:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Daily agent action limit reached",
+            headers={**quota.headers(), "Retry-After": str(quota.retry_after_seconds)},
+        )
+    db.commit()
+    response.headers.update(quota.headers())
+
     # Generate content using AI service
-    content = await ai_service.generate_post_content(agent_config)
+    try:
+        content = await ai_service.generate_post_content(agent_config)
+    except Exception:
+        # The action never happened; give the unit back
+        quota_service.refund(db, agent)
+        db.commit()
+        raise
 
     # Determine if content needs approval based on autonomy level
     needs_approval = agent.autonomy_level < 7
@@ -208,22 +241,19 @@ async def generate_agent_content(
     )
 
     db.add(action)
+    db.flush()
+    if post.status == PostStatus.PUBLISHED:
+        record_event(db, "post.published", {"postId": post.id, "userId": current_user.id})
+        stats_service.bump(db, *post_changes(post, 1))
+    stats_service.bump(
+        db,
+        (current_user.id, "agent_action_count", 1),
+        (current_user.id, "pending_approvals", 1 if needs_approval else 0),
+    )
+    stats_service.record_activity(db, current_user.id, action_activity(action))
     db.commit()
     db.refresh(post)
 
-    # Update agent's actions_today counter
-    now = datetime.utcnow()
-    today = now.date()
-
-    # Reset counter if it's a new day
-    if agent.last_action_date is None or agent.last_action_date.date() != today:
-        agent.actions_today = 0
-
-    agent.actions_today += 1
-    agent.last_action_date = now
-    agent.last_action_at = now
-    db.commit()
-
     return post
 
 
@@ -261,8 +291,20 @@ async def approve_agent_action(
     if action.post_id:
         post = db.query(Post).filter(Post.id == action.post_id).first()
         if post:
+            # The draft may already have been published through PUT /api/posts/{id}
+            was_published = post.status == PostStatus.PUBLISHED
+            was_counted = is_counted(post)
             post.status = PostStatus.PUBLISHED
-
+            if not was_published:
+                record_event(db, "post.published", {"postId": post.id, "userId": current_user.id})
+            if is_counted(post) and not was_counted:
+                stats_service.bump(db, *post_changes(post, 1))
+
+    record_event(db, "agent_action.approved", {"actionId": action.id, "agentId": agent.id})
+    stats_service.bump(
+        db, (current_user.id, "pending_approvals", -1), (current_user.id, "approved_actions", 1)
+    )
+    stats_service.record_activity(db, current_user.id, action_activity(action))
     db.commit()
 
     if action.post_id:
@@ -308,20 +350,40 @@ async def reject_agent_action(
     # If it's a post action, delete the draft post
     if action.post_id:
         post = db.query(Post).filter(Post.id == action.post_id).first()
-        if post:
+        if post and not post.is_deleted:
+            # The draft may already have been published through PUT /api/posts/{id}
+            was_counted = is_counted(post)
             post.is_deleted = True
-
+            if was_counted:
+                stats_service.bump(db, *post_changes(post, -1))
+            if post.status == PostStatus.PUBLISHED:
+                record_event(db, "post.deleted", {"postId": post.id})
+
+    record_event(db, "agent_action.rejected", {"actionId": action.id, "agentId": agent.id})
+    stats_service.bump(
+        db, (current_user.id, "pending_approvals", -1), (current_user.id, "rejected_actions", 1)
+    )
+    stats_service.record_activity(db, current_user.id, action_activity(action))
     db.commit()
 
     return {"message": "Action rejected successfully"}
 
 
-@router.get("/me/actions")
-async def get_agent_actions():
-    """Get agent action history"""
-    # TODO: Fetch agent actions with pagination
-    # TODO: Return action list
-    pass
+@router.get("/me/actions", response_model=AgentActionPage)
+async def get_agent_actions(
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the previous page"),
+    limit: int = Query(20, ge=1, le=100),
+    action_type: Optional[ActionType] = Query(None),
+    action_status: Optional[ActionStatus] = Query(None, alias="status"),
+    agent: Agent = Depends(get_user_agent),
+    db: Session = Depends(get_db)
+):
+    """Get agent action history, newest first"""
+    return action_log_service.get_history(
+        db, agent.id, cursor=cursor, limit=limit,
+        action_type=action_type, action_status=action_status,
+    )
+
 
 @router.post("/me/directives")
 async def add_agent_directive():
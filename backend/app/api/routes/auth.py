@@ -5,19 +5,24 @@ File: backend/app/api/routes/auth.py
 Handles user registration, login, and OAuth flows.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Query
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import and_, func, or_, select, tuple_, union_all
 from sqlalchemy.orm import Session
+from typing import Optional
 import os
 import uuid
 from pathlib import Path
 
-from app.database.connection import get_db
-from app.services.storage_service import storage_service
+from app.database.connection import get_db, get_read_db
+from app.services.storage_service import UnsupportedMediaType, UploadTooLarge, storage_service
 from app.models.user import User
-from app.schemas import UserCreate, UserResponse, TokenResponse, UserWithToken, UserUpdate
+from app.models.connection import Connection
+from app.schemas import UserCreate, UserResponse, TokenResponse, UserWithToken, UserUpdate, UserDirectoryPage
 from app.core.security import hash_password, verify_password, create_access_token
 from app.core.dependencies import get_current_active_user
+from app.core.pagination import encode_cursor, decode_cursor
+from app.core.config import settings
 
 router = APIRouter()
 
@@ -190,38 +195,28 @@ async def upload_profile_picture(
     Returns:
         Updated user data with new profile picture URL
     """
-    # Validate file type
-    allowed_types = ["image/jpeg", "image/png", "image/gif", "image/webp"]
-    if file.content_type not in allowed_types:
+    # Stream to storage: the file type is sniffed from its content and the
+    # size checked chunk by chunk (max 5MB; larger bodies get 413 up front)
+    try:
+        public_url = await storage_service.upload_profile_picture(file)
+    except UnsupportedMediaType:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid file type. Only JPEG, PNG, GIF, and WebP images are allowed."
         )
-
-    # Validate file size (max 5MB)
-    contents = await file.read()
-    if len(contents) > 5 * 1024 * 1024:
+    except UploadTooLarge:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="File size exceeds 5MB limit"
-        )
-
-    # Upload to Supabase Storage
-    try:
-        public_url = await storage_service.upload_profile_picture(
-            user_id=current_user.id,
-            file_content=contents,
-            content_type=file.content_type
+            detail=f"File size exceeds {settings.upload_max_bytes // (1024 * 1024)}MB limit"
         )
-
-        # Update user profile picture URL
-        current_user.profile_picture_url = public_url
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to upload file: {str(e)}"
         )
 
+    # Update user profile picture URL
+    current_user.profile_picture_url = public_url
     db.commit()
     db.refresh(current_user)
 
@@ -282,16 +277,94 @@ async def instagram_oauth_callback():
     }
 
 
-@router.get("/users", response_model=list[UserResponse])
+@router.get("/users", response_model=UserDirectoryPage)
 async def list_users(
-    db: Session = Depends(get_db),
+    q: Optional[str] = Query(None, min_length=1, max_length=100, description="Name or email prefix"),
+    cursor: Optional[str] = Query(None, description="nextCursor from the previous page"),
+    limit: int = Query(20, ge=1, le=100),
+    exclude_connected: bool = Query(False, description="Hide users you already have a connection with"),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """
-    Get list of all users (for browsing and connecting)
+    Browse users for connecting, ordered by name
+
+    Args:
+        q: Optional case-insensitive prefix matched against full name or email
+        cursor: Opaque cursor returned as nextCursor by the previous page
+        limit: Page size
+        exclude_connected: Skip users with any existing connection to the current user
 
     Returns:
-        List of users excluding the current user
+        Page of lightweight user entries and the cursor for the next page
     """
-    users = db.query(User).filter(User.id != current_user.id).all()
-    return users
+    name_key = func.lower(User.full_name)
+
+    query = db.query(
+        User.id,
+        User.email,
+        User.full_name,
+        User.profile_picture_url,
+        name_key.label("name_key"),
+    ).filter(
+        User.id != current_user.id,
+        User.is_active == True
+    )
+
+    if q:
+        prefix = q.strip().lower()
+        if prefix:
+            # Range predicates let the lower() expression indexes serve the prefix match
+            upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+            email_key = func.lower(User.email)
+            query = query.filter(or_(
+                and_(name_key >= prefix, name_key < upper),
+                and_(email_key >= prefix, email_key < upper),
+            ))
+
+    if exclude_connected:
+        connected_ids = union_all(
+            select(Connection.user_high_id).where(Connection.user_low_id == current_user.id),
+            select(Connection.user_low_id).where(Connection.user_high_id == current_user.id),
+        )
+        query = query.filter(User.id.not_in(connected_ids))
+
+    after = decode_cursor(cursor, 2)
+    if after:
+        query = query.filter(tuple_(name_key, User.id) > tuple_(after[0], after[1]))
+
+    rows = query.order_by(name_key, User.id).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor([rows[-1].name_key, rows[-1].id])
+
+    return {"items": rows, "next_cursor": next_cursor}
+
+
+@router.get("/users/{user_id}", response_model=UserResponse)
+async def get_user(
+    user_id: int,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Get a single user's public profile
+
+    Args:
+        user_id: ID of the user to fetch
+
+    Returns:
+        User data
+
+    Raises:
+        HTTPException: If the user does not exist
+    """
+    user = db.query(User).filter(User.id == user_id, User.is_active == True).first()
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+    return user
@@ -6,14 +6,25 @@ Handles user connections and relationship management.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload
 from typing import List, Optional
 
-from app.database.connection import get_db
+from app.database.connection import get_db, get_read_db
 from app.core.dependencies import get_current_active_user
 from app.models.user import User
-from app.models.connection import Connection, ConnectionStatus, ConnectionType
-from app.schemas.connection import ConnectionCreate, ConnectionResponse, ConnectionUpdate
+from app.models.connection import Connection, ConnectionStatus, ConnectionType, canonical_pair
+from app.schemas.connection import (
+    ConnectionCreate,
+    ConnectionResponse,
+    ConnectionUpdate,
+    ConnectionSuggestion,
+    MutualConnectionsResponse,
+)
+from app.services.event_bus import record_event
+from app.services.stats_service import stats_service
+from app.services.social_graph import social_graph
+from app.services.ranking_service import ranking_service
 
 router = APIRouter()
 
@@ -22,7 +33,7 @@ router = APIRouter()
 async def get_connections(
     status_filter: Optional[str] = Query(None, description="Filter by status: pending, accepted, rejected"),
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get all connections for current user"""
     query = db.query(Connection).options(
@@ -46,6 +57,43 @@ async def get_connections(
     return connections
 
 
+@router.get("/suggestions", response_model=List[ConnectionSuggestion])
+async def get_connection_suggestions(
+    limit: int = Query(10, ge=1, le=50),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_read_db)
+):
+    """Suggest friends-of-friends ranked by number of mutual connections"""
+    candidates = social_graph.two_hop(current_user.id, limit=limit)
+    if not candidates:
+        return []
+
+    users = db.query(User).filter(
+        User.id.in_([user_id for user_id, _ in candidates]),
+        User.is_active == True
+    ).all()
+    users_by_id = {user.id: user for user in users}
+
+    return [
+        {"user": users_by_id[user_id], "mutual_count": mutual_count}
+        for user_id, mutual_count in candidates
+        if user_id in users_by_id
+    ]
+
+
+@router.get("/mutual/{user_id}", response_model=MutualConnectionsResponse)
+async def get_mutual_connections(
+    user_id: int,
+    current_user: User = Depends(get_current_active_user)
+):
+    """Get number of connections shared with another user"""
+    return {
+        "user_id": user_id,
+        "mutual_count": social_graph.mutual_count(current_user.id, user_id),
+        "is_connected": social_graph.are_connected(current_user.id, user_id),
+    }
+
+
 @router.post("/{user_id}", response_model=ConnectionResponse, status_code=status.HTTP_201_CREATED)
 async def create_connection(
     user_id: int,
@@ -67,9 +115,11 @@ async def create_connection(
             detail="User not found"
         )
 
-    existing_connection = db.query(Connection).filter(
-        ((Connection.user_id == current_user.id) & (Connection.connected_user_id == user_id)) |
-        ((Connection.user_id == user_id) & (Connection.connected_user_id == current_user.id))
+    # Single point lookup on the canonical pair covers both directions
+    user_low_id, user_high_id = canonical_pair(current_user.id, user_id)
+    existing_connection = db.query(Connection.id).filter(
+        Connection.user_low_id == user_low_id,
+        Connection.user_high_id == user_high_id
     ).first()
 
     if existing_connection:
@@ -89,7 +139,19 @@ async def create_connection(
     )
 
     db.add(connection)
-    db.commit()
+    try:
+        db.flush()
+        record_event(db, "connection.requested", {
+            "connectionId": connection.id, "userId": current_user.id, "targetId": user_id
+        })
+        db.commit()
+    except IntegrityError:
+        # Lost a race with a concurrent request for the same pair
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Connection already exists"
+        )
     db.refresh(connection)
 
     return connection
@@ -123,9 +185,24 @@ async def accept_connection(
         )
 
     connection.status = ConnectionStatus.ACCEPTED
+    record_event(db, "connection.accepted", {
+        "connectionId": connection.id, "userId": current_user.id, "requesterId": connection.user_id
+    })
+    stats_service.bump(
+        db,
+        (connection.user_id, "connection_count", 1),
+        (connection.connected_user_id, "connection_count", 1),
+    )
     db.commit()
     db.refresh(connection)
 
+    social_graph.add_edge(
+        connection.user_id, connection.connected_user_id, connection.connection_type
+    )
+    # For-You rankings depend on the graph
+    ranking_service.invalidate(connection.user_id)
+    ranking_service.invalidate(connection.connected_user_id)
+
     return connection
 
 
@@ -184,9 +261,21 @@ async def remove_connection(
             detail="You can only remove your own connections"
         )
 
+    was_accepted = connection.status == ConnectionStatus.ACCEPTED
+    user_id, connected_user_id = connection.user_id, connection.connected_user_id
+
     db.delete(connection)
+    if was_accepted:
+        stats_service.bump(
+            db, (user_id, "connection_count", -1), (connected_user_id, "connection_count", -1)
+        )
     db.commit()
 
+    if was_accepted:
+        social_graph.remove_edge(user_id, connected_user_id)
+        ranking_service.invalidate(user_id)
+        ranking_service.invalidate(connected_user_id)
+
     return None
 
 
@@ -224,4 +313,11 @@ async def update_connection_type(
     db.commit()
     db.refresh(connection)
 
+    social_graph.set_connection_type(
+        connection.user_id, connection.connected_user_id, connection.connection_type
+    )
+    # For-You rankings depend on the graph
+    ranking_service.invalidate(connection.user_id)
+    ranking_service.invalidate(connection.connected_user_id)
+
     return connection
@@ -9,11 +9,14 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 from typing import List
 
-from app.database.connection import get_db
+from app.database.connection import get_read_db
 from app.core.dependencies import get_current_active_user
 from app.models.user import User
 from app.schemas.post import PostResponse
+from app.schemas.encoders import encode_post_rows, json_bytes_response
 from app.services.feed_service import feed_service
+from app.services.feed_cache import global_feed_cache
+from app.services.ranking_service import ranking_service
 
 router = APIRouter()
 
@@ -22,24 +25,40 @@ async def get_feed(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get personalized feed for current user (own posts + connections' posts)"""
-    posts = feed_service.get_personalized_feed(
+    rows = feed_service.get_personalized_feed(
         user_id=current_user.id, db=db, skip=skip, limit=limit
     )
-    return posts
+    return json_bytes_response(encode_post_rows(rows))
+
+@router.get("/for-you", response_model=List[PostResponse])
+async def get_ranked_feed(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_read_db),
+):
+    """Get ranked feed (connections + trending, scored by recency, engagement and affinity)"""
+    rows = ranking_service.get_ranked_feed(
+        user_id=current_user.id, db=db, skip=skip, limit=limit
+    )
+    return json_bytes_response(encode_post_rows(rows))
 
 @router.get("/all", response_model=List[PostResponse])
 async def get_global_feed(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get global feed showing all published posts for discovery"""
-    posts = feed_service.get_global_feed(db=db, skip=skip, limit=limit)
-    return posts
+    if global_feed_cache.is_cacheable(skip, limit):
+        return json_bytes_response(global_feed_cache.get_page(db=db, skip=skip, limit=limit))
+
+    rows = feed_service.get_global_feed(db=db, skip=skip, limit=limit)
+    return json_bytes_response(encode_post_rows(rows))
 
 @router.get("/user/{user_id}", response_model=List[PostResponse])
 async def get_user_feed(
@@ -47,10 +66,10 @@ async def get_user_feed(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get all published posts for a specific user"""
-    posts = feed_service.get_user_feed(
+    rows = feed_service.get_user_feed(
         user_id=user_id, db=db, skip=skip, limit=limit
     )
-    return posts
+    return json_bytes_response(encode_post_rows(rows))
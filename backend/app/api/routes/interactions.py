@@ -3,18 +3,34 @@ Interaction API routes
 File: backend/app/api/routes/interactions.py
 
 Handles likes, comments, and reactions on posts.
+Likes are stored in the likes table via like_service, not as interactions.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session, joinedload
-from typing import List
+from sqlalchemy.orm import Session
+from typing import List, Optional
 
-from app.database.connection import get_db
+from app.database.connection import get_db, get_read_db
 from app.core.dependencies import get_current_active_user
 from app.models.user import User
 from app.models.post import Post
-from app.models.interaction import Interaction, InteractionType, ActorType
-from app.schemas.interaction import LikeCreate, CommentCreate, CommentUpdate, InteractionResponse
+from app.models.interaction import Interaction, InteractionType
+from app.models.like import LikeTargetType
+from app.schemas.interaction import (
+    LikeCreate,
+    CommentCreate,
+    CommentUpdate,
+    InteractionResponse,
+    LikeResponse,
+    LikedByFriendsResponse,
+    CommentThreadPage,
+    CommentReplyPage,
+)
+from app.schemas.encoders import INTERACTION_ROW_COLUMNS, encode_interaction_rows, encode_json, json_bytes_response
+from app.services.comment_thread_service import comment_thread_service
+from app.services.event_bus import record_event
+from app.services.like_service import like_service
+from app.services.stats_service import stats_service
 
 router = APIRouter()
 
@@ -23,20 +39,29 @@ router = APIRouter()
 async def check_like_status(
     post_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Check if current user has liked this post"""
-    like = db.query(Interaction).filter(
-        Interaction.post_id == post_id,
-        Interaction.user_id == current_user.id,
-        Interaction.interaction_type == InteractionType.LIKE,
-        Interaction.parent_interaction_id == None
-    ).first()
+    return {"isLiked": like_service.has_liked(db, LikeTargetType.POST, post_id, current_user.id)}
 
-    return {"isLiked": like is not None}
+
+@router.get("/posts/{post_id}/likes/friends", response_model=LikedByFriendsResponse)
+async def get_liked_by_friends(
+    post_id: int,
+    limit: int = Query(3, ge=0, le=20),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_read_db)
+):
+    """Connections of the current user who liked this post ("liked by Ana and 2 others")"""
+    count, friend_ids = like_service.liked_by_friends(db, post_id, current_user.id, limit)
+    users = []
+    if friend_ids:
+        by_id = {user.id: user for user in db.query(User).filter(User.id.in_(friend_ids)).all()}
+        users = [by_id[friend_id] for friend_id in friend_ids if friend_id in by_id]
+    return {"count": count, "users": users}
 
 
-@router.post("/posts/{post_id}/like", response_model=InteractionResponse, status_code=status.HTTP_201_CREATED)
+@router.post("/posts/{post_id}/like", response_model=LikeResponse, status_code=status.HTTP_201_CREATED)
 async def like_post(
     post_id: int,
     current_user: User = Depends(get_current_active_user),
@@ -51,39 +76,25 @@ async def like_post(
             detail="Post not found"
         )
 
-    # Check if user already liked this post
-    existing_like = db.query(Interaction).filter(
-        Interaction.post_id == post_id,
-        Interaction.user_id == current_user.id,
-        Interaction.interaction_type == InteractionType.LIKE,
-        Interaction.parent_interaction_id == None
-    ).first()
-
-    if existing_like:
+    # Insert-or-nothing on the (target, user) key, so double clicks cannot race
+    if not like_service.add_like(db, LikeTargetType.POST, post_id, current_user.id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="You already liked this post"
         )
 
-    # Create like
-    like = Interaction(
-        user_id=current_user.id,
-        post_id=post_id,
-        parent_interaction_id=None,
-        interaction_type=InteractionType.LIKE,
-        actor_type=ActorType.HUMAN,
-        content=None
-    )
-
-    db.add(like)
-
-    # Increment like count on post
-    post.like_count += 1
+    stats_service.bump(db, (current_user.id, "likes_given", 1), (post.user_id, "likes_received", 1))
+    record_event(db, "post.liked", {"postId": post.id, "userId": current_user.id})
 
     db.commit()
-    db.refresh(like)
+    db.refresh(post)
 
-    return like
+    return {
+        "target_type": LikeTargetType.POST,
+        "target_id": post.id,
+        "user_id": current_user.id,
+        "like_count": post.like_count,
+    }
 
 
 @router.delete("/posts/{post_id}/like", status_code=status.HTTP_204_NO_CONTENT)
@@ -100,26 +111,12 @@ async def unlike_post(
             detail="Post not found"
         )
 
-    # Find the like
-    like = db.query(Interaction).filter(
-        Interaction.post_id == post_id,
-        Interaction.user_id == current_user.id,
-        Interaction.interaction_type == InteractionType.LIKE,
-        Interaction.parent_interaction_id == None
-    ).first()
-
-    if not like:
+    if not like_service.remove_like(db, LikeTargetType.POST, post_id, current_user.id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Like not found"
         )
-
-    # Delete like
-    db.delete(like)
-
-    # Decrement like count on post
-    if post.like_count > 0:
-        post.like_count -= 1
+    stats_service.bump(db, (current_user.id, "likes_given", -1), (post.user_id, "likes_received", -1))
 
     db.commit()
 
@@ -142,19 +139,18 @@ async def comment_on_post(
             detail="Post not found"
         )
 
-    # Create comment
-    comment = Interaction(
-        user_id=current_user.id,
-        post_id=post_id,
-        interaction_type=InteractionType.COMMENT,
-        actor_type=ActorType.HUMAN,
-        content=comment_data.content
+    # Create comment (a reply when parentId is given)
+    comment = comment_thread_service.add_comment(
+        db, post, current_user.id, comment_data.content, parent_id=comment_data.parent_id
     )
 
-    db.add(comment)
-
     # Increment comment count on post
     post.comment_count += 1
+    stats_service.bump(db, (current_user.id, "comment_count", 1), (post.user_id, "comments_received", 1))
+
+    record_event(db, "comment.created", {
+        "commentId": comment.id, "postId": post.id, "userId": current_user.id
+    })
 
     db.commit()
     db.refresh(comment)
@@ -168,19 +164,19 @@ async def get_comments(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get comments for a post"""
-    post = db.query(Post).filter(Post.id == post_id).first()
-    if not post:
+    post_exists = db.query(Post.id).filter(Post.id == post_id).first()
+    if not post_exists:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Post not found"
         )
 
-    comments = (
-        db.query(Interaction)
-        .options(joinedload(Interaction.user))
+    rows = (
+        db.query(*INTERACTION_ROW_COLUMNS)
+        .outerjoin(User, User.id == Interaction.user_id)
         .filter(
             Interaction.post_id == post_id,
             Interaction.interaction_type == InteractionType.COMMENT,
@@ -192,7 +188,53 @@ async def get_comments(
         .all()
     )
 
-    return comments
+    return json_bytes_response(encode_interaction_rows(rows))
+
+
+@router.get("/posts/{post_id}/threads", response_model=CommentThreadPage)
+async def get_comment_threads(
+    post_id: int,
+    cursor: Optional[str] = Query(None, description="nextCursor from the previous page"),
+    limit: int = Query(20, ge=1, le=100),
+    replies: int = Query(3, ge=0, le=20, description="Replies included per thread"),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_read_db)
+):
+    """Get top-level comments for a post, each with its first replies"""
+    post_exists = db.query(Post.id).filter(Post.id == post_id).first()
+    if not post_exists:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Post not found"
+        )
+
+    page = comment_thread_service.get_threads(
+        db, post_id, cursor=cursor, limit=limit, replies_per_thread=replies
+    )
+    return json_bytes_response(encode_json(page))
+
+
+@router.get("/comments/{comment_id}/replies", response_model=CommentReplyPage)
+async def get_comment_replies(
+    comment_id: int,
+    cursor: Optional[str] = Query(None, description="repliesCursor / nextCursor from the previous page"),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_read_db)
+):
+    """Get more replies under a comment, in thread order"""
+    comment = db.query(Interaction).filter(
+        Interaction.id == comment_id,
+        Interaction.interaction_type == InteractionType.COMMENT
+    ).first()
+    if not comment:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Comment not found"
+        )
+
+    page = comment_thread_service.get_replies(db, comment, cursor=cursor, limit=limit)
+    return json_bytes_response(encode_json(page))
 
 
 @router.put("/comments/{comment_id}", response_model=InteractionResponse)
@@ -241,7 +283,8 @@ async def delete_comment(
         Interaction.interaction_type == InteractionType.COMMENT
     ).first()
 
-    if not comment:
+    # Already deleted: nothing left to un-count
+    if not comment or comment.is_deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Comment not found"
@@ -253,13 +296,15 @@ async def delete_comment(
             detail="You can only delete your own comments"
         )
 
-    # Soft delete
-    comment.is_deleted = True
+    # Soft delete (also un-counts it from its thread)
+    comment_thread_service.remove_comment(db, comment)
 
     # Decrement comment count on post
     post = db.query(Post).filter(Post.id == comment.post_id).first()
     if post and post.comment_count > 0:
         post.comment_count -= 1
+    if post:
+        stats_service.bump(db, (comment.user_id, "comment_count", -1), (post.user_id, "comments_received", -1))
 
     db.commit()
 
@@ -270,19 +315,13 @@ async def delete_comment(
 async def check_comment_like_status(
     comment_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Check if current user has liked this comment"""
-    like = db.query(Interaction).filter(
-        Interaction.parent_interaction_id == comment_id,
-        Interaction.user_id == current_user.id,
-        Interaction.interaction_type == InteractionType.LIKE
-    ).first()
+    return {"isLiked": like_service.has_liked(db, LikeTargetType.COMMENT, comment_id, current_user.id)}
 
-    return {"isLiked": like is not None}
 
-
-@router.post("/comments/{comment_id}/like", response_model=InteractionResponse, status_code=status.HTTP_201_CREATED)
+@router.post("/comments/{comment_id}/like", response_model=LikeResponse, status_code=status.HTTP_201_CREATED)
 async def like_comment(
     comment_id: int,
     current_user: User = Depends(get_current_active_user),
@@ -300,38 +339,24 @@ async def like_comment(
             detail="Comment not found"
         )
 
-    # Check if user already liked this comment
-    existing_like = db.query(Interaction).filter(
-        Interaction.parent_interaction_id == comment_id,
-        Interaction.user_id == current_user.id,
-        Interaction.interaction_type == InteractionType.LIKE
-    ).first()
-
-    if existing_like:
+    if not like_service.add_like(db, LikeTargetType.COMMENT, comment_id, current_user.id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="You already liked this comment"
         )
 
-    # Create like
-    like = Interaction(
-        user_id=current_user.id,
-        post_id=comment.post_id,
-        parent_interaction_id=comment_id,
-        interaction_type=InteractionType.LIKE,
-        actor_type=ActorType.HUMAN,
-        content=None
-    )
-
-    db.add(like)
-
-    # Increment like count on comment
-    comment.like_count += 1
+    stats_service.bump(db, (current_user.id, "likes_given", 1), (comment.user_id, "likes_received", 1))
+    record_event(db, "comment.liked", {"commentId": comment.id, "userId": current_user.id})
 
     db.commit()
-    db.refresh(like)
+    db.refresh(comment)
 
-    return like
+    return {
+        "target_type": LikeTargetType.COMMENT,
+        "target_id": comment.id,
+        "user_id": current_user.id,
+        "like_count": comment.like_count,
+    }
 
 
 @router.delete("/comments/{comment_id}/like", status_code=status.HTTP_204_NO_CONTENT)
@@ -351,25 +376,12 @@ async def unlike_comment(
             detail="Comment not found"
         )
 
-    # Find the like
-    like = db.query(Interaction).filter(
-        Interaction.parent_interaction_id == comment_id,
-        Interaction.user_id == current_user.id,
-        Interaction.interaction_type == InteractionType.LIKE
-    ).first()
-
-    if not like:
+    if not like_service.remove_like(db, LikeTargetType.COMMENT, comment_id, current_user.id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Like not found"
         )
-
-    # Delete like
-    db.delete(like)
-
-    # Decrement like count on comment
-    if comment.like_count > 0:
-        comment.like_count -= 1
+    stats_service.bump(db, (current_user.id, "likes_given", -1), (comment.user_id, "likes_received", -1))
 
     db.commit()
 
@@ -0,0 +1,68 @@
+"""
+Notification API routes
+File: backend/app/api/routes/notifications.py
+
+Handles the notification inbox, unread badge and read state.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+
+from app.database.connection import get_db, get_read_db
+from app.core.dependencies import get_current_active_user
+from app.models.user import User
+from app.schemas.notification import NotificationPage, UnreadCountResponse
+from app.services.notification_service import notification_service
+
+router = APIRouter()
+
+
+@router.get("/", response_model=NotificationPage)
+async def get_notifications(
+    cursor: Optional[str] = Query(None, description="nextCursor from the previous page"),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_read_db)
+):
+    """Get the current user's notifications, newest activity first"""
+    return notification_service.get_page(db=db, user_id=current_user.id, cursor=cursor, limit=limit)
+
+
+@router.get("/unread-count", response_model=UnreadCountResponse)
+async def get_unread_count(
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_read_db)
+):
+    """Get the number of unread notifications"""
+    return {"unread_count": notification_service.unread_count(db, current_user.id)}
+
+
+@router.post("/{notification_id}/read", response_model=UnreadCountResponse)
+async def mark_notification_read(
+    notification_id: int,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Mark a notification as read"""
+    if not notification_service.mark_read(db, current_user.id, notification_id):
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Unread notification not found"
+        )
+    db.commit()
+
+    return {"unread_count": notification_service.unread_count(db, current_user.id)}
+
+
+@router.post("/read-all", response_model=UnreadCountResponse)
+async def mark_all_notifications_read(
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Mark every notification as read"""
+    notification_service.mark_all_read(db, current_user.id)
+    db.commit()
+
+    return {"unread_count": 0}
@@ -9,11 +9,16 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session, joinedload
 from typing import List
 
-from app.database.connection import get_db
+from app.database.connection import get_db, get_read_db
 from app.core.dependencies import get_current_active_user
 from app.models.user import User
-from app.models.post import Post, PostType
+from app.models.post import Post, PostType, PostStatus
 from app.schemas.post import PostCreate, PostUpdate, PostResponse
+from app.schemas.encoders import encode_post_rows, json_bytes_response
+from app.services.feed_service import feed_service
+from app.services.ranking_service import ranking_service
+from app.services.event_bus import record_event
+from app.services.stats_service import stats_service, post_changes, is_counted
 
 router = APIRouter()
 
@@ -34,9 +39,16 @@ async def create_post(
     )
 
     db.add(post)
+    if post.status == PostStatus.PUBLISHED:
+        db.flush()
+        record_event(db, "post.published", {"postId": post.id, "userId": current_user.id})
+        stats_service.bump(db, *post_changes(post, 1))
     db.commit()
     db.refresh(post)
 
+    # Let the author see their new post in their ranked feed right away
+    ranking_service.invalidate(current_user.id)
+
     return post
 
 
@@ -45,12 +57,11 @@ async def get_posts(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get all posts for current user (from user and their agent)"""
-    posts = (
-        db.query(Post)
-        .options(joinedload(Post.author))
+    rows = (
+        feed_service.post_rows(db)
         .filter(
             Post.user_id == current_user.id,
             Post.is_deleted == False
@@ -61,7 +72,7 @@ async def get_posts(
         .all()
     )
 
-    return posts
+    return json_bytes_response(encode_post_rows(rows))
 
 
 @router.get("/user/{user_id}", response_model=List[PostResponse])
@@ -70,31 +81,18 @@ async def get_user_posts(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get all published posts for a specific user"""
-    posts = (
-        db.query(Post)
-        .options(joinedload(Post.author))
-        .filter(
-            Post.user_id == user_id,
-            Post.is_deleted == False,
-            Post.status == "published"
-        )
-        .order_by(Post.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
-
-    return posts
+    rows = feed_service.get_user_feed(user_id=user_id, db=db, skip=skip, limit=limit)
+    return json_bytes_response(encode_post_rows(rows))
 
 
 @router.get("/{post_id}", response_model=PostResponse)
 async def get_post(
     post_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get a specific post"""
     post = db.query(Post).options(joinedload(Post.author)).filter(Post.id == post_id).first()
@@ -138,13 +136,17 @@ async def update_post(
 
     update_data = post_update.model_dump(exclude_unset=True)
 
+    was_counted = is_counted(post)
     for field, value in update_data.items():
         setattr(post, field, value)
+    if is_counted(post) != was_counted:
+        stats_service.bump(db, *post_changes(post, 1 if is_counted(post) else -1))
 
     post.is_edited = True
     if post.post_type == PostType.AGENT:
         post.edited_by_user = True
 
+    record_event(db, "post.updated", {"postId": post.id})
     db.commit()
     db.refresh(post)
 
@@ -172,7 +174,10 @@ async def delete_post(
             detail="Not authorized to delete this post"
         )
 
+    if is_counted(post):
+        stats_service.bump(db, *post_changes(post, -1))
     post.is_deleted = True
+    record_event(db, "post.deleted", {"postId": post.id})
     db.commit()
 
     return None
@@ -0,0 +1,109 @@
+"""
+Realtime API routes
+File: backend/app/api/routes/realtime.py
+
+Pushes feed and notification deltas over WebSocket or Server-Sent Events.
+
+Browsers cannot set an Authorization header on WebSocket/EventSource
+requests, so both endpoints take the access token as a `token` query
+parameter. Events are JSON objects: {"type": "post.created", "data": {...}}.
+"""
+
+import asyncio
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, WebSocket, WebSocketDisconnect, status
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+from app.core.dependencies import get_user_from_token
+from app.database import connection as database
+from app.services.realtime import Subscription, realtime_hub
+
+router = APIRouter()
+
+_PING = b'{"type":"ping"}'
+
+
+def _authenticate(token: str) -> Optional[int]:
+    """User id for an active user's token (the DB session is not held open)"""
+    db = database.SessionLocal()
+    try:
+        user = get_user_from_token(token, db)
+        return user.id if user is not None and user.is_active else None
+    finally:
+        db.close()
+
+
+async def _next_event(subscription: Subscription) -> Optional[bytes]:
+    """Next payload, a ping after a quiet heartbeat interval, or None when closed"""
+    try:
+        return await asyncio.wait_for(subscription.get(), timeout=settings.realtime_heartbeat_seconds)
+    except asyncio.TimeoutError:
+        return _PING
+
+
+@router.websocket("/ws")
+async def realtime_socket(websocket: WebSocket, token: str = Query(...)):
+    """WebSocket stream of the current user's events"""
+    user_id = _authenticate(token)
+    if user_id is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    subscription = realtime_hub.subscribe(user_id)
+
+    async def watch_disconnect():
+        # Clients never send anything meaningful (text or binary frames are
+        # ignored); this only notices them leaving
+        try:
+            while True:
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+        except (WebSocketDisconnect, RuntimeError):
+            pass
+        subscription.close()
+
+    watcher = asyncio.create_task(watch_disconnect())
+    try:
+        while True:
+            payload = await _next_event(subscription)
+            if payload is None:
+                break
+            await websocket.send_text(payload.decode())
+    except WebSocketDisconnect:
+        pass
+    finally:
+        watcher.cancel()
+        realtime_hub.unsubscribe(subscription)
+
+
+@router.get("/stream")
+async def realtime_stream(token: str = Query(...)):
+    """Server-Sent Events stream of the current user's events"""
+    user_id = _authenticate(token)
+    if user_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+        )
+
+    subscription = realtime_hub.subscribe(user_id)
+
+    async def events():
+        try:
+            while True:
+                payload = await _next_event(subscription)
+                if payload is None:
+                    break
+                yield b"data: " + payload + b"\n\n"
+        finally:
+            realtime_hub.unsubscribe(subscription)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
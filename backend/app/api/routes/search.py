@@ -0,0 +1,45 @@
+"""
+Search API routes
+File: backend/app/api/routes/search.py
+
+Handles full-text search over posts and users.
+"""
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import List
+
+from app.database.connection import get_read_db
+from app.core.dependencies import get_current_active_user
+from app.models.user import User
+from app.schemas.post import PostResponse
+from app.schemas.encoders import encode_post_rows, json_bytes_response
+from app.schemas.user import UserDirectoryEntry
+from app.services.search_service import search_service
+
+router = APIRouter()
+
+
+@router.get("/posts", response_model=List[PostResponse])
+async def search_posts(
+    q: str = Query(..., min_length=1, max_length=200),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_read_db),
+):
+    """Search published posts by content, ranked by relevance"""
+    rows = search_service.search_posts(db=db, query=q, skip=skip, limit=limit)
+    return json_bytes_response(encode_post_rows(rows))
+
+
+@router.get("/users", response_model=List[UserDirectoryEntry])
+async def search_users(
+    q: str = Query(..., min_length=1, max_length=200),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_read_db),
+):
+    """Search people by name and bio, ranked by relevance"""
+    return search_service.search_users(db=db, query=q, skip=skip, limit=limit)
@@ -0,0 +1,126 @@
+"""
+Compressed integer bitmap
+File: backend/app/core/bitmap.py
+
+Roaring-style set of non-negative ints. Values are split on their high 16
+bits into chunks; each chunk holds its low 16 bits either as a sorted
+array('H') (2 bytes per member, while sparse) or as a fixed 8 KB bitset
+(once it passes ARRAY_CONTAINER_MAX members). Membership is a dict lookup
+plus a bisect or a bit test.
+"""
+
+from array import array
+from bisect import bisect_left
+from itertools import groupby
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+# Past this many members a chunk is smaller as a bitset than as an array
+ARRAY_CONTAINER_MAX = 4096
+_BITSET_BYTES = 1 << 13
+
+Container = Union[array, bytearray]
+
+
+def _to_bitset(values: Iterable[int]) -> bytearray:
+    bits = bytearray(_BITSET_BYTES)
+    for low in values:
+        bits[low >> 3] |= 1 << (low & 7)
+    return bits
+
+
+class MembershipBitmap:
+    """Compressed set of non-negative ints (e.g. ids of users who liked a post)"""
+
+    __slots__ = ("_chunks", "_size")
+
+    def __init__(self, values: Iterable[int] = ()):
+        self._chunks: Dict[int, Container] = {}
+        self._size = 0
+        for high, group in groupby(sorted(set(values)), key=lambda value: value >> 16):
+            lows = array("H", (value & 0xFFFF for value in group))
+            self._size += len(lows)
+            self._chunks[high] = lows if len(lows) <= ARRAY_CONTAINER_MAX else _to_bitset(lows)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, value: int) -> bool:
+        chunk = self._chunks.get(value >> 16)
+        if chunk is None:
+            return False
+        low = value & 0xFFFF
+        if isinstance(chunk, bytearray):
+            return bool(chunk[low >> 3] & (1 << (low & 7)))
+        i = bisect_left(chunk, low)
+        return i < len(chunk) and chunk[i] == low
+
+    def __iter__(self) -> Iterator[int]:
+        for high in sorted(self._chunks):
+            base = high << 16
+            chunk = self._chunks[high]
+            if isinstance(chunk, bytearray):
+                for byte_index, byte in enumerate(chunk):
+                    if byte:
+                        for bit in range(8):
+                            if byte & (1 << bit):
+                                yield base | (byte_index << 3) | bit
+            else:
+                for low in chunk:
+                    yield base | low
+
+    def add(self, value: int) -> bool:
+        """Add a value; returns False if it was already present"""
+        high, low = value >> 16, value & 0xFFFF
+        chunk = self._chunks.get(high)
+        if chunk is None:
+            self._chunks[high] = array("H", [low])
+        elif isinstance(chunk, bytearray):
+            mask = 1 << (low & 7)
+            if chunk[low >> 3] & mask:
+                return False
+            chunk[low >> 3] |= mask
+        else:
+            i = bisect_left(chunk, low)
+            if i < len(chunk) and chunk[i] == low:
+                return False
+            chunk.insert(i, low)
+            if len(chunk) > ARRAY_CONTAINER_MAX:
+                self._chunks[high] = _to_bitset(chunk)
+        self._size += 1
+        return True
+
+    def discard(self, value: int) -> bool:
+        """Remove a value; returns False if it was not present"""
+        high, low = value >> 16, value & 0xFFFF
+        chunk = self._chunks.get(high)
+        if chunk is None:
+            return False
+        if isinstance(chunk, bytearray):
+            mask = 1 << (low & 7)
+            if not chunk[low >> 3] & mask:
+                return False
+            # Bitsets are not shrunk back into arrays; they are bounded at 8 KB
+            chunk[low >> 3] &= ~mask & 0xFF
+        else:
+            i = bisect_left(chunk, low)
+            if i == len(chunk) or chunk[i] != low:
+                return False
+            del chunk[i]
+            if not chunk:
+                del self._chunks[high]
+        self._size -= 1
+        return True
+
+    def select(self, candidates: Iterable[int], limit: Optional[int] = None) -> List[int]:
+        """Members of candidates, in candidate order, stopping after limit"""
+        found: List[int] = []
+        for value in candidates:
+            if value in self:
+                found.append(value)
+                if limit is not None and len(found) >= limit:
+                    break
+        return found
+
+    def count_in(self, candidates: Iterable[int]) -> int:
+        """How many of candidates are members"""
+        return sum(1 for value in candidates if value in self)
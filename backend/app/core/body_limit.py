@@ -0,0 +1,78 @@
+"""
+Request body size limits
+File: backend/app/core/body_limit.py
+
+ASGI middleware rejecting oversized upload bodies before they are parsed.
+A Content-Length over the route's limit gets 413 without reading a byte;
+bodies without one (chunked) are counted as they arrive and cut off with
+413 once they pass the limit. The upload handler still checks the exact
+file size while streaming it, so the limits here include room for the
+multipart framing.
+"""
+
+import json
+from typing import Dict, Optional, Tuple
+
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+
+# Multipart boundaries and part headers around the file
+MULTIPART_OVERHEAD = 64 * 1024
+
+TOO_LARGE = "Request body too large"
+
+
+def default_limits() -> Dict[Tuple[str, str], int]:
+    """(method, path) -> maximum body bytes"""
+    return {
+        ("POST", "/api/auth/profile-picture"): settings.upload_max_bytes + MULTIPART_OVERHEAD,
+    }
+
+
+class BodySizeLimitMiddleware:
+    """ASGI middleware enforcing per-route body size limits"""
+
+    def __init__(self, app, limits: Optional[Dict[Tuple[str, str], int]] = None):
+        self.app = app
+        self.limits = limits if limits is not None else default_limits()
+
+    async def __call__(self, scope, receive, send):
+        limit = self.limits.get((scope.get("method"), scope.get("path"))) if scope["type"] == "http" else None
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                if value.isdigit() and int(value) > limit:
+                    await self._reject(send)
+                    return
+                break
+
+        received = 0
+
+        async def receive_bounded():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    # Raised into the body parser; FastAPI passes HTTPExceptions through
+                    raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=TOO_LARGE)
+            return message
+
+        await self.app(scope, receive_bounded, send)
+
+    async def _reject(self, send) -> None:
+        body = json.dumps({"detail": TOO_LARGE}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"connection", b"close"),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,176 @@
+"""
+Caching utilities
+File: backend/app/core/cache.py
+
+Small thread-safe TTL + LRU cache used for per-process hot data
+(ranked feed candidates, serialized pages, probe results), plus byte-cache
+backends that can be shared between processes through Redis.
+"""
+
+import time
+import weakref
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Hashable, List, Optional
+
+_MISSING = object()
+
+# Every live TTLCache, for hit-rate metrics
+_instances: "weakref.WeakSet[TTLCache]" = weakref.WeakSet()
+
+
+class TTLCache:
+    """Bounded mapping whose entries expire after ttl_seconds"""
+
+    def __init__(self, name: str, ttl_seconds: float, max_entries: int = 1024):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        _instances.add(self)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value, or default if missing or expired"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entry when full"""
+        expires_at = time.monotonic() + (self.ttl_seconds if ttl_seconds is None else ttl_seconds)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Return the cached value or compute, store and return it"""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = factory()
+            self.set(key, value)
+        return value
+
+    def delete(self, key: Hashable) -> None:
+        """Drop a single entry"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def all_caches() -> List[TTLCache]:
+    """Live TTLCache instances (several may share a name)"""
+    return list(_instances)
+
+
+class ByteCacheBackend(ABC):
+    """Interface for caches holding serialized values and generation counters"""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        ...
+
+    @abstractmethod
+    def get_counter(self, key: str) -> int:
+        ...
+
+    @abstractmethod
+    def incr(self, key: str) -> int:
+        ...
+
+
+class LocalByteCache(ByteCacheBackend):
+    """Process-local backend (state is per worker)"""
+
+    def __init__(self, name: str, max_entries: int = 256):
+        self._values = TTLCache(name, ttl_seconds=0, max_entries=max_entries)
+        self._counters: dict = {}
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._values.get(key)
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        self._values.set(key, value, ttl_seconds=ttl_seconds)
+
+    def get_counter(self, key: str) -> int:
+        return self._counters.get(key, 0)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+
+class RedisByteCache(ByteCacheBackend):
+    """Backend shared by every process pointing at the same Redis"""
+
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+        self._client = get_redis_client()
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._client.get(self.prefix + key)
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        self._client.set(self.prefix + key, value, px=max(int(ttl_seconds * 1000), 1))
+
+    def get_counter(self, key: str) -> int:
+        value = self._client.get(self.prefix + key)
+        return int(value) if value is not None else 0
+
+    def incr(self, key: str) -> int:
+        return int(self._client.incr(self.prefix + key))
+
+
+_redis_client = None
+
+
+def get_redis_client():
+    """
+    Lazily create the shared Redis client from settings.redis_url
+
+    Raises:
+        RuntimeError: If the redis package is not installed
+    """
+    global _redis_client
+    if _redis_client is None:
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("A redis backend is configured but the redis package is not installed")
+
+        from app.core.config import settings
+        _redis_client = redis.Redis.from_url(settings.redis_url)
+    return _redis_client
+
+
+def make_byte_cache(name: str, backend: str) -> ByteCacheBackend:
+    """Build the byte cache for the configured backend ("local" or "redis")"""
+    if backend == "redis":
+        return RedisByteCache(prefix=f"{name}:")
+    return LocalByteCache(name)
@@ -0,0 +1,73 @@
+"""
+Circuit breaker
+File: backend/app/core/circuit_breaker.py
+
+Stops calling a failing dependency for a while instead of making every
+request wait for it to time out.
+
+closed:     calls go through; failure_threshold consecutive failures open it
+open:       calls are refused until reset_timeout seconds have passed
+half_open:  one trial call is let through; success closes the breaker,
+            failure opens it again
+"""
+
+import time
+from threading import Lock
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker (thread-safe)"""
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_running = False
+        self._state = CLOSED
+        self._lock = Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                return HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """Whether a call may be made now (claims the trial call when half open)"""
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self._state = HALF_OPEN
+                self._trial_running = False
+            if self._trial_running:
+                return False
+            self._trial_running = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != CLOSED:
+                print(f"✅ Circuit '{self.name}' closed")
+            self._state = CLOSED
+            self._failures = 0
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_running = False
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    print(f"⚠️  Circuit '{self.name}' opened after {self._failures} failure(s)")
+                self._state = OPEN
+                self._opened_at = time.monotonic()
@@ -16,14 +16,21 @@ class Settings(BaseSettings):
     app_name: str = "AgenticSocialMedia"
     app_env: str = "development"
     debug: bool = True
+    web_concurrency: int = 1  # worker processes (gunicorn -c gunicorn.conf.py reads the same variable)
+    leader_check_interval_seconds: int = 15  # background jobs run in the elected leader worker only
     secret_key: str
 
     # Database
     database_url: str
     database_echo: bool = False
+    database_replica_urls: str = ""  # comma-separated read replicas for read-only endpoints
+    replica_max_lag_seconds: float = 5.0  # staler replicas are skipped
+    replica_lag_check_seconds: float = 5.0
+    read_your_writes_seconds: int = 10  # a user's reads stay on the primary this long after they write
 
     # Redis
     redis_url: str = "redis://localhost:6379/0"
+    cache_backend: str = "local"  # local | redis (shared between instances)
 
     # OpenAI
     openai_api_key: str = ""
@@ -36,6 +43,8 @@ class Settings(BaseSettings):
     # Groq LLM
     groq_api_key: str = ""
     groq_model: str = "llama-3.1-70b-versatile"
+    llm_breaker_failure_threshold: int = 5  # consecutive API errors before the circuit opens
+    llm_breaker_reset_seconds: int = 30
     use_mock_ai: bool = False
 
     # Google OAuth
@@ -55,14 +64,96 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
     jwt_expiration_minutes: int = 60
 
+    # API rate limiting ("<requests>/<second|minute|hour|day>" per user, or per IP when anonymous)
+    rate_limit_enabled: bool = True
+    rate_limit_backend: str = "memory"  # memory | redis
+    rate_limit_trust_proxy: bool = False  # key anonymous callers by Fly-Client-IP / X-Forwarded-For
+    rate_limit_llm: str = "5/minute"
+    rate_limit_auth: str = "10/minute"
+    rate_limit_write: str = "60/minute"
+    rate_limit_read: str = "300/minute"
+
+    # Metrics (/metrics, Prometheus text format)
+    metrics_enabled: bool = True
+    metrics_token: str = ""  # when set, scrapes must send "Authorization: Bearer <token>" (Fly's scraper can't)
+
+    # SQL profiling (debug): Server-Timing, N+1 detection, slow request reports
+    sql_profiling_enabled: bool = False
+    sql_slow_request_ms: int = 500
+    sql_n_plus_one_threshold: int = 5  # same SELECT shape this many times in one request
+    sql_profile_dir: str = "profiles"
+
+    # Health probes
+    health_cache_seconds: float = 5.0  # probe results are reused this long
+    health_check_timeout_seconds: float = 2.0
+    health_pool_saturation_limit: float = 0.9  # not ready above this share of connections in use
+
     # Agent Configuration
     agent_max_actions_per_day: int = 10
+    quota_backend: str = "database"  # database | redis | local
+    quota_timezone: str = "UTC"  # default day boundary (agents can set preferences["timezone"])
     agent_cache_ttl_seconds: int = 3600
 
+    # Ranked feed
+    feed_rank_cache_ttl_seconds: int = 60
+    feed_candidate_window_hours: int = 72
+    feed_network_candidates: int = 300
+    feed_trending_window_hours: int = 48
+    feed_trending_candidates: int = 100
+
+    # Global feed cache
+    global_feed_cache_ttl_seconds: int = 15
+    global_feed_cache_depth: int = 100
+
+    # Realtime push
+    realtime_broker: str = "local"  # local | redis (fan out between instances)
+    realtime_queue_size: int = 100
+    realtime_heartbeat_seconds: int = 25
+
+    # Outbox event dispatcher
+    outbox_poll_interval_seconds: float = 1.0
+    outbox_batch_size: int = 100
+    outbox_max_attempts: int = 10
+    outbox_retention_hours: int = 24
+
+    # Like membership cache (per-post bitmaps of who liked it)
+    like_index_enabled: bool = True
+    like_index_ttl_seconds: int = 300
+    like_index_max_targets: int = 5000
+
+    # Agent action log (monthly partitions on PostgreSQL)
+    action_log_partitions_ahead: int = 2
+    action_log_retention_months: int = 12
+    action_log_archive_dir: str = "archives"
+    action_log_maintenance_interval_hours: int = 24
+
     # Supabase
     supabase_url: str = ""
     supabase_service_key: str = ""
 
+    # Media storage
+    storage_backend: str = "supabase"  # supabase | local (content-addressed files under media_root)
+    media_root: str = "uploads"
+    media_url: str = "/uploads"  # public URL prefix of media_root (the app serves it; can be a CDN)
+    avatar_thumbnail_sizes: str = "64,256"  # square WebP sizes; profile pictures link the largest
+    upload_max_bytes: int = 5 * 1024 * 1024
+    storage_timeout_seconds: float = 30.0  # Supabase Storage requests
+
+    @property
+    def is_production(self) -> bool:
+        """Production skips schema setup at startup (run `python -m app.manage migrate` instead)"""
+        return self.app_env.lower() == "production"
+
+    @property
+    def database_replica_urls_list(self) -> List[str]:
+        """Convert replica URLs string to list"""
+        return [url.strip() for url in self.database_replica_urls.split(",") if url.strip()]
+
+    @property
+    def avatar_thumbnail_sizes_list(self) -> List[int]:
+        """Convert thumbnail sizes string to list"""
+        return [int(size) for size in self.avatar_thumbnail_sizes.split(",") if size.strip()]
+
     @property
     def cors_origins_list(self) -> List[str]:
         """Convert CORS origins string to list"""
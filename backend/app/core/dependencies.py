@@ -18,6 +18,36 @@ from app.models.user import User
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
 
+def get_user_from_token(token: str, db: Session) -> Optional[User]:
+    """
+    Resolve the user a JWT token belongs to
+
+    Args:
+        token: JWT access token
+        db: Database session
+
+    Returns:
+        User object, or None if the token is invalid or the user is gone
+    """
+    # Decode token
+    payload = decode_access_token(token)
+    if payload is None:
+        return None
+
+    # Extract user ID from token (convert from string to int)
+    user_id_str: Optional[str] = payload.get("sub")
+    if user_id_str is None:
+        return None
+
+    try:
+        user_id = int(user_id_str)
+    except (ValueError, TypeError):
+        return None
+
+    # Fetch user from database
+    return db.query(User).filter(User.id == user_id).first()
+
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
@@ -41,26 +71,12 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    # Decode token
-    payload = decode_access_token(token)
-    if payload is None:
-        raise credentials_exception
-
-    # Extract user ID from token (convert from string to int)
-    user_id_str: Optional[str] = payload.get("sub")
-    if user_id_str is None:
-        raise credentials_exception
-
-    try:
-        user_id = int(user_id_str)
-    except (ValueError, TypeError):
-        raise credentials_exception
-
-    # Fetch user from database
-    user = db.query(User).filter(User.id == user_id).first()
+    user = get_user_from_token(token, db)
     if user is None:
         raise credentials_exception
 
+    # Commits in this request send the user's next reads to the primary (app.database.replicas)
+    db.info["user_id"] = user.id
     return user
 
 
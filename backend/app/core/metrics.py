@@ -0,0 +1,369 @@
+"""
+Metrics
+File: backend/app/core/metrics.py
+
+Minimal Prometheus instrumentation: counters, gauges and histograms kept in
+process memory and rendered in the Prometheus text exposition format at
+/metrics.
+
+What is recorded:
+- per-route request count, latency and in-flight requests (MetricsMiddleware),
+- SQL statements per request and the time they took (engine event hooks
+  installed by instrument_engine() from init_db_engine),
+- LLM call latency and token usage (AIService),
+- hit/miss counts of every TTLCache (collected at scrape time).
+
+Values are per process; with several workers each one is scraped (or
+summed) separately.
+"""
+
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from threading import Lock
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.cache import all_caches
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 250)
+
+# (name, type, help, [(labels, value)])
+MetricFamily = Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Registry:
+    """Holds metrics and scrape-time collectors, renders the exposition text"""
+
+    def __init__(self):
+        self._metrics: List["_Metric"] = []
+        self._collectors: List[Callable[[], Iterable[MetricFamily]]] = []
+
+    def register(self, metric: "_Metric") -> None:
+        self._metrics.append(metric)
+
+    def add_collector(self, collector: Callable[[], Iterable[MetricFamily]]) -> None:
+        """Register a function producing metric families when scraped"""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            for name, kind, documentation, samples in collector():
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in samples:
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+
+class _Child:
+    """A metric bound to one set of label values"""
+
+    def __init__(self, metric: "_Metric", key: Tuple[str, ...]):
+        self._metric = metric
+        self._key = key
+
+    def inc(self, amount: float = 1) -> None:
+        self._metric._inc(self._key, amount)
+
+    def dec(self, amount: float = 1) -> None:
+        self._metric._inc(self._key, -amount)
+
+    def set(self, value: float) -> None:
+        self._metric._set(self._key, value)
+
+    def observe(self, value: float) -> None:
+        self._metric._observe(self._key, value)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], object] = {}
+        self._lock = Lock()
+        registry.register(self)
+
+    def labels(self, *values) -> _Child:
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        return _Child(self, tuple(str(value) for value in values))
+
+    # Unlabelled shortcuts
+    def inc(self, amount: float = 1) -> None:
+        self._inc((), amount)
+
+    def dec(self, amount: float = 1) -> None:
+        self._inc((), -amount)
+
+    def set(self, value: float) -> None:
+        self._set((), value)
+
+    def observe(self, value: float) -> None:
+        self._observe((), value)
+
+    def _inc(self, key, amount):
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def _set(self, key, value):
+        with self._lock:
+            self._values[key] = value
+
+    def _observe(self, key, value):
+        raise TypeError(f"{self.name} is a {self.kind}")
+
+    def _label_dict(self, key) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            lines.append(f"{self.name}{_format_labels(self._label_dict(key))} {_format_value(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _set(self, key, value):
+        raise TypeError(f"{self.name} is a counter")
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+
+    def _inc(self, key, amount):
+        raise TypeError(f"{self.name} is a histogram")
+
+    _set = _inc
+
+    def _observe(self, key, value):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # [per-bucket counts, sum, count]
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = [(key, (list(state[0]), state[1], state[2])) for key, state in self._values.items()]
+        for key, (counts, total, count) in items:
+            labels = self._label_dict(key)
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                bucket_labels = {**labels, "le": _format_value(bound)}
+                lines.append(f"{self.name}_bucket{_format_labels(bucket_labels)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {count}")
+        return lines
+
+
+# HTTP
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "HTTP requests by route template and status", ("method", "route", "status")
+)
+HTTP_LATENCY = Histogram(
+    "http_request_duration_seconds", "HTTP request latency", ("method", "route")
+)
+HTTP_IN_FLIGHT = Gauge("http_requests_in_flight", "HTTP requests currently being served")
+HTTP_DB_QUERIES = Histogram(
+    "http_request_db_queries", "SQL statements executed per HTTP request", ("route",), QUERY_COUNT_BUCKETS
+)
+HTTP_DB_TIME = Histogram(
+    "http_request_db_seconds", "Time spent in SQL per HTTP request", ("route",)
+)
+
+# Database
+DB_QUERY_LATENCY = Histogram(
+    "db_query_duration_seconds", "SQL statement latency by statement type", ("statement",)
+)
+
+# LLM
+LLM_LATENCY = Histogram(
+    "llm_request_duration_seconds", "LLM API call latency", ("operation", "outcome")
+)
+LLM_TOKENS = Counter("llm_tokens_total", "LLM tokens used", ("operation", "kind"))
+LLM_FALLBACKS = Counter(
+    "llm_fallbacks_total", "LLM calls answered by the mock fallback after an API error", ("operation",)
+)
+
+
+def _collect_caches() -> Iterable[MetricFamily]:
+    totals: Dict[str, List[int]] = {}
+    for cache in all_caches():
+        values = totals.setdefault(cache.name, [0, 0, 0])
+        values[0] += cache.hits
+        values[1] += cache.misses
+        values[2] += len(cache)
+
+    yield ("cache_hits_total", "counter", "In-process cache hits",
+           [({"cache": name}, values[0]) for name, values in totals.items()])
+    yield ("cache_misses_total", "counter", "In-process cache misses",
+           [({"cache": name}, values[1]) for name, values in totals.items()])
+    yield ("cache_entries", "gauge", "Entries currently held by in-process caches",
+           [({"cache": name}, values[2]) for name, values in totals.items()])
+    yield ("cache_hit_ratio", "gauge", "Hit ratio of in-process caches since start",
+           [({"cache": name}, values[0] / (values[0] + values[1]))
+            for name, values in totals.items() if values[0] + values[1]])
+
+
+registry.add_collector(_collect_caches)
+
+
+class RequestStats:
+    """SQL work done on behalf of the current request"""
+
+    __slots__ = ("queries", "db_seconds", "profile")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.profile = None  # per-statement breakdown when SQL profiling is on
+
+
+# Set by MetricsMiddleware; shared with the threadpool workers running sync endpoints
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def current_request_stats() -> Optional[RequestStats]:
+    return _request_stats.get()
+
+
+def begin_request_stats() -> Tuple[RequestStats, object]:
+    """Start collecting SQL stats for the current request; returns (stats, token)"""
+    stats = RequestStats()
+    return stats, _request_stats.set(stats)
+
+
+def end_request_stats(token) -> None:
+    _request_stats.reset(token)
+
+
+def _statement_type(statement: str) -> str:
+    verb = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    return verb if verb in ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH") else "OTHER"
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Time every SQL statement run through engine"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.get("query_started")
+        if not started:
+            return
+        elapsed = time.perf_counter() - started.pop()
+        DB_QUERY_LATENCY.labels(_statement_type(statement)).observe(elapsed)
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.db_seconds += elapsed
+            if stats.profile is not None:
+                stats.profile.record(statement, elapsed)
+
+    @event.listens_for(engine, "handle_error")
+    def _error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_started"):
+            conn.info["query_started"].pop()
+
+
+def route_template(scope) -> str:
+    """Route path with parameters unexpanded, keeping label cardinality bounded"""
+    route = scope.get("route")
+    template = getattr(route, "path_format", None) or getattr(route, "path", None)
+    if template:
+        return template
+    if scope.get("path", "").startswith("/uploads/"):
+        return "/uploads/{path}"
+    return "unmatched"
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording latency, status and SQL work per route"""
+
+    def __init__(self, app, exclude: Sequence[str] = ("/metrics",)):
+        self.app = app
+        self.exclude = frozenset(exclude)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.exclude:
+            await self.app(scope, receive, send)
+            return
+
+        stats, token = begin_request_stats()
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            HTTP_IN_FLIGHT.dec()
+            end_request_stats(token)
+
+            route = route_template(scope)
+            method = scope["method"]
+            HTTP_REQUESTS.labels(method, route, status_code).inc()
+            HTTP_LATENCY.labels(method, route).observe(elapsed)
+            HTTP_DB_QUERIES.labels(route).observe(stats.queries)
+            HTTP_DB_TIME.labels(route).observe(stats.db_seconds)
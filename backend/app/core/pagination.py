@@ -0,0 +1,50 @@
+"""
+Cursor pagination helpers
+File: backend/app/core/pagination.py
+
+Opaque cursors for keyset pagination. A cursor is the sort key of the last
+row on the previous page, JSON-encoded and base64url'd so clients treat it
+as an opaque token.
+"""
+
+import base64
+import json
+from typing import Any, List, Optional
+
+from fastapi import HTTPException, status
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """Encode the sort key of the last row into an opaque cursor"""
+    raw = json.dumps(values, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], size: int) -> Optional[List[Any]]:
+    """
+    Decode a cursor produced by encode_cursor
+
+    Args:
+        cursor: Cursor string from the client (or None for the first page)
+        size: Expected number of values in the sort key
+
+    Returns:
+        List of sort key values, or None if no cursor was given
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        values = None
+
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+    return values
@@ -0,0 +1,172 @@
+"""
+SQL profiling
+File: backend/app/core/profiling.py
+
+Debug/profiling mode (SQL_PROFILING_ENABLED=true) that breaks each
+request's SQL down by statement fingerprint, using the per-statement
+timings from the engine hooks in app/core/metrics.py.
+
+For every profiled request:
+- a Server-Timing header reports DB time, statement count and total time
+  (visible in the browser's network panel),
+- statement shapes executed SQL_N_PLUS_ONE_THRESHOLD or more times are
+  flagged as likely N+1 loops (logged and listed in X-SQL-Repeated),
+- requests slower than SQL_SLOW_REQUEST_MS, or with an N+1 flag, are
+  appended as JSON lines to <SQL_PROFILE_DIR>/slow_requests_YYYY-MM-DD.jsonl
+  with every fingerprint's count and time.
+"""
+
+import asyncio
+import json
+import re
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+from app.core.config import settings
+from app.core.metrics import begin_request_stats, current_request_stats, end_request_stats, route_template
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_NAMED_PARAM = re.compile(r"%\(\w+\)s|(?<![:\w]):\w+|\$\d+|%s|\?")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+# Longest statement sample kept in a report
+_SAMPLE_CHARS = 500
+
+
+def fingerprint(statement: str) -> str:
+    """
+    Statement shape with literals and parameters replaced by ?
+
+    "SELECT * FROM users WHERE id IN (1, 2, 3)" and the same query with
+    other ids share a fingerprint.
+    """
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _NAMED_PARAM.sub("?", shape)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _VALUE_LIST.sub("(...)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+class RequestProfile:
+    """Per-fingerprint statement counts and time for one request"""
+
+    def __init__(self):
+        # fingerprint -> [count, seconds, first statement]
+        self.statements: Dict[str, list] = {}
+
+    def record(self, statement: str, seconds: float) -> None:
+        key = fingerprint(statement)
+        entry = self.statements.get(key)
+        if entry is None:
+            self.statements[key] = [1, seconds, statement]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+
+    def repeated(self, threshold: int) -> List[dict]:
+        """Statement shapes run at least threshold times (likely N+1 loops)"""
+        return [
+            self._describe(key, entry)
+            for key, entry in self.statements.items()
+            if entry[0] >= threshold and key.upper().startswith(("SELECT", "WITH"))
+        ]
+
+    def report(self) -> List[dict]:
+        """Every statement shape, most expensive first"""
+        entries = sorted(self.statements.items(), key=lambda item: item[1][1], reverse=True)
+        return [self._describe(key, entry) for key, entry in entries]
+
+    def _describe(self, key: str, entry: list) -> dict:
+        count, seconds, sample = entry
+        return {
+            "fingerprint": key,
+            "count": count,
+            "total_ms": round(seconds * 1000, 3),
+            "sample": sample[:_SAMPLE_CHARS],
+        }
+
+
+class ProfilingMiddleware:
+    """ASGI middleware adding Server-Timing and writing slow-request reports"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Share the metrics middleware's stats when it runs, else collect our own
+        stats = current_request_stats()
+        token = None
+        if stats is None:
+            stats, token = begin_request_stats()
+        stats.profile = profile = RequestProfile()
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                timing = (
+                    f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.queries} queries", '
+                    f"app;dur={elapsed_ms:.1f}"
+                )
+                headers = list(message.get("headers", [])) + [(b"server-timing", timing.encode())]
+                repeated = profile.repeated(settings.sql_n_plus_one_threshold)
+                if repeated:
+                    headers.append((b"x-sql-repeated", str(len(repeated)).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            if token is not None:
+                end_request_stats(token)
+            stats.profile = None
+            await self._finish(scope, status_code, (time.perf_counter() - started) * 1000, stats, profile)
+
+    async def _finish(self, scope, status_code: int, elapsed_ms: float, stats, profile: RequestProfile) -> None:
+        route = route_template(scope)
+        repeated = profile.repeated(settings.sql_n_plus_one_threshold)
+        for entry in repeated:
+            print(
+                f"⚠️  Possible N+1 on {scope['method']} {route}: "
+                f"{entry['count']}x {entry['fingerprint'][:120]}"
+            )
+
+        if elapsed_ms < settings.sql_slow_request_ms and not repeated:
+            return
+
+        report = {
+            "at": datetime.utcnow().isoformat() + "Z",
+            "method": scope["method"],
+            "path": scope["path"],
+            "route": route,
+            "status": status_code,
+            "duration_ms": round(elapsed_ms, 3),
+            "db_ms": round(stats.db_seconds * 1000, 3),
+            "queries": stats.queries,
+            "repeated": [entry["fingerprint"] for entry in repeated],
+            "statements": profile.report(),
+        }
+        try:
+            await asyncio.to_thread(_append_report, report)
+        except OSError as e:
+            print(f"⚠️  Could not write slow request report: {e}")
+
+
+def _append_report(report: dict) -> None:
+    directory = Path(settings.sql_profile_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"slow_requests_{datetime.utcnow():%Y-%m-%d}.jsonl"
+    with open(path, "a", encoding="utf-8") as reports:
+        reports.write(json.dumps(report, default=str) + "\n")
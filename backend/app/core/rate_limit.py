@@ -0,0 +1,236 @@
+"""
+API rate limiting
+File: backend/app/core/rate_limit.py
+
+ASGI middleware enforcing per-route request budgets with GCRA (the generic
+cell rate algorithm, a sliding-window-equivalent token bucket that stores
+one timestamp per key).
+
+Each request is matched to the first rule whose method/path fits (tight
+budgets for LLM and auth routes, looser ones for writes and reads) and is
+counted against the caller: the JWT subject when a valid bearer token is
+sent, the client IP otherwise. Responses carry RateLimit-Limit,
+RateLimit-Remaining, RateLimit-Reset and RateLimit-Policy headers; denied
+requests get 429 with Retry-After.
+
+State lives in process memory by default, or in Redis
+(RATE_LIMIT_BACKEND=redis) so every instance shares one budget. If the
+shared backend is unreachable requests are let through.
+"""
+
+import json
+import math
+import time
+from abc import ABC, abstractmethod
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.security import decode_access_token
+
+_PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+# GCRA in one round trip, using Redis' clock so instances agree on "now"
+_REDIS_GCRA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local interval = math.ceil(tonumber(ARGV[1]))
+local burst = math.ceil(tonumber(ARGV[2]))
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then tat = now end
+local new_tat = tat + interval
+local allow_at = new_tat - burst
+if now < allow_at then
+    return {0, 0, allow_at - now, tat - now}
+end
+-- PX only takes whole milliseconds
+redis.call('SET', KEYS[1], new_tat, 'PX', math.ceil(new_tat - now))
+return {1, math.floor((now - allow_at) / interval), 0, new_tat - now}
+"""
+
+
+def parse_rate(rate: str) -> Tuple[int, int]:
+    """
+    Parse "10/minute" style budgets
+
+    Returns:
+        (requests, period in seconds)
+    """
+    count, _, unit = rate.partition("/")
+    unit = unit.strip().rstrip("s")
+    if unit not in _PERIODS:
+        raise ValueError(f"Invalid rate limit: {rate!r}")
+    return int(count), _PERIODS[unit]
+
+
+class RateLimitRule(NamedTuple):
+    """A budget for the requests matching methods and path_prefix"""
+    name: str
+    limit: int
+    period: int  # seconds
+    path_prefix: str
+    methods: Optional[frozenset] = None  # None matches every method
+    by_ip: bool = False  # always key by IP (e.g. login, where there is no user yet)
+
+    def matches(self, method: str, path: str) -> bool:
+        return path.startswith(self.path_prefix) and (self.methods is None or method in self.methods)
+
+
+class RateLimitResult(NamedTuple):
+    """Outcome of counting one request"""
+    allowed: bool
+    remaining: int
+    retry_after_ms: int
+    reset_ms: int  # until the budget is fully restored
+
+
+class RateLimitStore(ABC):
+    """Interface for GCRA state backends"""
+
+    @abstractmethod
+    async def hit(self, key: str, interval_ms: int, burst_ms: int) -> RateLimitResult:
+        ...
+
+
+class MemoryRateLimitStore(RateLimitStore):
+    """Process-local state (budgets are per worker)"""
+
+    def __init__(self, max_keys: int = 100_000):
+        self._tats = TTLCache("rate_limit", ttl_seconds=0, max_entries=max_keys)
+
+    async def hit(self, key: str, interval_ms: int, burst_ms: int) -> RateLimitResult:
+        # No await between read and write: atomic on the event loop
+        now = time.monotonic() * 1000
+        tat = max(self._tats.get(key, now), now)
+        new_tat = tat + interval_ms
+        allow_at = new_tat - burst_ms
+        if now < allow_at:
+            return RateLimitResult(False, 0, math.ceil(allow_at - now), math.ceil(tat - now))
+        self._tats.set(key, new_tat, ttl_seconds=(new_tat - now) / 1000)
+        return RateLimitResult(True, int((now - allow_at) // interval_ms), 0, math.ceil(new_tat - now))
+
+
+class RedisRateLimitStore(RateLimitStore):
+    """State shared by every instance through Redis"""
+
+    def __init__(self, prefix: str = "ratelimit:"):
+        try:
+            import redis.asyncio as aioredis
+        except ImportError:
+            raise RuntimeError("RATE_LIMIT_BACKEND=redis but the redis package is not installed")
+        self.prefix = prefix
+        self._client = aioredis.Redis.from_url(settings.redis_url)
+        self._script = self._client.register_script(_REDIS_GCRA)
+
+    async def hit(self, key: str, interval_ms: int, burst_ms: int) -> RateLimitResult:
+        allowed, remaining, retry_after, reset = await self._script(
+            keys=[self.prefix + key], args=[interval_ms, burst_ms]
+        )
+        return RateLimitResult(bool(allowed), int(remaining), int(retry_after), int(reset))
+
+
+def make_rate_limit_store(backend: str) -> RateLimitStore:
+    """Build the store for the configured backend ("memory" or "redis")"""
+    if backend == "redis":
+        return RedisRateLimitStore()
+    return MemoryRateLimitStore()
+
+
+def default_rules() -> List[RateLimitRule]:
+    """Budgets from settings, most specific first"""
+    writes = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+    return [
+        RateLimitRule("llm", *parse_rate(settings.rate_limit_llm),
+                      path_prefix="/api/agents/me/generate-content", methods=frozenset({"POST"})),
+        RateLimitRule("auth", *parse_rate(settings.rate_limit_auth),
+                      path_prefix="/api/auth/", methods=frozenset({"POST"}), by_ip=True),
+        RateLimitRule("write", *parse_rate(settings.rate_limit_write), path_prefix="/api/", methods=writes),
+        RateLimitRule("read", *parse_rate(settings.rate_limit_read), path_prefix="/api/"),
+    ]
+
+
+class RateLimitMiddleware:
+    """ASGI middleware applying the first matching rule to each HTTP request"""
+
+    def __init__(self, app, rules: Optional[Iterable[RateLimitRule]] = None, store: Optional[RateLimitStore] = None):
+        self.app = app
+        self.rules = list(rules) if rules is not None else default_rules()
+        self._store = store
+
+    @property
+    def store(self) -> RateLimitStore:
+        if self._store is None:
+            self._store = make_rate_limit_store(settings.rate_limit_backend)
+        return self._store
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        rule = self._match(scope["method"], scope["path"])
+        if rule is None:
+            await self.app(scope, receive, send)
+            return
+
+        key = f"{rule.name}:{self._client_key(scope, rule)}"
+        # Whole milliseconds (Redis PX rejects fractions, e.g. 7/minute)
+        interval_ms = math.ceil(rule.period * 1000 / rule.limit)
+        try:
+            result = await self.store.hit(key, interval_ms, rule.period * 1000)
+        except Exception as e:
+            print(f"⚠️  Rate limiter unavailable, allowing request: {e}")
+            await self.app(scope, receive, send)
+            return
+
+        headers = [
+            (b"ratelimit-limit", str(rule.limit).encode()),
+            (b"ratelimit-remaining", str(result.remaining).encode()),
+            (b"ratelimit-reset", str(math.ceil(result.reset_ms / 1000)).encode()),
+            (b"ratelimit-policy", f"{rule.limit};w={rule.period}".encode()),
+        ]
+
+        if not result.allowed:
+            body = json.dumps({"detail": "Rate limit exceeded, please slow down"}).encode()
+            await send({
+                "type": "http.response.start",
+                "status": 429,
+                "headers": headers + [
+                    (b"retry-after", str(math.ceil(result.retry_after_ms / 1000)).encode()),
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                message = {**message, "headers": list(message.get("headers", [])) + headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+    def _match(self, method: str, path: str) -> Optional[RateLimitRule]:
+        for rule in self.rules:
+            if rule.matches(method, path):
+                return rule
+        return None
+
+    def _client_key(self, scope, rule: RateLimitRule) -> str:
+        headers = dict(scope.get("headers") or [])
+        if not rule.by_ip:
+            authorization = headers.get(b"authorization", b"").decode("latin-1")
+            if authorization.lower().startswith("bearer "):
+                payload = decode_access_token(authorization[7:].strip())
+                if payload and payload.get("sub"):
+                    return f"user:{payload['sub']}"
+        return f"ip:{self._client_ip(scope, headers)}"
+
+    def _client_ip(self, scope, headers: dict) -> str:
+        if settings.rate_limit_trust_proxy:
+            forwarded = headers.get(b"fly-client-ip") or headers.get(b"x-forwarded-for", b"").split(b",")[0]
+            if forwarded.strip():
+                return forwarded.strip().decode("latin-1")
+        client = scope.get("client")
+        return client[0] if client else "unknown"
@@ -5,10 +5,13 @@ File: backend/app/database/connection.py
 Handles SQLAlchemy engine, session creation, and database initialization.
 """
 
+from fastapi import Request
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from typing import Generator, List, Sequence
+
+from app.core.metrics import instrument_engine
 
 # Base class for models - must be defined before importing models
 Base = declarative_base()
@@ -17,23 +20,49 @@ Base = declarative_base()
 engine = None
 SessionLocal = None
 
+# Read replicas (see app.database.replicas), empty without DATABASE_REPLICA_URLS
+replica_engines: List = []
+replica_sessions: List = []
+
 
-def init_db_engine(database_url: str, echo: bool = False):
-    """Initialize database engine and session factory"""
-    global engine, SessionLocal
+def init_db_engine(database_url: str, echo: bool = False, replica_urls: Sequence[str] = ()):
+    """Initialize database engine and session factory, plus one per read replica"""
+    global engine, SessionLocal, replica_engines, replica_sessions
 
     engine = create_engine(database_url, echo=echo)
+    instrument_engine(engine)
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+    replica_engines = []
+    replica_sessions = []
+    if replica_urls:
+        from app.database import replicas  # noqa: F401  (registers the read-your-writes hooks)
+    for url in replica_urls:
+        replica = create_engine(url, echo=echo, pool_pre_ping=True)
+        instrument_engine(replica)
+        replica_engines.append(replica)
+        replica_sessions.append(
+            sessionmaker(autocommit=False, autoflush=False, bind=replica, info={"replica": True})
+        )
+
+
+def load_models():
+    """Import all models so they're registered with Base.metadata and the mappers resolve"""
+    from app.models import user, agent, post, agent_action, connection, interaction, notification, outbox_event, like, user_stats  # noqa: F401
+
 
 def init_db():
     """Initialize database tables - creates all tables defined in models"""
-    # Import all models to ensure they're registered with Base.metadata
-    from app.models import user, agent, post, agent_action, connection, interaction
+    load_models()
+
+    from app.database.migrations import run_migrations
 
     # Create all tables
     Base.metadata.create_all(bind=engine)
 
+    # Bring existing tables up to date
+    run_migrations(engine)
+
 
 def get_db() -> Generator[Session, None, None]:
     """
@@ -49,3 +78,45 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+def get_read_db(request: Request) -> Generator[Session, None, None]:
+    """
+    Get a session for a read-only endpoint
+
+    Served by a read replica when one is configured and caught up, unless
+    the requesting user wrote something in the last few seconds. Never
+    write through this session.
+
+    Usage in FastAPI:
+        @app.get("/endpoint")
+        def endpoint(db: Session = Depends(get_read_db)):
+            ...
+    """
+    from app.database.replicas import replica_router
+
+    user_id = None
+    if replica_sessions:
+        user_id = _bearer_user_id(request)
+    db = replica_router.session(user_id)
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def _bearer_user_id(request: Request):
+    """User id from the request's access token, without touching the database"""
+    from app.core.security import decode_access_token
+
+    authorization = request.headers.get("authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    payload = decode_access_token(token)
+    if not payload or payload.get("sub") is None:
+        return None
+    try:
+        return int(payload["sub"])
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,403 @@
+"""
+Schema migrations
+File: backend/app/database/migrations.py
+
+Lightweight, idempotent migrations applied after Base.metadata.create_all.
+
+create_all only creates missing tables and never alters existing ones, so
+schema changes to existing tables (new columns, indexes, backfills) live here.
+Each migration runs once in its own transaction and is recorded in the
+schema_migrations table.
+"""
+
+from datetime import datetime
+from typing import Callable, List, Set, Tuple
+from sqlalchemy import JSON, bindparam, inspect, text
+from sqlalchemy.engine import Connection as DBConnection, Engine
+
+from app.core.config import settings
+from app.database.partitions import add_months, ensure_monthly_partitions, is_partitioned
+from app.models.agent_action import ActionStatus, ActionType
+from app.models.connection import ConnectionStatus
+from app.models.interaction import PATH_SEGMENT_WIDTH
+from app.models.post import PostStatus, PostType
+from app.models.user_stats import RECENT_ACTIVITY_SIZE
+
+# Ordered list of (name, migration function)
+MIGRATIONS: List[Tuple[str, Callable[[DBConnection], None]]] = []
+
+
+def migration(name: str):
+    """Register a migration function under a unique, ordered name"""
+    def decorator(func: Callable[[DBConnection], None]):
+        MIGRATIONS.append((name, func))
+        return func
+    return decorator
+
+
+def run_migrations(engine: Engine) -> None:
+    """Apply all migrations that have not been recorded yet"""
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE IF NOT EXISTS schema_migrations ("
+            "name VARCHAR(255) PRIMARY KEY, "
+            "applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+        ))
+        applied = {row[0] for row in conn.execute(text("SELECT name FROM schema_migrations"))}
+
+    for name, func in MIGRATIONS:
+        if name in applied:
+            continue
+        with engine.begin() as conn:
+            func(conn)
+            conn.execute(
+                text("INSERT INTO schema_migrations (name) VALUES (:name)"),
+                {"name": name}
+            )
+        print(f"✅ Applied migration {name}")
+
+
+def _column_names(conn: DBConnection, table: str) -> Set[str]:
+    """Names of the columns currently on a table"""
+    return {column["name"] for column in inspect(conn).get_columns(table)}
+
+
+def _has_unique(conn: DBConnection, table: str, name: str) -> bool:
+    """Whether a unique constraint or unique index with this name exists"""
+    inspector = inspect(conn)
+    names = {uc["name"] for uc in inspector.get_unique_constraints(table)}
+    names.update(ix["name"] for ix in inspector.get_indexes(table) if ix.get("unique"))
+    return name in names
+
+
+@migration("0001_connection_canonical_pair")
+def _connection_canonical_pair(conn: DBConnection) -> None:
+    """Add and backfill the (min, max) user pair with a unique index"""
+    columns = _column_names(conn, "connections")
+    for column in ("user_low_id", "user_high_id"):
+        if column not in columns:
+            conn.execute(text(f"ALTER TABLE connections ADD COLUMN {column} INTEGER"))
+
+    conn.execute(text(
+        "UPDATE connections SET "
+        "user_low_id = CASE WHEN user_id < connected_user_id THEN user_id ELSE connected_user_id END, "
+        "user_high_id = CASE WHEN user_id < connected_user_id THEN connected_user_id ELSE user_id END "
+        "WHERE user_low_id IS NULL OR user_high_id IS NULL"
+    ))
+
+    # Reverse-direction duplicates must go before the unique index can exist.
+    # Keep accepted over pending over rejected, then the oldest row.
+    status_rank = {
+        ConnectionStatus.ACCEPTED.name: 0,
+        ConnectionStatus.PENDING.name: 1,
+        ConnectionStatus.REJECTED.name: 2,
+    }
+    rows = conn.execute(text(
+        "SELECT id, user_low_id, user_high_id, status FROM connections ORDER BY id"
+    )).all()
+
+    keep = {}
+    for row_id, low, high, row_status in rows:
+        rank = (status_rank.get(row_status, 3), row_id)
+        current = keep.get((low, high))
+        if current is None or rank < current:
+            keep[(low, high)] = rank
+
+    kept_ids = {row_id for _, row_id in keep.values()}
+    duplicate_ids = [row[0] for row in rows if row[0] not in kept_ids]
+    if duplicate_ids:
+        conn.execute(
+            text("DELETE FROM connections WHERE id IN :ids").bindparams(
+                bindparam("ids", expanding=True)
+            ),
+            {"ids": duplicate_ids}
+        )
+        print(f"⚠️  Removed {len(duplicate_ids)} duplicate connection rows")
+
+    if not _has_unique(conn, "connections", "uq_connections_pair"):
+        conn.execute(text(
+            "CREATE UNIQUE INDEX uq_connections_pair ON connections (user_low_id, user_high_id)"
+        ))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_connections_user_high_id ON connections (user_high_id)"
+    ))
+
+    if conn.dialect.name == "postgresql":
+        conn.execute(text(
+            "ALTER TABLE connections "
+            "ALTER COLUMN user_low_id SET NOT NULL, "
+            "ALTER COLUMN user_high_id SET NOT NULL"
+        ))
+
+
+@migration("0002_user_directory_indexes")
+def _user_directory_indexes(conn: DBConnection) -> None:
+    """Expression indexes for case-insensitive user directory search"""
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_users_full_name_lower ON users (lower(full_name), id)"
+    ))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_users_email_lower ON users (lower(email))"
+    ))
+
+
+@migration("0003_full_text_search")
+def _full_text_search(conn: DBConnection) -> None:
+    """Inverted indexes over post content and user name/bio"""
+    if conn.dialect.name == "postgresql":
+        # Generated columns keep the vectors in sync on every insert/update
+        conn.execute(text(
+            "ALTER TABLE posts ADD COLUMN IF NOT EXISTS search_vector tsvector "
+            "GENERATED ALWAYS AS (to_tsvector('english', coalesce(content, ''))) STORED"
+        ))
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_posts_search_vector ON posts USING GIN (search_vector) "
+            "WHERE is_deleted = false AND status = 'PUBLISHED'"
+        ))
+        conn.execute(text(
+            "ALTER TABLE users ADD COLUMN IF NOT EXISTS search_vector tsvector "
+            "GENERATED ALWAYS AS ("
+            "setweight(to_tsvector('simple', coalesce(full_name, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(bio, '')), 'B')) STORED"
+        ))
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_users_search_vector ON users USING GIN (search_vector) "
+            "WHERE is_active = true"
+        ))
+        return
+
+    if conn.dialect.name != "sqlite":
+        return
+
+    # External-content FTS5 tables, kept in sync with triggers
+    conn.execute(text(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5("
+        "content, content='posts', content_rowid='id', tokenize='porter unicode61')"
+    ))
+    conn.execute(text(
+        "CREATE TRIGGER IF NOT EXISTS posts_fts_ai AFTER INSERT ON posts BEGIN "
+        "INSERT INTO posts_fts(rowid, content) VALUES (new.id, new.content); END"
+    ))
+    conn.execute(text(
+        "CREATE TRIGGER IF NOT EXISTS posts_fts_ad AFTER DELETE ON posts BEGIN "
+        "INSERT INTO posts_fts(posts_fts, rowid, content) VALUES ('delete', old.id, old.content); END"
+    ))
+    conn.execute(text(
+        "CREATE TRIGGER IF NOT EXISTS posts_fts_au AFTER UPDATE OF content ON posts BEGIN "
+        "INSERT INTO posts_fts(posts_fts, rowid, content) VALUES ('delete', old.id, old.content); "
+        "INSERT INTO posts_fts(rowid, content) VALUES (new.id, new.content); END"
+    ))
+    conn.execute(text("INSERT INTO posts_fts(posts_fts) VALUES ('rebuild')"))
+
+    conn.execute(text(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS users_fts USING fts5("
+        "full_name, bio, content='users', content_rowid='id', tokenize='porter unicode61')"
+    ))
+    conn.execute(text(
+        "CREATE TRIGGER IF NOT EXISTS users_fts_ai AFTER INSERT ON users BEGIN "
+        "INSERT INTO users_fts(rowid, full_name, bio) VALUES (new.id, new.full_name, new.bio); END"
+    ))
+    conn.execute(text(
+        "CREATE TRIGGER IF NOT EXISTS users_fts_ad AFTER DELETE ON users BEGIN "
+        "INSERT INTO users_fts(users_fts, rowid, full_name, bio) "
+        "VALUES ('delete', old.id, old.full_name, old.bio); END"
+    ))
+    conn.execute(text(
+        "CREATE TRIGGER IF NOT EXISTS users_fts_au AFTER UPDATE OF full_name, bio ON users BEGIN "
+        "INSERT INTO users_fts(users_fts, rowid, full_name, bio) "
+        "VALUES ('delete', old.id, old.full_name, old.bio); "
+        "INSERT INTO users_fts(rowid, full_name, bio) VALUES (new.id, new.full_name, new.bio); END"
+    ))
+    conn.execute(text("INSERT INTO users_fts(users_fts) VALUES ('rebuild')"))
+
+
+@migration("0004_comment_threads")
+def _comment_threads(conn: DBConnection) -> None:
+    """Materialized-path columns for reply threads, backfilled for existing comments"""
+    columns = _column_names(conn, "interactions")
+    for column, ddl in (
+        ("thread_id", "INTEGER"),
+        ("depth", "INTEGER DEFAULT 0"),
+        ("path", "VARCHAR"),
+        ("reply_count", "INTEGER DEFAULT 0"),
+    ):
+        if column not in columns:
+            conn.execute(text(f"ALTER TABLE interactions ADD COLUMN {column} {ddl}"))
+
+    # Existing comments were all top level (replies did not exist yet)
+    if conn.dialect.name == "postgresql":
+        padded_id = f"lpad(id::text, {PATH_SEGMENT_WIDTH}, '0')"
+    else:
+        padded_id = f"printf('%0{PATH_SEGMENT_WIDTH}d', id)"
+    conn.execute(text(
+        f"UPDATE interactions SET thread_id = id, depth = 0, path = {padded_id}, reply_count = 0 "
+        "WHERE interaction_type = 'COMMENT' AND path IS NULL"
+    ))
+
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_interactions_post_roots ON interactions (post_id, depth, id)"
+    ))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_interactions_thread_path ON interactions (thread_id, path)"
+    ))
+
+
+@migration("0005_likes_table")
+def _likes_table(conn: DBConnection) -> None:
+    """Move likes out of interactions into the narrow likes table"""
+    # create_all has already created likes; keep the first like per (target, user)
+    conn.execute(text(
+        "INSERT INTO likes (target_type, target_id, user_id, created_at) "
+        "SELECT 'POST', post_id, user_id, MIN(created_at) FROM interactions "
+        "WHERE interaction_type = 'LIKE' AND parent_interaction_id IS NULL AND post_id IS NOT NULL "
+        "GROUP BY post_id, user_id"
+    ))
+    conn.execute(text(
+        "INSERT INTO likes (target_type, target_id, user_id, created_at) "
+        "SELECT 'COMMENT', parent_interaction_id, user_id, MIN(created_at) FROM interactions "
+        "WHERE interaction_type = 'LIKE' AND parent_interaction_id IS NOT NULL "
+        "GROUP BY parent_interaction_id, user_id"
+    ))
+    moved = conn.execute(text("DELETE FROM interactions WHERE interaction_type = 'LIKE'")).rowcount
+    if moved:
+        print(f"✅ Moved {moved} like rows out of interactions")
+
+    # Counters may have drifted under the old read-modify-write; recount once
+    conn.execute(text(
+        "UPDATE posts SET like_count = (SELECT COUNT(*) FROM likes "
+        "WHERE likes.target_type = 'POST' AND likes.target_id = posts.id)"
+    ))
+    conn.execute(text(
+        "UPDATE interactions SET like_count = (SELECT COUNT(*) FROM likes "
+        "WHERE likes.target_type = 'COMMENT' AND likes.target_id = interactions.id) "
+        "WHERE interaction_type = 'COMMENT'"
+    ))
+
+
+@migration("0006_user_stats")
+def _user_stats(conn: DBConnection) -> None:
+    """Backfill the denormalized dashboard counters from the source tables"""
+    conn.execute(text("DELETE FROM user_stats"))
+    conn.execute(
+        text(
+            "INSERT INTO user_stats (user_id, post_count, agent_post_count, comment_count, "
+            "likes_given, likes_received, comments_received, connection_count, "
+            "agent_action_count, pending_approvals, approved_actions, rejected_actions, "
+            "recent_activity, updated_at) "
+            "SELECT u.id, "
+            "(SELECT COUNT(*) FROM posts p WHERE p.user_id = u.id "
+            " AND p.status = :published AND p.is_deleted = :false), "
+            "(SELECT COUNT(*) FROM posts p WHERE p.user_id = u.id "
+            " AND p.status = :published AND p.is_deleted = :false AND p.post_type = :agent), "
+            "(SELECT COUNT(*) FROM interactions i WHERE i.user_id = u.id "
+            " AND i.interaction_type = 'COMMENT' AND i.is_deleted = :false), "
+            "(SELECT COUNT(*) FROM likes l WHERE l.user_id = u.id), "
+            "(SELECT COUNT(*) FROM likes l JOIN posts p ON l.target_type = 'POST' AND p.id = l.target_id "
+            " WHERE p.user_id = u.id) + "
+            "(SELECT COUNT(*) FROM likes l JOIN interactions i ON l.target_type = 'COMMENT' AND i.id = l.target_id "
+            " WHERE i.user_id = u.id), "
+            "(SELECT COUNT(*) FROM interactions i JOIN posts p ON p.id = i.post_id WHERE p.user_id = u.id "
+            " AND i.interaction_type = 'COMMENT' AND i.is_deleted = :false), "
+            "(SELECT COUNT(*) FROM connections c WHERE c.status = :accepted "
+            " AND (c.user_id = u.id OR c.connected_user_id = u.id)), "
+            "(SELECT COUNT(*) FROM agent_actions a WHERE a.user_id = u.id), "
+            "(SELECT COUNT(*) FROM agent_actions a WHERE a.user_id = u.id AND a.status = :pending), "
+            "(SELECT COUNT(*) FROM agent_actions a WHERE a.user_id = u.id AND a.status = :approved), "
+            "(SELECT COUNT(*) FROM agent_actions a WHERE a.user_id = u.id AND a.status = :rejected), "
+            "'[]', CURRENT_TIMESTAMP "
+            "FROM users u"
+        ),
+        {
+            "published": PostStatus.PUBLISHED.name,
+            "agent": PostType.AGENT.name,
+            "accepted": ConnectionStatus.ACCEPTED.name,
+            "pending": ActionStatus.PENDING_APPROVAL.name,
+            "approved": ActionStatus.APPROVED.name,
+            "rejected": ActionStatus.REJECTED.name,
+            "false": False,
+        }
+    )
+
+    # Seed each ring buffer with the latest actions
+    rows = conn.execute(
+        text(
+            "SELECT user_id, id, action_type, status, post_id, description, created_at FROM ("
+            "SELECT a.*, ROW_NUMBER() OVER (PARTITION BY user_id ORDER BY id DESC) AS position "
+            "FROM agent_actions a) ranked WHERE position <= :size ORDER BY user_id, id DESC"
+        ),
+        {"size": RECENT_ACTIVITY_SIZE}
+    ).all()
+    activity = {}
+    for user_id, action_id, action_type, action_status, post_id, description, created_at in rows:
+        activity.setdefault(user_id, []).append({
+            "actionId": action_id,
+            "actionType": ActionType[action_type].value,
+            "status": ActionStatus[action_status].value,
+            "postId": post_id,
+            "description": description,
+            "at": f"{created_at}".replace(" ", "T") + "Z",
+        })
+    if activity:
+        conn.execute(
+            text("UPDATE user_stats SET recent_activity = :activity WHERE user_id = :user_id").bindparams(
+                bindparam("activity", type_=JSON)
+            ),
+            [{"user_id": user_id, "activity": entries} for user_id, entries in activity.items()]
+        )
+
+
+@migration("0007_agent_action_log")
+def _agent_action_log(conn: DBConnection) -> None:
+    """History index; monthly range partitions for agent_actions on PostgreSQL"""
+    if conn.dialect.name != "postgresql":
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_agent_actions_agent_created "
+            "ON agent_actions (agent_id, created_at, id)"
+        ))
+        return
+    if is_partitioned(conn, "agent_actions"):
+        return
+
+    # The partition key must be set on every row
+    conn.execute(text(
+        "UPDATE agent_actions SET created_at = timezone('utc', now()) WHERE created_at IS NULL"
+    ))
+
+    # Rebuild as a partitioned table; the id sequence carries over
+    conn.execute(text("ALTER SEQUENCE IF EXISTS agent_actions_id_seq OWNED BY NONE"))
+    conn.execute(text("ALTER TABLE agent_actions RENAME TO agent_actions_unpartitioned"))
+    conn.execute(text(
+        "CREATE TABLE agent_actions (LIKE agent_actions_unpartitioned INCLUDING DEFAULTS) "
+        "PARTITION BY RANGE (created_at)"
+    ))
+    first = conn.execute(text("SELECT min(created_at) FROM agent_actions_unpartitioned")).scalar()
+    now = datetime.utcnow()
+    ensure_monthly_partitions(
+        conn, "agent_actions", first or now, add_months(now.date(), settings.action_log_partitions_ahead)
+    )
+    # Rows beyond the prepared months land here until maintenance catches up
+    conn.execute(text("CREATE TABLE agent_actions_default PARTITION OF agent_actions DEFAULT"))
+
+    conn.execute(text("INSERT INTO agent_actions SELECT * FROM agent_actions_unpartitioned"))
+    conn.execute(text("DROP TABLE agent_actions_unpartitioned"))
+
+    conn.execute(text(
+        "ALTER TABLE agent_actions "
+        "ALTER COLUMN created_at SET NOT NULL, "
+        "ADD PRIMARY KEY (id, created_at), "
+        "ADD FOREIGN KEY (agent_id) REFERENCES agents (id), "
+        "ADD FOREIGN KEY (user_id) REFERENCES users (id), "
+        "ADD FOREIGN KEY (post_id) REFERENCES posts (id)"
+    ))
+    conn.execute(text("ALTER SEQUENCE IF EXISTS agent_actions_id_seq OWNED BY agent_actions.id"))
+    conn.execute(text(
+        "CREATE INDEX ix_agent_actions_agent_created ON agent_actions (agent_id, created_at, id)"
+    ))
+    conn.execute(text("CREATE INDEX ix_agent_actions_user_id ON agent_actions (user_id)"))
+
+
+@migration("0008_agent_quota_window")
+def _agent_quota_window(conn: DBConnection) -> None:
+    """Day key for the atomic daily action quota"""
+    if "actions_window" not in _column_names(conn, "agents"):
+        conn.execute(text("ALTER TABLE agents ADD COLUMN actions_window VARCHAR(10)"))
@@ -0,0 +1,94 @@
+"""
+Table partitioning helpers
+File: backend/app/database/partitions.py
+
+Monthly RANGE partitions for append-mostly PostgreSQL tables (the agent
+action log). Each month lives in its own child table named
+"<table>_yYYYYmMM", so recent-history queries prune to one or two small
+partitions and retention is a DETACH + DROP instead of a bulk DELETE.
+
+Other databases have no declarative partitioning; callers check
+is_partitioned() and fall back to plain tables.
+"""
+
+from datetime import date, datetime
+from typing import List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection as DBConnection
+
+
+def month_start(value: date) -> date:
+    """First day of the month containing value"""
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    """First day of the month `months` after value's month"""
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    """Child table holding one month of rows"""
+    return f"{table}_y{month.year:04d}m{month.month:02d}"
+
+
+def is_partitioned(conn: DBConnection, table: str) -> bool:
+    """Whether table is a PostgreSQL partitioned table"""
+    if conn.dialect.name != "postgresql":
+        return False
+    return conn.execute(
+        text(
+            "SELECT 1 FROM pg_partitioned_table pt JOIN pg_class c ON c.oid = pt.partrelid "
+            "WHERE c.relname = :table AND pg_table_is_visible(c.oid)"
+        ),
+        {"table": table}
+    ).first() is not None
+
+
+def ensure_monthly_partitions(conn: DBConnection, table: str, first: date, last: date) -> List[str]:
+    """
+    Create the monthly partitions from first's month through last's month
+
+    Returns:
+        Names of the partitions that were created
+    """
+    created = []
+    month = month_start(first)
+    while month <= month_start(last):
+        name = partition_name(table, month)
+        exists = conn.execute(text("SELECT to_regclass(:name)"), {"name": name}).scalar()
+        if exists is None:
+            conn.execute(text(
+                f"CREATE TABLE {name} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+            ))
+            created.append(name)
+        month = add_months(month, 1)
+    return created
+
+
+def monthly_partitions(conn: DBConnection, table: str) -> List[Tuple[str, date]]:
+    """Attached monthly partitions of table as (name, month), oldest first"""
+    prefix = f"{table}_y"
+    rows = conn.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :table"
+        ),
+        {"table": table}
+    ).scalars()
+
+    partitions = []
+    for name in rows:
+        if not name.startswith(prefix):
+            continue  # e.g. the default partition
+        try:
+            month = datetime.strptime(name[len(prefix):], "%Ym%m").date()
+        except ValueError:
+            continue
+        partitions.append((name, month))
+    return sorted(partitions, key=lambda item: item[1])
@@ -0,0 +1,128 @@
+"""
+Read replica routing
+File: backend/app/database/replicas.py
+
+Routes read-only requests (GET routes using get_read_db) to read replicas
+configured in DATABASE_REPLICA_URLS, keeping the primary for writes.
+
+- Replicas are picked round robin, skipping any whose replication lag is
+  over settings.replica_max_lag_seconds (measured at most every
+  settings.replica_lag_check_seconds per replica) or that cannot be
+  reached; with no usable replica the primary serves the read.
+- Read-your-writes: committing a session of an authenticated user marks
+  that user for settings.read_your_writes_seconds, and their reads go to
+  the primary meanwhile, so they always see their own changes. The marker
+  lives in the byte cache backend (shared between instances with
+  CACHE_BACKEND=redis).
+- Replica sessions refuse to flush changes.
+"""
+
+import itertools
+import time
+from typing import Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache, make_byte_cache
+from app.core.config import settings
+from app.core.metrics import Counter
+from app.database import connection as database
+
+READ_ROUTING = Counter(
+    "db_read_routing_total", "Read-only sessions by target and reason", ("target", "reason")
+)
+
+# Lag reported for an unreachable replica
+UNREACHABLE = float("inf")
+
+_PG_LAG = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+
+class ReplicaRouter:
+    """Chooses the engine behind each read-only session"""
+
+    def __init__(self):
+        self._lag = TTLCache("replica_lag", ttl_seconds=settings.replica_lag_check_seconds, max_entries=64)
+        self._turn = itertools.count()
+        self._writers = None
+
+    @property
+    def writers(self):
+        """user id -> recently wrote marker"""
+        if self._writers is None:
+            self._writers = make_byte_cache("recent_writers", settings.cache_backend)
+        return self._writers
+
+    def session(self, user_id: Optional[int] = None) -> Session:
+        """Session for a read-only request: a fresh-enough replica, else the primary"""
+        replicas = database.replica_sessions
+        if not replicas:
+            return database.SessionLocal()
+        if user_id is not None and self.recently_wrote(user_id):
+            READ_ROUTING.labels("primary", "read_your_writes").inc()
+            return database.SessionLocal()
+
+        start = next(self._turn)
+        for offset in range(len(replicas)):
+            index = (start + offset) % len(replicas)
+            if self.lag(index) <= settings.replica_max_lag_seconds:
+                READ_ROUTING.labels("replica", "ok").inc()
+                return replicas[index]()
+
+        READ_ROUTING.labels("primary", "replica_lag").inc()
+        return database.SessionLocal()
+
+    def lag(self, index: int) -> float:
+        """Replication lag of a replica in seconds (cached briefly)"""
+        lag = self._lag.get(index)
+        if lag is None:
+            lag = self._measure(index)
+            self._lag.set(index, lag)
+        return lag
+
+    def mark_write(self, user_id: int) -> None:
+        self.writers.set(str(user_id), b"1", ttl_seconds=settings.read_your_writes_seconds)
+
+    def recently_wrote(self, user_id: int) -> bool:
+        try:
+            return self.writers.get(str(user_id)) is not None
+        except Exception:
+            return True  # Can't tell: the primary is always correct
+
+    def _measure(self, index: int) -> float:
+        engine = database.replica_engines[index]
+        started = time.perf_counter()
+        try:
+            with engine.connect() as conn:
+                if engine.dialect.name == "postgresql":
+                    return float(conn.execute(_PG_LAG).scalar() or 0)
+                conn.execute(text("SELECT 1"))
+                return 0.0
+        except Exception as e:
+            print(f"⚠️  Replica {index} unavailable after {(time.perf_counter() - started) * 1000:.0f} ms: {e}")
+            return UNREACHABLE
+
+
+# Singleton instance
+replica_router = ReplicaRouter()
+
+
+@event.listens_for(Session, "after_commit")
+def _mark_recent_writer(session: Session) -> None:
+    """Send the committing user's reads to the primary for a while"""
+    user_id = session.info.get("user_id")
+    if user_id is not None and database.replica_sessions and not session.info.get("replica"):
+        try:
+            replica_router.mark_write(user_id)
+        except Exception as e:
+            print(f"⚠️  Could not record read-your-writes marker: {e}")
+
+
+@event.listens_for(Session, "before_flush")
+def _refuse_replica_writes(session: Session, flush_context, instances) -> None:
+    if session.info.get("replica") and (session.new or session.dirty or session.deleted):
+        raise RuntimeError("Attempted to write through a read replica session")
@@ -5,15 +5,48 @@ File: backend/app/main.py
 This is the main FastAPI application that configures middleware, routes, and startup/shutdown events.
 """
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, HTTPException, status
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
+import os
 from pathlib import Path
 
 from app.core.config import settings
-from app.database.connection import init_db_engine, init_db
-from app.api.routes import auth, agents, posts, connections, interactions, feed
+from app.core.rate_limit import RateLimitMiddleware
+from app.core.body_limit import BodySizeLimitMiddleware
+from app.core.metrics import MetricsMiddleware, registry as metrics_registry
+from app.core.profiling import ProfilingMiddleware
+from app.database import connection as database
+from app.database.connection import init_db_engine, init_db, load_models
+from app.api.routes import auth, agents, posts, connections, interactions, feed, search, realtime, notifications
+from app.services.social_graph import social_graph
+from app.services.realtime import realtime_hub
+from app.services.event_bus import event_dispatcher
+from app.services.action_log_service import action_log_service
+from app.services.health_service import health_service
+from app.services.cluster_bus import cluster_bus
+from app.services.leader_election import leader_election
+from app.services.storage_service import IMMUTABLE_CACHE_SECONDS, storage_service
+from app.services import event_consumers  # noqa: F401  (registers outbox consumers)
+
+
+# Background jobs run in one process only: the outbox dispatcher, and
+# action log partition upkeep and archiving
+leader_election.register(event_dispatcher.start, event_dispatcher.stop)
+leader_election.register(action_log_service.start, action_log_service.stop)
+
+
+def _warn_per_worker_state() -> None:
+    """Point out backends that are per worker when running several workers"""
+    if settings.realtime_broker == "local":
+        print("⚠️  REALTIME_BROKER=local with several workers: realtime pushes and graph/like "
+              "updates stay inside the worker that made them; use redis")
+    if settings.rate_limit_backend == "memory":
+        print(f"⚠️  RATE_LIMIT_BACKEND=memory: budgets are per worker ({settings.web_concurrency}x the configured rate)")
+    if settings.quota_backend == "local":
+        print("⚠️  QUOTA_BACKEND=local: daily agent quotas are per worker; use database or redis")
 
 
 @asynccontextmanager
@@ -27,9 +60,42 @@ async def lifespan(app: FastAPI):
 
     # Initialize database
     print("📦 Initializing database...")
-    init_db_engine(settings.database_url, settings.database_echo)
-    init_db()
-    print("✅ Database initialized")
+    init_db_engine(settings.database_url, settings.database_echo, settings.database_replica_urls_list)
+    if settings.is_production:
+        # Schema is applied once per deploy by the release command, not on every cold start
+        load_models()
+        print("✅ Database engine ready (schema managed by `python -m app.manage migrate`)")
+    else:
+        init_db()
+        print("✅ Database initialized")
+
+    if settings.web_concurrency > 1:
+        _warn_per_worker_state()
+    if settings.metrics_token and os.environ.get("FLY_APP_NAME"):
+        print("⚠️  METRICS_TOKEN is set on Fly: the [metrics] scraper sends no token and gets 401 from /metrics")
+
+    # Subscribe to other workers' state changes before loading that state
+    await cluster_bus.start()
+
+    # Build in-memory social graph from accepted connections
+    db = database.SessionLocal()
+    try:
+        social_graph.load(db)
+    finally:
+        db.close()
+    print("✅ Social graph loaded")
+
+    # Connect the realtime pub/sub broker
+    await realtime_hub.start()
+    print("✅ Realtime hub started")
+
+    # Background jobs (see below) start in the elected leader process only
+    await leader_election.start()
+
+    # Open the first pooled connection before taking traffic
+    warm_up = await health_service.warm_up()
+    print(f"✅ Database connection warm ({warm_up.get('latencyMs')} ms)" if warm_up["status"] == "ok"
+          else f"⚠️  Database not reachable yet: {warm_up.get('detail')}")
 
     # TODO Phase 2+: Initialize Redis connection
     # TODO Phase 4+: Initialize agent service
@@ -40,6 +106,10 @@ async def lifespan(app: FastAPI):
 
     # Shutdown: Clean up resources
     print("👋 Shutting down Agent Social Media API...")
+    await leader_election.stop()
+    await realtime_hub.stop()
+    await cluster_bus.stop()
+    await storage_service.close()
     # TODO: Close database connections
     # TODO: Close Redis connection
     print("✅ Cleanup complete")
@@ -53,6 +123,13 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# Upload size limits (innermost, so 413s pass through rate limiting and get CORS headers)
+app.add_middleware(BodySizeLimitMiddleware)
+
+# Rate limiting (added before CORS so CORS wraps it and 429s keep their CORS headers)
+if settings.rate_limit_enabled:
+    app.add_middleware(RateLimitMiddleware)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -60,13 +137,36 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[
+        "RateLimit-Limit", "RateLimit-Remaining", "RateLimit-Reset", "RateLimit-Policy", "Retry-After",
+        "X-Quota-Limit", "X-Quota-Remaining", "X-Quota-Reset",
+        "Server-Timing", "X-SQL-Repeated",
+    ],
 )
 
+# SQL profiling (debug only; inside the metrics middleware so they share per-request stats)
+if settings.sql_profiling_enabled:
+    app.add_middleware(ProfilingMiddleware)
+
+# Request metrics (outermost, so rate-limited and CORS-rejected requests are counted too)
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
+
+class MediaFiles(StaticFiles):
+    """Static files named by content hash: cacheable forever"""
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = f"public, max-age={IMMUTABLE_CACHE_SECONDS}, immutable"
+        return response
 
-# Mount static files for serving uploads
-uploads_dir = Path("uploads")
+
+# Mount static files for serving uploads (STORAGE_BACKEND=local)
+uploads_dir = Path(settings.media_root)
 uploads_dir.mkdir(exist_ok=True)
-app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
+if settings.media_url.startswith("/"):
+    app.mount(settings.media_url.rstrip("/"), MediaFiles(directory=uploads_dir), name="uploads")
 
 
 # Health check endpoints
@@ -83,19 +183,34 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    """Detailed health check for all services"""
-    health_status = {
-        "status": "healthy",
-        "services": {
-            "api": "operational",
-            "database": "operational",  # TODO: Add actual DB health check
-        }
-    }
+    """Detailed health check for all services (always 200, see /health/ready for probes)"""
+    return await health_service.readiness()
+
+
+@app.get("/health/live")
+async def liveness():
+    """Liveness probe - the process is up"""
+    return health_service.liveness()
+
+
+@app.get("/health/ready")
+async def readiness():
+    """Readiness probe - 503 until the database is reachable and the pool has room"""
+    result = await health_service.readiness()
+    return JSONResponse(
+        result,
+        status_code=status.HTTP_200_OK if result["ready"] else status.HTTP_503_SERVICE_UNAVAILABLE
+    )
 
-    # TODO Phase 2+: Add Redis health check
-    # TODO Phase 4+: Add AI service health check
 
-    return health_status
+@app.get("/metrics", include_in_schema=False)
+async def metrics(request: Request):
+    """Prometheus metrics for this process"""
+    if not settings.metrics_enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    if settings.metrics_token and request.headers.get("authorization") != f"Bearer {settings.metrics_token}":
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid metrics token")
+    return PlainTextResponse(metrics_registry.render(), media_type="text/plain; version=0.0.4")
 
 
 # Include API routers
@@ -105,3 +220,6 @@ app.include_router(posts.router, prefix="/api/posts", tags=["Posts"])
 app.include_router(connections.router, prefix="/api/connections", tags=["Connections"])
 app.include_router(interactions.router, prefix="/api", tags=["Interactions"])
 app.include_router(feed.router, prefix="/api/feed", tags=["Feed"])
+app.include_router(search.router, prefix="/api/search", tags=["Search"])
+app.include_router(notifications.router, prefix="/api/notifications", tags=["Notifications"])
+app.include_router(realtime.router, prefix="/api/realtime", tags=["Realtime"])
@@ -0,0 +1,40 @@
+"""
+Management commands
+File: backend/app/manage.py
+
+Usage (from backend/):
+    python -m app.manage migrate    # create missing tables and apply pending migrations
+
+In production the API skips schema setup at startup; fly.toml runs
+`migrate` as the release command once per deploy instead.
+"""
+
+import argparse
+import sys
+
+from app.core.config import settings
+from app.database.connection import init_db, init_db_engine
+
+
+def migrate() -> None:
+    """Create missing tables and apply pending migrations"""
+    init_db_engine(settings.database_url, settings.database_echo)
+    init_db()
+    print("✅ Database schema up to date")
+
+
+COMMANDS = {
+    "migrate": migrate,
+}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.manage", description="Management commands")
+    parser.add_argument("command", choices=sorted(COMMANDS))
+    args = parser.parse_args(argv)
+    COMMANDS[args.command]()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,6 +9,10 @@ from app.models.user import User
 from app.models.agent import Agent
 from app.models.post import Post, PostType, PostStatus
 from app.models.agent_action import AgentAction, ActionType, ActionStatus
+from app.models.notification import Notification, NotificationCounter, NotificationType
+from app.models.outbox_event import OutboxEvent
+from app.models.like import Like, LikeTargetType
+from app.models.user_stats import UserStats
 
 __all__ = [
     "User",
@@ -19,4 +23,11 @@ __all__ = [
     "AgentAction",
     "ActionType",
     "ActionStatus",
+    "Notification",
+    "NotificationCounter",
+    "NotificationType",
+    "OutboxEvent",
+    "Like",
+    "LikeTargetType",
+    "UserStats",
 ]
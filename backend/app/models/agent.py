@@ -31,7 +31,8 @@ class Agent(Base):
 
     # Agent status
     is_active = Column(Boolean, default=True)
-    actions_today = Column(Integer, default=0)
+    actions_today = Column(Integer, default=0)  # within actions_window
+    actions_window = Column(String(10), nullable=True)  # quota day, e.g. "2025-03-14" (see quota_service)
     last_action_date = Column(DateTime, nullable=True)
     last_action_at = Column(DateTime, nullable=True)
 
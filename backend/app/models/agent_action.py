@@ -3,9 +3,13 @@ AgentAction database model
 File: backend/app/models/agent_action.py
 
 SQLAlchemy model for agent_actions table. Logs all actions taken by agents.
+
+On PostgreSQL the table is range-partitioned by month on created_at
+(migration 0007, see app/database/partitions.py); its primary key there is
+(id, created_at) and old months are archived by action_log_service.
 """
 
-from sqlalchemy import Column, Integer, String, Text, JSON, Boolean, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Text, JSON, Boolean, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -56,7 +60,7 @@ class AgentAction(Base):
     engagement_score = Column(Integer, default=0)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)  # partition key
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
@@ -64,5 +68,10 @@ class AgentAction(Base):
     user = relationship("User", backref="agent_actions")
     post = relationship("Post", backref="agent_action")
 
+    __table_args__ = (
+        # Action history: newest first per agent
+        Index("ix_agent_actions_agent_created", "agent_id", "created_at", "id"),
+    )
+
     def __repr__(self):
         return f"<AgentAction(id={self.id}, agent_id={self.agent_id}, type={self.action_type}, status={self.status})>"
@@ -5,9 +5,10 @@ File: backend/app/models/connection.py
 SQLAlchemy model for connections table representing relationships between users.
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, Boolean, UniqueConstraint, event
 from sqlalchemy.orm import relationship
 from datetime import datetime
+from typing import Tuple
 import enum
 from app.database.connection import Base
 
@@ -27,10 +28,18 @@ class ConnectionStatus(str, enum.Enum):
     REJECTED = "rejected"
 
 
+def canonical_pair(user_a: int, user_b: int) -> Tuple[int, int]:
+    """Order a user pair so (a, b) and (b, a) map to the same key"""
+    return (user_a, user_b) if user_a < user_b else (user_b, user_a)
+
+
 class Connection(Base):
     """Connection model representing relationships between users"""
 
     __tablename__ = "connections"
+    __table_args__ = (
+        UniqueConstraint("user_low_id", "user_high_id", name="uq_connections_pair"),
+    )
 
     # Primary key
     id = Column(Integer, primary_key=True, index=True)
@@ -39,6 +48,10 @@ class Connection(Base):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     connected_user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
 
+    # Canonical (min, max) user pair - one row per pair regardless of direction
+    user_low_id = Column(Integer, nullable=False)
+    user_high_id = Column(Integer, nullable=False, index=True)
+
     # Connection details
     connection_type = Column(Enum(ConnectionType), default=ConnectionType.FRIEND)
     status = Column(Enum(ConnectionStatus), default=ConnectionStatus.PENDING)
@@ -54,3 +67,11 @@ class Connection(Base):
     # Relationships
     user = relationship("User", foreign_keys=[user_id], backref="connections_initiated")
     connected_user = relationship("User", foreign_keys=[connected_user_id])
+
+
+@event.listens_for(Connection, "before_insert")
+def _set_canonical_pair(mapper, connection, target):
+    """Fill in the canonical pair from the directed user ids"""
+    target.user_low_id, target.user_high_id = canonical_pair(
+        target.user_id, target.connected_user_id
+    )
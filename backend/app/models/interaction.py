@@ -5,12 +5,27 @@ File: backend/app/models/interaction.py
 SQLAlchemy model for interactions table (likes, comments, reactions).
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, Boolean, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
+from typing import List
 from app.database.connection import Base
 
+# Comment paths are "/"-joined ids zero-padded to a fixed width, so ordering
+# by path is depth-first thread order and a subtree is a path range.
+PATH_SEGMENT_WIDTH = 10
+
+
+def path_segment(interaction_id: int) -> str:
+    """Fixed-width path segment for an interaction id"""
+    return str(interaction_id).zfill(PATH_SEGMENT_WIDTH)
+
+
+def path_ancestor_ids(path: str) -> List[int]:
+    """Ids of every comment on a path (root first, including the last one)"""
+    return [int(segment) for segment in path.split("/")]
+
 
 class InteractionType(str, enum.Enum):
     """Enum for interaction types"""
@@ -46,6 +61,12 @@ class Interaction(Base):
     # Engagement metrics (for comments)
     like_count = Column(Integer, default=0)
 
+    # Reply threads (comments only)
+    thread_id = Column(Integer, nullable=True)  # id of the top-level comment
+    depth = Column(Integer, default=0)
+    path = Column(String, nullable=True)  # materialized path, see path_segment
+    reply_count = Column(Integer, default=0)  # live descendants
+
     # Metadata
     is_edited = Column(Boolean, default=False)
     is_deleted = Column(Boolean, default=False)
@@ -57,3 +78,9 @@ class Interaction(Base):
     # Relationships
     user = relationship("User", backref="interactions")
     post = relationship("Post", backref="interactions")
+
+    __table_args__ = (
+        # Top-level comments of a post, and thread/subtree scans in path order
+        Index("ix_interactions_post_roots", "post_id", "depth", "id"),
+        Index("ix_interactions_thread_path", "thread_id", "path"),
+    )
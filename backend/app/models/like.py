@@ -0,0 +1,43 @@
+"""
+Like database model
+File: backend/app/models/like.py
+
+SQLAlchemy model for the likes table.
+
+Likes used to be full Interaction rows (content, edit flags, actor type,
+two timestamps). They now live in a narrow table keyed by
+(target_type, target_id, user_id): the primary key is the uniqueness
+guarantee, and its leading columns are exactly the "who liked this" scan.
+"""
+
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Enum, Index
+from datetime import datetime
+import enum
+from app.database.connection import Base
+
+
+class LikeTargetType(str, enum.Enum):
+    """Enum for what a like points at"""
+    POST = "post"
+    COMMENT = "comment"
+
+
+class Like(Base):
+    """Like model: one user liking one post or comment"""
+
+    __tablename__ = "likes"
+
+    # Composite primary key (one like per user and target)
+    target_type = Column(Enum(LikeTargetType), primary_key=True)
+    target_id = Column(Integer, primary_key=True, autoincrement=False)  # posts.id or interactions.id
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        # "What has this user liked", newest first
+        Index("ix_likes_user", "user_id", "target_type", "created_at"),
+    )
+
+    def __repr__(self):
+        return f"<Like(target={self.target_type}:{self.target_id}, user_id={self.user_id})>"
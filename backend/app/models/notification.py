@@ -0,0 +1,93 @@
+"""
+Notification database models
+File: backend/app/models/notification.py
+
+SQLAlchemy models for the notifications inbox and per-user unread counters.
+
+Related events are coalesced into one row per (user_id, group_key) while it
+is unread: "12 people liked your post" is a single notification whose
+actor_count grows (notification_actors holds who has been counted while the
+row is unread). The unread total lives in notification_counters so the
+badge never needs a COUNT(*) over the inbox.
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, Boolean, JSON, Index
+from sqlalchemy.orm import relationship
+from datetime import datetime
+import enum
+from app.database.connection import Base
+
+
+class NotificationType(str, enum.Enum):
+    """Enum for notification types"""
+    POST_LIKED = "post_liked"
+    POST_COMMENTED = "post_commented"
+    COMMENT_LIKED = "comment_liked"
+    CONNECTION_REQUESTED = "connection_requested"
+    CONNECTION_ACCEPTED = "connection_accepted"
+
+
+class Notification(Base):
+    """Notification model: one (possibly coalesced) inbox entry"""
+
+    __tablename__ = "notifications"
+
+    # Primary key
+    id = Column(Integer, primary_key=True, index=True)
+
+    # Recipient
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+
+    # What happened
+    notification_type = Column(Enum(NotificationType), nullable=False)
+    group_key = Column(String, nullable=False)  # e.g. "post_liked:42"
+    post_id = Column(Integer, ForeignKey("posts.id"), nullable=True)
+    interaction_id = Column(Integer, ForeignKey("interactions.id"), nullable=True)
+
+    # Who did it (most recent first, capped for display)
+    actor_count = Column(Integer, default=1, nullable=False)
+    actor_ids = Column(JSON, default=list)
+    last_actor_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+
+    is_read = Column(Boolean, default=False, nullable=False)
+
+    # Timestamps (updated_at moves forward whenever an event is coalesced in)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Relationships
+    user = relationship("User", foreign_keys=[user_id], backref="notifications")
+
+    __table_args__ = (
+        # Inbox paging: newest first per user
+        Index("ix_notifications_user_updated", "user_id", "updated_at", "id"),
+        # Coalescing lookup for unread rows
+        Index("ix_notifications_user_group", "user_id", "group_key", "is_read"),
+    )
+
+    def __repr__(self):
+        return f"<Notification(id={self.id}, user_id={self.user_id}, type={self.notification_type}, actors={self.actor_count})>"
+
+
+class NotificationActor(Base):
+    """Every distinct actor of an unread notification, so actor_count stays exact"""
+
+    __tablename__ = "notification_actors"
+
+    notification_id = Column(Integer, ForeignKey("notifications.id", ondelete="CASCADE"), primary_key=True)
+    actor_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+
+    def __repr__(self):
+        return f"<NotificationActor(notification_id={self.notification_id}, actor_id={self.actor_id})>"
+
+
+class NotificationCounter(Base):
+    """Unread notification count per user"""
+
+    __tablename__ = "notification_counters"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    unread_count = Column(Integer, default=0, nullable=False)
+
+    def __repr__(self):
+        return f"<NotificationCounter(user_id={self.user_id}, unread={self.unread_count})>"
@@ -0,0 +1,42 @@
+"""
+OutboxEvent database model
+File: backend/app/models/outbox_event.py
+
+SQLAlchemy model for the transactional outbox. Route handlers add an event
+row in the same commit as the change it describes; the event dispatcher
+delivers it to consumers afterwards.
+"""
+
+from sqlalchemy import Column, Integer, String, Text, JSON, DateTime, Index
+from datetime import datetime
+from app.database.connection import Base
+
+
+class OutboxEvent(Base):
+    """Domain event waiting to be (or already) delivered to consumers"""
+
+    __tablename__ = "outbox_events"
+
+    # Primary key (delivery order)
+    id = Column(Integer, primary_key=True, index=True)
+
+    # Event details
+    event_type = Column(String, nullable=False)  # e.g. "post.liked"
+    payload = Column(JSON, default=dict)
+
+    # Delivery state
+    attempts = Column(Integer, default=0, nullable=False)
+    available_at = Column(DateTime, default=datetime.utcnow, nullable=False)  # retry backoff
+    processed_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        # Pending scan: unprocessed rows in id order
+        Index("ix_outbox_events_pending", "processed_at", "id"),
+    )
+
+    def __repr__(self):
+        return f"<OutboxEvent(id={self.id}, type={self.event_type}, attempts={self.attempts})>"
@@ -5,7 +5,7 @@ File: backend/app/models/user.py
 SQLAlchemy model for users table.
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Index, func
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database.connection import Base
@@ -40,3 +40,8 @@ class User(Base):
 
     def __repr__(self):
         return f"<User(id={self.id}, email='{self.email}', full_name='{self.full_name}')>"
+
+
+# Case-insensitive prefix search and keyset pagination for the user directory
+Index("ix_users_full_name_lower", func.lower(User.full_name), User.id)
+Index("ix_users_email_lower", func.lower(User.email))
@@ -0,0 +1,69 @@
+"""
+UserStats database model
+File: backend/app/models/user_stats.py
+
+SQLAlchemy model for denormalized per-user (and, since agents are one per
+user, per-agent) counters shown on the agent dashboard.
+
+The counters are adjusted in the same transaction as the write they count
+(see app/services/stats_service.py), and recent_activity is a small ring
+buffer of the agent's latest actions, so the dashboard is one primary-key
+read instead of a handful of COUNT(*) queries.
+"""
+
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, JSON
+from datetime import datetime
+from app.database.connection import Base
+
+# Entries kept in recent_activity
+RECENT_ACTIVITY_SIZE = 20
+
+# Counter columns, all adjusted by stats_service.bump()
+COUNTER_FIELDS = (
+    "post_count",
+    "agent_post_count",
+    "comment_count",
+    "likes_given",
+    "likes_received",
+    "comments_received",
+    "connection_count",
+    "agent_action_count",
+    "pending_approvals",
+    "approved_actions",
+    "rejected_actions",
+)
+
+
+class UserStats(Base):
+    """Running totals for one user and their agent"""
+
+    __tablename__ = "user_stats"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+
+    # Content (published, not deleted)
+    post_count = Column(Integer, default=0, nullable=False)
+    agent_post_count = Column(Integer, default=0, nullable=False)
+
+    # Engagement given and received
+    comment_count = Column(Integer, default=0, nullable=False)
+    likes_given = Column(Integer, default=0, nullable=False)
+    likes_received = Column(Integer, default=0, nullable=False)
+    comments_received = Column(Integer, default=0, nullable=False)
+
+    # Accepted connections
+    connection_count = Column(Integer, default=0, nullable=False)
+
+    # Agent actions
+    agent_action_count = Column(Integer, default=0, nullable=False)
+    pending_approvals = Column(Integer, default=0, nullable=False)
+    approved_actions = Column(Integer, default=0, nullable=False)
+    rejected_actions = Column(Integer, default=0, nullable=False)
+
+    # Latest agent activity, newest first (capped ring buffer)
+    recent_activity = Column(JSON, default=list)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<UserStats(user_id={self.user_id}, posts={self.post_count}, connections={self.connection_count})>"
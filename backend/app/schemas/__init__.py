@@ -10,6 +10,8 @@ from app.schemas.user import (
     UserResponse,
     TokenResponse,
     UserWithToken,
+    UserDirectoryEntry,
+    UserDirectoryPage,
 )
 from app.schemas.agent import (
     AgentCreate,
@@ -31,6 +33,8 @@ __all__ = [
     "UserResponse",
     "TokenResponse",
     "UserWithToken",
+    "UserDirectoryEntry",
+    "UserDirectoryPage",
     "AgentCreate",
     "AgentUpdate",
     "AgentResponse",
@@ -5,7 +5,8 @@ File: backend/app/schemas/agent.py
 
 from pydantic import BaseModel, Field, ConfigDict
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+from app.models.agent_action import ActionType, ActionStatus
 
 
 def datetime_serializer(dt: datetime) -> str:
@@ -56,6 +57,33 @@ class AgentResponse(BaseModel):
     )
 
 
+class AgentActionResponse(BaseModel):
+    """Schema for an entry in the agent action history"""
+    id: int
+    post_id: Optional[int] = Field(None, serialization_alias='postId')
+    action_type: ActionType = Field(..., serialization_alias='actionType')
+    status: ActionStatus
+    description: Optional[str] = None
+    action_metadata: Dict[str, Any] = Field(default_factory=dict, serialization_alias='metadata')
+    user_feedback: Optional[str] = Field(None, serialization_alias='userFeedback')
+    engagement_score: int = Field(default=0, serialization_alias='engagementScore')
+    created_at: datetime = Field(..., serialization_alias='createdAt')
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        json_encoders={datetime: datetime_serializer}
+    )
+
+
+class AgentActionPage(BaseModel):
+    """Cursor-paginated agent action history"""
+    items: List[AgentActionResponse]
+    next_cursor: Optional[str] = Field(None, serialization_alias='nextCursor')
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
 class OnboardingQuestionnaireData(BaseModel):
     """Schema for onboarding questionnaire responses"""
     use_case: str = Field(..., description="productivity or social")
@@ -50,3 +50,20 @@ class ConnectionResponse(BaseModel):
     connected_user: Optional[UserInfo] = Field(None, serialization_alias='connectedUser')
 
     model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+
+class ConnectionSuggestion(BaseModel):
+    """Schema for a suggested connection (friend of a friend)"""
+    user: UserInfo
+    mutual_count: int = Field(..., serialization_alias='mutualCount')
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+
+class MutualConnectionsResponse(BaseModel):
+    """Schema for mutual connection count between two users"""
+    user_id: int = Field(..., serialization_alias='userId')
+    mutual_count: int = Field(..., serialization_alias='mutualCount')
+    is_connected: bool = Field(..., serialization_alias='isConnected')
+
+    model_config = ConfigDict(populate_by_name=True)
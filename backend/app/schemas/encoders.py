@@ -0,0 +1,151 @@
+"""
+Fast JSON encoders for list endpoints
+File: backend/app/schemas/encoders.py
+
+Serializes column tuples straight to JSON bytes with orjson, skipping ORM
+hydration and Pydantic validation. The output matches PostResponse and
+InteractionResponse field for field (camelCase keys, same datetime formats),
+so these schemas stay the documented response models.
+
+Rows must be selected with POST_ROW_COLUMNS / INTERACTION_ROW_COLUMNS (in
+that order), with the author/user joined using an outer join.
+"""
+
+from datetime import datetime
+from typing import Iterable, Optional
+
+import orjson
+from fastapi import Response
+
+from app.models.interaction import Interaction
+from app.models.post import Post
+from app.models.user import User
+
+# Naive datetimes are UTC: emitted as isoformat() + 'Z', like datetime_serializer
+_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+POST_ROW_COLUMNS = (
+    Post.id,
+    Post.user_id,
+    Post.agent_id,
+    Post.content,
+    Post.post_type,
+    Post.status,
+    Post.is_edited,
+    Post.edited_by_user,
+    Post.is_deleted,
+    Post.like_count,
+    Post.comment_count,
+    Post.created_at,
+    Post.updated_at,
+    User.id,
+    User.full_name,
+    User.profile_picture_url,
+)
+
+INTERACTION_ROW_COLUMNS = (
+    Interaction.id,
+    Interaction.user_id,
+    Interaction.post_id,
+    Interaction.parent_interaction_id,
+    Interaction.interaction_type,
+    Interaction.actor_type,
+    Interaction.content,
+    Interaction.like_count,
+    Interaction.thread_id,
+    Interaction.depth,
+    Interaction.reply_count,
+    Interaction.is_edited,
+    Interaction.is_deleted,
+    Interaction.created_at,
+    Interaction.updated_at,
+    User.id,
+    User.full_name,
+    User.email,
+    User.profile_picture_url,
+)
+
+
+def _millis_utc(dt: Optional[datetime]) -> Optional[str]:
+    """Same format as InteractionResponse.serialize_datetime, without strftime"""
+    if not dt:
+        return None
+    return f"{dt:%Y-%m-%dT%H:%M:%S}.{dt.microsecond // 1000:03d}Z"
+
+
+def post_row_to_dict(row) -> dict:
+    """Map a POST_ROW_COLUMNS row to the PostResponse JSON shape"""
+    (post_id, user_id, agent_id, content, post_type, post_status, is_edited,
+     edited_by_user, is_deleted, like_count, comment_count, created_at,
+     updated_at, author_id, author_name, author_picture) = row
+    return {
+        "id": post_id,
+        "userId": user_id,
+        "agentId": agent_id,
+        "content": content,
+        "postType": post_type,
+        "status": post_status,
+        "isEdited": is_edited,
+        "editedByUser": edited_by_user,
+        "isDeleted": is_deleted,
+        "likeCount": like_count,
+        "commentCount": comment_count,
+        "createdAt": created_at,
+        "updatedAt": updated_at,
+        "author": None if author_id is None else {
+            "id": author_id,
+            "fullName": author_name,
+            "profilePictureUrl": author_picture,
+        },
+    }
+
+
+def interaction_row_to_dict(row) -> dict:
+    """Map an INTERACTION_ROW_COLUMNS row to the InteractionResponse JSON shape"""
+    (interaction_id, user_id, post_id, parent_id, interaction_type, actor_type,
+     content, like_count, thread_id, depth, reply_count, is_edited, is_deleted,
+     created_at, updated_at, author_id, author_name, author_email,
+     author_picture) = row
+    return {
+        "id": interaction_id,
+        "userId": user_id,
+        "postId": post_id,
+        "parentInteractionId": parent_id,
+        "interactionType": interaction_type,
+        "actorType": actor_type,
+        "content": content,
+        "likeCount": like_count or 0,
+        "threadId": thread_id,
+        "depth": depth or 0,
+        "replyCount": reply_count or 0,
+        "isEdited": is_edited,
+        "isDeleted": is_deleted,
+        "createdAt": _millis_utc(created_at),
+        "updatedAt": _millis_utc(updated_at),
+        "user": None if author_id is None else {
+            "id": author_id,
+            "fullName": author_name,
+            "email": author_email,
+            "profilePictureUrl": author_picture,
+        },
+    }
+
+
+def encode_post_rows(rows: Iterable) -> bytes:
+    """Serialize POST_ROW_COLUMNS rows to a JSON array"""
+    return orjson.dumps([post_row_to_dict(row) for row in rows], option=_ORJSON_OPTIONS)
+
+
+def encode_interaction_rows(rows: Iterable) -> bytes:
+    """Serialize INTERACTION_ROW_COLUMNS rows to a JSON array"""
+    return orjson.dumps([interaction_row_to_dict(row) for row in rows], option=_ORJSON_OPTIONS)
+
+
+def encode_json(value) -> bytes:
+    """Serialize already-shaped dicts/lists with the same options"""
+    return orjson.dumps(value, option=_ORJSON_OPTIONS)
+
+
+def json_bytes_response(body: bytes, status_code: int = 200) -> Response:
+    """Wrap pre-serialized JSON so FastAPI sends it untouched"""
+    return Response(content=body, status_code=status_code, media_type="application/json")
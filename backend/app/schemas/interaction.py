@@ -5,8 +5,9 @@ File: backend/app/schemas/interaction.py
 
 from pydantic import BaseModel, Field, ConfigDict, field_serializer
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from app.models.interaction import InteractionType, ActorType
+from app.models.like import LikeTargetType
 
 
 class LikeCreate(BaseModel):
@@ -14,9 +15,20 @@ class LikeCreate(BaseModel):
     pass
 
 
+class LikeResponse(BaseModel):
+    """Schema for a like on a post or comment"""
+    target_type: LikeTargetType = Field(..., serialization_alias='targetType')
+    target_id: int = Field(..., serialization_alias='targetId')
+    user_id: int = Field(..., serialization_alias='userId')
+    like_count: int = Field(..., serialization_alias='likeCount')
+
+
 class CommentCreate(BaseModel):
-    """Schema for creating a comment"""
+    """Schema for creating a comment (or a reply when parentId is set)"""
     content: str = Field(..., min_length=1, max_length=5000)
+    parent_id: Optional[int] = Field(None, alias='parentId')
+
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class CommentUpdate(BaseModel):
@@ -44,6 +56,9 @@ class InteractionResponse(BaseModel):
     actor_type: ActorType = Field(..., serialization_alias='actorType')
     content: Optional[str] = None
     like_count: int = Field(default=0, serialization_alias='likeCount')
+    thread_id: Optional[int] = Field(None, serialization_alias='threadId')
+    depth: int = 0
+    reply_count: int = Field(default=0, serialization_alias='replyCount')
     is_edited: bool = Field(..., serialization_alias='isEdited')
     is_deleted: bool = Field(..., serialization_alias='isDeleted')
     created_at: datetime = Field(..., serialization_alias='createdAt')
@@ -59,3 +74,31 @@ class InteractionResponse(BaseModel):
         return None
 
     model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+
+class CommentThread(InteractionResponse):
+    """Schema for a top-level comment with its first replies"""
+    replies: List[InteractionResponse] = []
+    replies_cursor: Optional[str] = Field(None, serialization_alias='repliesCursor')
+
+
+class CommentThreadPage(BaseModel):
+    """Cursor-paginated page of comment threads"""
+    items: List[CommentThread]
+    next_cursor: Optional[str] = Field(None, serialization_alias='nextCursor')
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class CommentReplyPage(BaseModel):
+    """Cursor-paginated replies under a comment, in thread order"""
+    items: List[InteractionResponse]
+    next_cursor: Optional[str] = Field(None, serialization_alias='nextCursor')
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class LikedByFriendsResponse(BaseModel):
+    """Connections of the current user who liked a post"""
+    count: int
+    users: List[UserInfo]
@@ -0,0 +1,54 @@
+"""
+Notification Pydantic schemas for API responses
+File: backend/app/schemas/notification.py
+"""
+
+from pydantic import BaseModel, Field, ConfigDict
+from datetime import datetime
+from typing import List, Optional
+from app.models.notification import NotificationType
+from app.schemas.post import datetime_serializer
+
+
+class NotificationActor(BaseModel):
+    """Schema for a user shown on a notification"""
+    id: int
+    full_name: str = Field(..., serialization_alias='fullName')
+    profile_picture_url: Optional[str] = Field(None, serialization_alias='profilePictureUrl')
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+
+class NotificationResponse(BaseModel):
+    """Schema for a (possibly coalesced) notification"""
+    id: int
+    notification_type: NotificationType = Field(..., serialization_alias='notificationType')
+    post_id: Optional[int] = Field(None, serialization_alias='postId')
+    interaction_id: Optional[int] = Field(None, serialization_alias='interactionId')
+    actor_count: int = Field(..., serialization_alias='actorCount')
+    actors: List[NotificationActor] = []
+    message: str
+    is_read: bool = Field(..., serialization_alias='isRead')
+    created_at: datetime = Field(..., serialization_alias='createdAt')
+    updated_at: datetime = Field(..., serialization_alias='updatedAt')
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        json_encoders={datetime: datetime_serializer}
+    )
+
+
+class NotificationPage(BaseModel):
+    """Cursor-paginated page of the notification inbox"""
+    items: List[NotificationResponse]
+    next_cursor: Optional[str] = Field(None, serialization_alias='nextCursor')
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class UnreadCountResponse(BaseModel):
+    """Schema for the unread notification badge"""
+    unread_count: int = Field(..., serialization_alias='unreadCount')
+
+    model_config = ConfigDict(populate_by_name=True)
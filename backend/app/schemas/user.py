@@ -5,7 +5,7 @@ File: backend/app/schemas/user.py
 
 from pydantic import BaseModel, EmailStr, Field, ConfigDict
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 
 def datetime_serializer(dt: datetime) -> str:
@@ -57,6 +57,24 @@ class UserResponse(BaseModel):
     )
 
 
+class UserDirectoryEntry(BaseModel):
+    """Lightweight user entry for the user directory"""
+    id: int
+    email: str
+    full_name: str = Field(..., serialization_alias='fullName')
+    profile_picture_url: Optional[str] = Field(None, serialization_alias='profilePictureUrl')
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+
+class UserDirectoryPage(BaseModel):
+    """Cursor-paginated page of the user directory"""
+    items: List[UserDirectoryEntry]
+    next_cursor: Optional[str] = Field(None, serialization_alias='nextCursor')
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
 class TokenResponse(BaseModel):
     """Schema for authentication token response"""
     access_token: str
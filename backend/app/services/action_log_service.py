@@ -0,0 +1,217 @@
+"""
+Action Log Service
+File: backend/app/services/action_log_service.py
+
+Reads and maintains the agent action log.
+
+History is a keyset page on (created_at, id), newest first, so on
+PostgreSQL a page only touches the one or two monthly partitions it spans.
+
+Maintenance runs in the background (and on demand): it keeps the next few
+monthly partitions created ahead of time and moves months older than the
+retention window to gzip'd JSON-lines files in the archive directory
+(one file per month). On PostgreSQL a month is detached and dropped as a
+whole; elsewhere its rows are deleted after they have been written out.
+"""
+
+import asyncio
+import gzip
+import json
+import os
+from datetime import date, datetime, time as dt_time
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import text, tuple_
+from sqlalchemy.engine import Connection as DBConnection
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.pagination import decode_cursor, encode_cursor
+from app.database import connection as database
+from app.database.partitions import (
+    add_months,
+    ensure_monthly_partitions,
+    is_partitioned,
+    month_start,
+    monthly_partitions,
+)
+from app.models.agent_action import ActionStatus, ActionType, AgentAction
+
+TABLE = "agent_actions"
+
+
+class ActionLogService:
+    """Service for agent action history and action log retention"""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+
+    def get_history(
+        self,
+        db: Session,
+        agent_id: int,
+        cursor: Optional[str] = None,
+        limit: int = 20,
+        action_type: Optional[ActionType] = None,
+        action_status: Optional[ActionStatus] = None,
+    ) -> dict:
+        """
+        Newest-first page of an agent's actions
+
+        Returns:
+            {"items": [AgentAction], "next_cursor": str | None}
+        """
+        query = db.query(AgentAction).filter(AgentAction.agent_id == agent_id)
+        if action_type is not None:
+            query = query.filter(AgentAction.action_type == action_type)
+        if action_status is not None:
+            query = query.filter(AgentAction.status == action_status)
+
+        after = decode_cursor(cursor, 2)
+        if after is not None:
+            try:
+                after_created = datetime.fromisoformat(after[0])
+                after_id = int(after[1])
+            except (TypeError, ValueError):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid cursor"
+                )
+            query = query.filter(
+                tuple_(AgentAction.created_at, AgentAction.id) < (after_created, after_id)
+            )
+
+        rows = (
+            query.order_by(AgentAction.created_at.desc(), AgentAction.id.desc())
+            .limit(limit + 1)
+            .all()
+        )
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor([rows[-1].created_at.isoformat(), rows[-1].id])
+        return {"items": rows, "next_cursor": next_cursor}
+
+    def maintain(self, today: Optional[date] = None) -> List[str]:
+        """
+        Create upcoming partitions and archive months past retention
+
+        Returns:
+            Paths of the archive files written
+        """
+        today = today or datetime.utcnow().date()
+        cutoff = add_months(month_start(today), -settings.action_log_retention_months)
+
+        with database.engine.begin() as conn:
+            if is_partitioned(conn, TABLE):
+                created = ensure_monthly_partitions(
+                    conn, TABLE, today, add_months(today, settings.action_log_partitions_ahead)
+                )
+                for name in created:
+                    print(f"✅ Created partition {name}")
+                partitioned = True
+            else:
+                partitioned = False
+
+        if partitioned:
+            return self._archive_partitions(cutoff)
+        return self._archive_rows(cutoff)
+
+    async def start(self) -> None:
+        """Start the periodic maintenance loop"""
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the maintenance loop"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                archived = await asyncio.to_thread(self.maintain)
+                for path in archived:
+                    print(f"✅ Archived agent actions to {path}")
+            except Exception as e:
+                print(f"⚠️  Action log maintenance failed: {e}")
+            await asyncio.sleep(settings.action_log_maintenance_interval_hours * 3600)
+
+    def _archive_partitions(self, cutoff: date) -> List[str]:
+        """Detach, export and drop whole monthly partitions older than cutoff"""
+        with database.engine.connect() as conn:
+            expired = [(name, month) for name, month in monthly_partitions(conn, TABLE) if month < cutoff]
+
+        written = []
+        for name, month in expired:
+            # One transaction per month: if the export fails the detach rolls back
+            with database.engine.begin() as conn:
+                conn.execute(text(f"ALTER TABLE {TABLE} DETACH PARTITION {name}"))
+                written.append(self._export(conn, month, f"SELECT * FROM {name} ORDER BY id", {}))
+                conn.execute(text(f"DROP TABLE {name}"))
+        return written
+
+    def _archive_rows(self, cutoff: date) -> List[str]:
+        """Export and delete rows older than cutoff, one month at a time"""
+        cutoff_at = datetime.combine(cutoff, dt_time.min)
+        written = []
+        while True:
+            with database.engine.begin() as conn:
+                oldest = conn.execute(
+                    text(f"SELECT min(created_at) FROM {TABLE} WHERE created_at < :cutoff"),
+                    {"cutoff": cutoff_at}
+                ).scalar()
+                if oldest is None:
+                    return written
+                if isinstance(oldest, str):
+                    oldest = datetime.fromisoformat(oldest)
+                month = month_start(oldest)
+                window = {
+                    "start": datetime.combine(month, dt_time.min),
+                    "end": min(datetime.combine(add_months(month, 1), dt_time.min), cutoff_at),
+                }
+                written.append(self._export(
+                    conn, month,
+                    f"SELECT * FROM {TABLE} WHERE created_at >= :start AND created_at < :end ORDER BY id",
+                    window,
+                ))
+                conn.execute(
+                    text(f"DELETE FROM {TABLE} WHERE created_at >= :start AND created_at < :end"), window
+                )
+
+    def _export(self, conn: DBConnection, month: date, sql: str, params: dict) -> str:
+        """Stream a month of rows to <archive_dir>/agent_actions_YYYY_MM.jsonl.gz"""
+        directory = Path(settings.action_log_archive_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        stem = f"{TABLE}_{month.year:04d}_{month.month:02d}"
+        path = directory / f"{stem}.jsonl.gz"
+        suffix = 1
+        while path.exists():
+            # Never overwrite an earlier archive of the same month
+            suffix += 1
+            path = directory / f"{stem}_{suffix}.jsonl.gz"
+        partial = path.with_name(path.name + ".partial")
+
+        result = conn.execution_options(stream_results=True).execute(text(sql), params)
+        with gzip.open(partial, "wt", encoding="utf-8") as archive:
+            self._write_rows(archive, result.keys(), result)
+            archive.flush()
+        # Only a complete file gets the final name
+        os.replace(partial, path)
+        return str(path)
+
+    def _write_rows(self, archive, columns: Iterable[str], rows) -> None:
+        columns = list(columns)
+        for row in rows:
+            archive.write(json.dumps(dict(zip(columns, row)), default=str))
+            archive.write("\n")
+
+
+# Singleton instance
+action_log_service = ActionLogService()
@@ -4,42 +4,68 @@ File: backend/app/services/ai_service.py
 
 Handles AI-powered content generation for agents using Groq LLM.
 Falls back to mock implementation if USE_MOCK_AI=true or no API key configured.
+The Groq client is created on the first generation request, not at import.
 """
 
 import random
 import os
+import time
+from threading import Lock
 from typing import Dict, Any, List, Optional
+from app.core.circuit_breaker import CircuitBreaker
 from app.core.config import settings
+from app.core.metrics import LLM_FALLBACKS, LLM_LATENCY, LLM_TOKENS
 
 
 class AIService:
     """Service for AI-powered content generation"""
 
     def __init__(self):
-        # Check if we should use mock mode
-        self.use_mock = settings.use_mock_ai
-
-        # Initialize Groq client if not in mock mode
-        if not self.use_mock:
-            groq_api_key = settings.groq_api_key
-            if groq_api_key:
-                try:
-                    from groq import Groq
-                    self.groq_client = Groq(api_key=groq_api_key)
-                    self.model = settings.groq_model
-                    print(f"✅ Groq AI initialized with model: {self.model}")
-                except ImportError:
-                    print("⚠️  Groq package not installed. Run: pip install groq")
-                    print("⚠️  Falling back to mock mode")
-                    self.use_mock = True
-                except Exception as e:
-                    print(f"⚠️  Failed to initialize Groq: {e}")
-                    print("⚠️  Falling back to mock mode")
-                    self.use_mock = True
-            else:
-                print("⚠️  GROQ_API_KEY not set. Using mock mode.")
-                print("⚠️  Sign up at groq.com for free API key (no credit card required)")
-                self.use_mock = True
+        # Resolved on first use (see use_mock), so importing the app stays cheap
+        self._use_mock: Optional[bool] = None
+        self._init_lock = Lock()
+        self.groq_client = None
+        self.model = settings.groq_model
+
+        # Skip the provider for a while after repeated API errors
+        self.breaker = CircuitBreaker(
+            "llm",
+            failure_threshold=settings.llm_breaker_failure_threshold,
+            reset_timeout=settings.llm_breaker_reset_seconds,
+        )
+
+    @property
+    def use_mock(self) -> bool:
+        """Whether content is mocked; the Groq client is created on first access"""
+        if self._use_mock is None:
+            with self._init_lock:
+                if self._use_mock is None:
+                    self._use_mock = self._init_client()
+        return self._use_mock
+
+    def _init_client(self) -> bool:
+        """Create the Groq client; returns True when falling back to mock mode"""
+        if settings.use_mock_ai:
+            return True
+
+        groq_api_key = settings.groq_api_key
+        if not groq_api_key:
+            print("⚠️  GROQ_API_KEY not set. Using mock mode.")
+            print("⚠️  Sign up at groq.com for free API key (no credit card required)")
+            return True
+
+        try:
+            from groq import Groq
+            self.groq_client = Groq(api_key=groq_api_key)
+            print(f"✅ Groq AI initialized with model: {self.model}")
+            return False
+        except ImportError:
+            print("⚠️  Groq package not installed. Run: pip install groq")
+            print("⚠️  Falling back to mock mode")
+        except Exception as e:
+            print(f"⚠️  Failed to initialize Groq: {e}")
+            print("⚠️  Falling back to mock mode")
+        return True
 
     async def generate_post_content(
         self,
@@ -58,6 +84,9 @@ class AIService:
         """
         if self.use_mock:
             return self._mock_generate_content(agent_config, context)
+        if not self.breaker.allow():
+            LLM_FALLBACKS.labels("generate_post").inc()
+            return self._mock_generate_content(agent_config, context)
 
         try:
             # Build prompt from agent config
@@ -98,12 +127,12 @@ Guidelines:
 """
 
             # Call Groq API with higher temperature for more creativity
-            response = self.groq_client.chat.completions.create(
+            response = self._complete(
+                "generate_post",
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt}
                 ],
-                model=self.model,
                 temperature=1.0,
                 max_tokens=200,
                 top_p=0.95
@@ -122,6 +151,7 @@ Guidelines:
         except Exception as e:
             print(f"⚠️  Groq API error: {e}")
             print("⚠️  Falling back to mock content")
+            LLM_FALLBACKS.labels("generate_post").inc()
             return self._mock_generate_content(agent_config, context)
 
     async def suggest_response(
@@ -141,6 +171,9 @@ Guidelines:
         """
         if self.use_mock:
             return self._mock_suggest_response(original_content, agent_config)
+        if not self.breaker.allow():
+            LLM_FALLBACKS.labels("suggest_response").inc()
+            return self._mock_suggest_response(original_content, agent_config)
 
         try:
             system_prompt = agent_config.get("system_prompt", "You are a helpful social media assistant.")
@@ -160,12 +193,12 @@ Guidelines:
 - Don't use hashtags
 """
 
-            response = self.groq_client.chat.completions.create(
+            response = self._complete(
+                "suggest_response",
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt}
                 ],
-                model=self.model,
                 temperature=0.7,
                 max_tokens=100,
                 top_p=0.9
@@ -184,8 +217,36 @@ Guidelines:
         except Exception as e:
             print(f"⚠️  Groq API error: {e}")
             print("⚠️  Falling back to mock response")
+            LLM_FALLBACKS.labels("suggest_response").inc()
             return self._mock_suggest_response(original_content, agent_config)
 
+    @property
+    def circuit_state(self) -> str:
+        """"mock" when no provider is configured, else the circuit breaker state"""
+        if self._use_mock is None:
+            return "not_initialized"  # don't load the client just to report on it
+        return "mock" if self._use_mock else self.breaker.state
+
+    def _complete(self, operation: str, **kwargs):
+        """Call the chat completions API, recording latency and token usage"""
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            response = self.groq_client.chat.completions.create(model=self.model, **kwargs)
+            outcome = "ok"
+        finally:
+            LLM_LATENCY.labels(operation, outcome).observe(time.perf_counter() - started)
+            if outcome == "ok":
+                self.breaker.record_success()
+            else:
+                self.breaker.record_failure()
+
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            LLM_TOKENS.labels(operation, "prompt").inc(getattr(usage, "prompt_tokens", 0) or 0)
+            LLM_TOKENS.labels(operation, "completion").inc(getattr(usage, "completion_tokens", 0) or 0)
+        return response
+
     def _mock_generate_content(
         self,
         agent_config: Dict[str, Any],
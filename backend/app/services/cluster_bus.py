@@ -0,0 +1,91 @@
+"""
+Cluster Bus
+File: backend/app/services/cluster_bus.py
+
+Broadcasts changes to per-process state (social graph edges, like bitmaps,
+the local feed cache generation, outbox wake-ups) to every other worker
+and instance, so in-memory copies stay in step when the API runs as
+several processes.
+
+Messages travel over the same broker as realtime events (REALTIME_BROKER),
+on their own channel. With the local broker nothing leaves the process,
+which is correct for a single worker. Messages carry the sender's origin id
+(generated in start(), so workers forked from a preloaded app each get
+their own) and are ignored by the sender, which has already applied the
+change.
+Delivery is best effort: every receiver's state is also bounded by its own
+TTLs or reload.
+"""
+
+import asyncio
+import uuid
+from typing import Any, Callable, Dict, Optional
+
+import orjson
+
+from app.core.config import settings
+
+Handler = Callable[[Any], None]
+
+
+class ClusterBus:
+    """Fire-and-forget broadcast of state changes between processes"""
+
+    def __init__(self, channel: str = "cluster"):
+        self.channel = channel
+        self.origin: Optional[str] = None  # Set per process in start(), after any pre-fork import
+        self._handlers: Dict[str, Handler] = {}
+        self._broker = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def handler(self, kind: str):
+        """Decorator registering the function applying messages of a kind"""
+        def register(func: Handler) -> Handler:
+            self._handlers[kind] = func
+            return func
+        return register
+
+    async def start(self) -> None:
+        """Connect the broker; called from the app lifespan"""
+        from app.services.realtime import make_broker
+
+        self.origin = uuid.uuid4().hex
+        self._loop = asyncio.get_running_loop()
+        broker = make_broker(settings.realtime_broker, channel=self.channel)
+        await broker.start(self._receive)
+        self._broker = broker
+
+    async def stop(self) -> None:
+        if self._broker is not None:
+            await self._broker.stop()
+        self._broker = None
+
+    def publish(self, kind: str, data: Any = None) -> None:
+        """Tell the other processes about a change (thread-safe, never blocks)"""
+        if self._broker is None:
+            return
+        message = orjson.dumps({"o": self.origin, "k": kind, "d": data})
+        try:
+            on_loop = asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            self._broker.publish(message)
+        else:
+            self._loop.call_soon_threadsafe(self._broker.publish, message)
+
+    def _receive(self, message: bytes) -> None:
+        decoded = orjson.loads(message)
+        if decoded["o"] == self.origin:
+            return
+        handler = self._handlers.get(decoded["k"])
+        if handler is None:
+            return
+        try:
+            handler(decoded["d"])
+        except Exception as e:
+            print(f"⚠️  Cluster message {decoded['k']} failed: {e}")
+
+
+# Singleton instance
+cluster_bus = ClusterBus()
@@ -0,0 +1,251 @@
+"""
+Comment Thread Service
+File: backend/app/services/comment_thread_service.py
+
+Reply threads over comments using a materialized path.
+
+Every comment stores thread_id (its top-level comment), depth and path
+("0000000012/0000000034"). Ordering by path is depth-first thread order and
+the subtree under a comment is the range (path + "/", path + "0"), so:
+
+- a page of threads with the first K replies each is one statement
+  (roots subquery + ROW_NUMBER() over each thread),
+- "load more replies" is a keyset range scan on (thread_id, path),
+- reply_count on every ancestor is kept up to date on write, so the UI
+  knows how many replies are hidden without counting.
+
+Deleting a comment un-counts only that comment. A deleted top-level
+comment that still has live replies is listed as a tombstone (isDeleted,
+no content or author) so its replies stay visible.
+"""
+
+from typing import Dict, List, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.core.pagination import decode_cursor, encode_cursor
+from app.models.interaction import (
+    ActorType,
+    Interaction,
+    InteractionType,
+    path_ancestor_ids,
+    path_segment,
+)
+from app.models.post import Post
+from app.models.user import User
+from app.schemas.encoders import INTERACTION_ROW_COLUMNS, interaction_row_to_dict
+
+# Deepest reply level accepted (keeps paths and indentation bounded)
+MAX_THREAD_DEPTH = 8
+
+_interactions = Interaction.__table__
+
+
+class CommentThreadService:
+    """Service for writing and loading threaded comments"""
+
+    def add_comment(
+        self, db: Session, post: Post, user_id: int, content: str, parent_id: Optional[int] = None
+    ) -> Interaction:
+        """
+        Create a comment or reply and maintain thread columns (does not commit)
+
+        Raises:
+            HTTPException: If the parent comment is missing, on another post
+                or already at the maximum depth
+        """
+        parent = None
+        if parent_id is not None:
+            parent = db.query(Interaction).filter(
+                Interaction.id == parent_id,
+                Interaction.interaction_type == InteractionType.COMMENT,
+                Interaction.is_deleted == False
+            ).first()
+            if not parent or parent.post_id != post.id:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Parent comment not found"
+                )
+            if parent.depth >= MAX_THREAD_DEPTH:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Reply nesting is too deep"
+                )
+
+        comment = Interaction(
+            user_id=user_id,
+            post_id=post.id,
+            parent_interaction_id=parent_id,
+            interaction_type=InteractionType.COMMENT,
+            actor_type=ActorType.HUMAN,
+            content=content,
+            depth=parent.depth + 1 if parent else 0,
+            reply_count=0,
+        )
+        db.add(comment)
+        db.flush()  # The path needs the new id
+
+        if parent is None:
+            comment.thread_id = comment.id
+            comment.path = path_segment(comment.id)
+        else:
+            comment.thread_id = parent.thread_id
+            comment.path = f"{parent.path}/{path_segment(comment.id)}"
+            self._adjust_reply_counts(db, path_ancestor_ids(parent.path), 1)
+
+        return comment
+
+    def remove_comment(self, db: Session, comment: Interaction) -> None:
+        """Soft-delete a comment and un-count it from its ancestors (does not commit)"""
+        if comment.is_deleted:
+            return  # Already un-counted
+        comment.is_deleted = True
+        if comment.path and comment.depth:
+            self._adjust_reply_counts(db, path_ancestor_ids(comment.path)[:-1], -1)
+
+    def get_threads(
+        self,
+        db: Session,
+        post_id: int,
+        cursor: Optional[str] = None,
+        limit: int = 20,
+        replies_per_thread: int = 3,
+    ) -> dict:
+        """
+        Page of top-level comments (oldest first), each with its first replies
+
+        Returns:
+            {"items": [thread dicts], "nextCursor": str | None}
+        """
+        after = decode_cursor(cursor, 1)
+
+        # Deleted roots with live replies stay, as tombstones, so the replies remain reachable
+        roots = select(Interaction.id).where(
+            Interaction.post_id == post_id,
+            Interaction.depth == 0,
+            Interaction.interaction_type == InteractionType.COMMENT,
+            or_(Interaction.is_deleted == False, Interaction.reply_count > 0),
+        )
+        if after is not None:
+            roots = roots.where(Interaction.id > self._cursor_int(after[0]))
+        roots = roots.order_by(Interaction.id).limit(limit + 1)
+
+        position = func.row_number().over(
+            partition_by=Interaction.thread_id, order_by=Interaction.path
+        ).label("position")
+        ranked = (
+            select(Interaction.id.label("id"), position)
+            .where(
+                Interaction.thread_id.in_(roots.scalar_subquery()),
+                Interaction.interaction_type == InteractionType.COMMENT,
+                or_(Interaction.is_deleted == False, Interaction.depth == 0),
+            )
+            .subquery()
+        )
+
+        # Root is position 1 in its thread, then its replies in path order
+        rows = (
+            db.query(*INTERACTION_ROW_COLUMNS, Interaction.path)
+            .join(ranked, ranked.c.id == Interaction.id)
+            .outerjoin(User, User.id == Interaction.user_id)
+            .filter(ranked.c.position <= replies_per_thread + 1)
+            .order_by(Interaction.thread_id, Interaction.path)
+            .all()
+        )
+
+        threads: List[dict] = []
+        last_reply_paths: Dict[int, str] = {}
+        for row in rows:
+            item = interaction_row_to_dict(row[:-1])
+            if item["depth"] == 0:
+                if item["isDeleted"]:
+                    item.update(content="", user=None)
+                item["replies"] = []
+                threads.append(item)
+            elif threads and threads[-1]["id"] == item["threadId"]:
+                threads[-1]["replies"].append(item)
+                last_reply_paths[item["threadId"]] = row[-1]
+
+        next_cursor = None
+        if len(threads) > limit:
+            threads = threads[:limit]
+            next_cursor = encode_cursor([threads[-1]["id"]])
+
+        for thread in threads:
+            replies = thread["replies"]
+            thread["repliesCursor"] = (
+                encode_cursor([last_reply_paths[thread["id"]]])
+                if replies and thread["replyCount"] > len(replies) else None
+            )
+
+        return {"items": threads, "nextCursor": next_cursor}
+
+    def get_replies(
+        self, db: Session, comment: Interaction, cursor: Optional[str] = None, limit: int = 20
+    ) -> dict:
+        """
+        Replies under a comment in thread order, continuing after cursor
+
+        Returns:
+            {"items": [reply dicts], "nextCursor": str | None}
+        """
+        after = decode_cursor(cursor, 1)
+        lower = comment.path + "/"
+        if after is not None:
+            after_path = str(after[0])
+            if not after_path.startswith(lower):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid cursor"
+                )
+            lower = after_path
+
+        rows = (
+            db.query(*INTERACTION_ROW_COLUMNS, Interaction.path)
+            .outerjoin(User, User.id == Interaction.user_id)
+            .filter(
+                Interaction.thread_id == comment.thread_id,
+                Interaction.path > lower,
+                # "0" sorts right after "/", closing the subtree range
+                Interaction.path < comment.path + "0",
+                Interaction.interaction_type == InteractionType.COMMENT,
+                Interaction.is_deleted == False,
+            )
+            .order_by(Interaction.path)
+            .limit(limit + 1)
+            .all()
+        )
+
+        page = rows[:limit]
+        items = [interaction_row_to_dict(row[:-1]) for row in page]
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = encode_cursor([page[-1][-1]])
+        return {"items": items, "nextCursor": next_cursor}
+
+    def _adjust_reply_counts(self, db: Session, ancestor_ids: List[int], delta: int) -> None:
+        """Add delta to reply_count on every ancestor in one statement"""
+        db.execute(
+            update(_interactions)
+            .where(_interactions.c.id.in_(ancestor_ids))
+            # Replies are not edits: keep the ancestors' updated_at
+            .values(
+                reply_count=func.coalesce(_interactions.c.reply_count, 0) + delta,
+                updated_at=_interactions.c.updated_at,
+            )
+        )
+
+    def _cursor_int(self, value) -> int:
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
+
+
+# Singleton instance
+comment_thread_service = CommentThreadService()
@@ -0,0 +1,223 @@
+"""
+Event Bus
+File: backend/app/services/event_bus.py
+
+Transactional outbox for domain events.
+
+Route handlers call record_event() before committing, so the event row is
+written atomically with the change it describes - an event exists if and
+only if the change does. The dispatcher, a background task started in the
+app lifespan, then delivers pending events to in-process consumers in
+batches, grouped by event type. Only the elected leader process runs the
+dispatcher (see app/services/leader_election.py); other workers wake it
+through the cluster bus.
+
+Delivery is at-least-once: an event is marked processed only after every
+consumer for its type succeeded, and a failing batch is retried with
+exponential backoff (one event at a time, so a single bad event cannot
+hold back its neighbours). Consumers must therefore be idempotent.
+"""
+
+import asyncio
+import inspect
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.database import connection as database
+from app.models.outbox_event import OutboxEvent
+from app.services.cluster_bus import cluster_bus
+
+Consumer = Callable[[Session, List[OutboxEvent]], Union[None, Awaitable[None]]]
+
+MAX_RETRY_DELAY_SECONDS = 300
+PURGE_INTERVAL_SECONDS = 600
+
+
+def record_event(db: Session, event_type: str, payload: Dict[str, Any]) -> None:
+    """Add an event to the current transaction (delivered after commit)"""
+    db.add(OutboxEvent(event_type=event_type, payload=payload))
+    db.info["outbox_pending"] = True
+
+
+class EventDispatcher:
+    """Delivers outbox events to registered consumers in batches"""
+
+    def __init__(self):
+        self._consumers: Dict[str, List[Consumer]] = defaultdict(list)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def consumer(self, event_type: str):
+        """Decorator registering a consumer for an event type"""
+        def register(handler: Consumer) -> Consumer:
+            self._consumers[event_type].append(handler)
+            return handler
+        return register
+
+    async def start(self) -> None:
+        """Start the background dispatch loop"""
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the dispatch loop (undelivered events stay in the outbox)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self._wakeup = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def wake(self) -> None:
+        """Dispatch now instead of waiting for the next poll (thread-safe)"""
+        if self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def _run(self) -> None:
+        last_purge = time.monotonic()
+        while True:
+            try:
+                delivered = await self.dispatch_batch()
+                if time.monotonic() - last_purge > PURGE_INTERVAL_SECONDS:
+                    self.purge_processed()
+                    last_purge = time.monotonic()
+            except Exception as e:
+                print(f"⚠️  Event dispatcher error: {e}")
+                delivered = 0
+
+            # A full batch means more are probably waiting
+            if delivered >= settings.outbox_batch_size:
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=settings.outbox_poll_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def dispatch_batch(self) -> int:
+        """
+        Deliver one batch of pending events
+
+        Returns:
+            Number of events claimed
+        """
+        db = database.SessionLocal()
+        try:
+            now = datetime.utcnow()
+            query = (
+                db.query(OutboxEvent)
+                .filter(
+                    OutboxEvent.processed_at == None,
+                    OutboxEvent.attempts < settings.outbox_max_attempts,
+                    OutboxEvent.available_at <= now,
+                )
+                .order_by(OutboxEvent.id)
+                .limit(settings.outbox_batch_size)
+            )
+            if db.get_bind().dialect.name == "postgresql":
+                # Several instances can dispatch without double-claiming
+                query = query.with_for_update(skip_locked=True)
+            events = query.all()
+            if not events:
+                return 0
+
+            by_type: Dict[str, List[OutboxEvent]] = defaultdict(list)
+            for outbox_event in events:
+                by_type[outbox_event.event_type].append(outbox_event)
+
+            for event_type, batch in by_type.items():
+                error = await self._deliver(db, event_type, batch)
+                if error is None:
+                    self._mark_processed(batch, now)
+                elif len(batch) == 1:
+                    self._mark_failed(batch[0], error, now)
+                else:
+                    # Isolate the failing event(s)
+                    for outbox_event in batch:
+                        single_error = await self._deliver(db, event_type, [outbox_event])
+                        if single_error is None:
+                            self._mark_processed([outbox_event], now)
+                        else:
+                            self._mark_failed(outbox_event, single_error, now)
+
+            db.commit()
+            return len(events)
+        finally:
+            db.close()
+
+    def purge_processed(self) -> int:
+        """Delete delivered events older than the retention window"""
+        cutoff = datetime.utcnow() - timedelta(hours=settings.outbox_retention_hours)
+        db = database.SessionLocal()
+        try:
+            deleted = (
+                db.query(OutboxEvent)
+                .filter(OutboxEvent.processed_at != None, OutboxEvent.processed_at < cutoff)
+                .delete(synchronize_session=False)
+            )
+            db.commit()
+            return deleted
+        finally:
+            db.close()
+
+    async def _deliver(self, db: Session, event_type: str, batch: List[OutboxEvent]) -> Optional[Exception]:
+        """Run every consumer for a batch inside a savepoint"""
+        try:
+            with db.begin_nested():
+                for handler in self._consumers.get(event_type, ()):
+                    result = handler(db, batch)
+                    if inspect.isawaitable(result):
+                        await result
+        except Exception as e:
+            return e
+        return None
+
+    def _mark_processed(self, batch: List[OutboxEvent], now: datetime) -> None:
+        for outbox_event in batch:
+            outbox_event.processed_at = now
+
+    def _mark_failed(self, outbox_event: OutboxEvent, error: Exception, now: datetime) -> None:
+        outbox_event.attempts += 1
+        outbox_event.last_error = repr(error)[:1000]
+        delay = min(2 ** outbox_event.attempts, MAX_RETRY_DELAY_SECONDS)
+        outbox_event.available_at = now + timedelta(seconds=delay)
+        print(f"⚠️  Event {outbox_event.id} ({outbox_event.event_type}) failed, attempt {outbox_event.attempts}: {error}")
+
+
+# Singleton instance
+event_dispatcher = EventDispatcher()
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_dispatcher(session: Session) -> None:
+    """Deliver right after a commit that recorded events"""
+    if session.info.pop("outbox_pending", False):
+        if event_dispatcher.running:
+            event_dispatcher.wake()
+        else:
+            # The dispatcher runs on the leader worker only
+            cluster_bus.publish("outbox.wake")
+
+
+@cluster_bus.handler("outbox.wake")
+def _on_outbox_wake(data) -> None:
+    event_dispatcher.wake()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _clear_pending(session: Session, previous_transaction) -> None:
+    session.info.pop("outbox_pending", None)
@@ -0,0 +1,146 @@
+"""
+Event consumers
+File: backend/app/services/event_consumers.py
+
+Derived work that runs off the request path, driven by outbox events:
+global feed cache invalidation, notifications, realtime pushes and agent
+learning. Importing this module registers the consumers with the
+dispatcher.
+
+Consumers receive a whole batch of events of one type, must not commit
+(the dispatcher commits once per batch) and must be idempotent, since
+delivery is at-least-once.
+"""
+
+from typing import Dict, Iterable, List
+
+from sqlalchemy.orm import Session, joinedload
+
+from app.models.connection import Connection
+from app.models.interaction import Interaction
+from app.models.notification import NotificationType
+from app.models.outbox_event import OutboxEvent
+from app.models.post import Post
+from app.services.event_bus import event_dispatcher
+from app.services.feed_cache import global_feed_cache
+from app.services.learning_service import learning_service
+from app.services.notification_service import NotificationEvent, notification_service
+from app.services.realtime import (
+    publish_comment_created,
+    publish_comment_liked,
+    publish_connection_event,
+    publish_post_created,
+    publish_post_liked,
+)
+
+
+def _load(db: Session, model, ids: Iterable[int], *options) -> Dict[int, object]:
+    """Fetch rows for a batch in one query, keyed by id"""
+    ids = set(ids)
+    if not ids:
+        return {}
+    return {row.id: row for row in db.query(model).options(*options).filter(model.id.in_(ids)).all()}
+
+
+@event_dispatcher.consumer("post.published")
+def on_post_published(db: Session, events: List[OutboxEvent]) -> None:
+    global_feed_cache.invalidate()
+    posts = _load(db, Post, (e.payload["postId"] for e in events), joinedload(Post.author))
+    for post in posts.values():
+        publish_post_created(post)
+
+
+@event_dispatcher.consumer("post.updated")
+@event_dispatcher.consumer("post.deleted")
+def on_post_changed(db: Session, events: List[OutboxEvent]) -> None:
+    # One invalidation covers the whole batch
+    global_feed_cache.invalidate()
+
+
+@event_dispatcher.consumer("post.liked")
+def on_post_liked(db: Session, events: List[OutboxEvent]) -> None:
+    posts = _load(db, Post, (e.payload["postId"] for e in events))
+    notification_service.notify(db, [
+        NotificationEvent(
+            posts[e.payload["postId"]].user_id, NotificationType.POST_LIKED,
+            e.payload["userId"], post_id=e.payload["postId"],
+        )
+        for e in events if e.payload["postId"] in posts
+    ])
+    for e in events:
+        post = posts.get(e.payload["postId"])
+        if post is not None:
+            publish_post_liked(post, e.payload["userId"])
+
+
+@event_dispatcher.consumer("comment.created")
+def on_comment_created(db: Session, events: List[OutboxEvent]) -> None:
+    posts = _load(db, Post, (e.payload["postId"] for e in events))
+    comments = _load(db, Interaction, (e.payload["commentId"] for e in events), joinedload(Interaction.user))
+    notification_service.notify(db, [
+        NotificationEvent(
+            posts[e.payload["postId"]].user_id, NotificationType.POST_COMMENTED,
+            e.payload["userId"], post_id=e.payload["postId"],
+        )
+        for e in events if e.payload["postId"] in posts
+    ])
+    for e in events:
+        post = posts.get(e.payload["postId"])
+        comment = comments.get(e.payload["commentId"])
+        if post is not None and comment is not None:
+            publish_comment_created(post, comment)
+
+
+@event_dispatcher.consumer("comment.liked")
+def on_comment_liked(db: Session, events: List[OutboxEvent]) -> None:
+    comments = _load(db, Interaction, (e.payload["commentId"] for e in events))
+    notification_service.notify(db, [
+        NotificationEvent(
+            comments[e.payload["commentId"]].user_id, NotificationType.COMMENT_LIKED,
+            e.payload["userId"], post_id=comments[e.payload["commentId"]].post_id,
+            interaction_id=e.payload["commentId"],
+        )
+        for e in events if e.payload["commentId"] in comments
+    ])
+    for e in events:
+        comment = comments.get(e.payload["commentId"])
+        if comment is not None:
+            publish_comment_liked(comment, e.payload["userId"])
+
+
+@event_dispatcher.consumer("connection.requested")
+def on_connection_requested(db: Session, events: List[OutboxEvent]) -> None:
+    notification_service.notify(db, [
+        NotificationEvent(e.payload["targetId"], NotificationType.CONNECTION_REQUESTED, e.payload["userId"])
+        for e in events
+    ])
+    connections = _load(db, Connection, (e.payload["connectionId"] for e in events))
+    for e in events:
+        connection = connections.get(e.payload["connectionId"])
+        if connection is not None:
+            publish_connection_event(connection, "connection.requested", e.payload["targetId"])
+
+
+@event_dispatcher.consumer("connection.accepted")
+def on_connection_accepted(db: Session, events: List[OutboxEvent]) -> None:
+    notification_service.notify(db, [
+        NotificationEvent(e.payload["requesterId"], NotificationType.CONNECTION_ACCEPTED, e.payload["userId"])
+        for e in events
+    ])
+    connections = _load(db, Connection, (e.payload["connectionId"] for e in events))
+    for e in events:
+        connection = connections.get(e.payload["connectionId"])
+        if connection is not None:
+            publish_connection_event(connection, "connection.accepted", e.payload["requesterId"])
+
+
+@event_dispatcher.consumer("agent_action.approved")
+async def on_agent_action_approved(db: Session, events: List[OutboxEvent]) -> None:
+    for e in events:
+        await learning_service.log_user_feedback(e.payload["actionId"], "positive")
+
+
+@event_dispatcher.consumer("agent_action.rejected")
+async def on_agent_action_rejected(db: Session, events: List[OutboxEvent]) -> None:
+    for e in events:
+        await learning_service.log_user_feedback(e.payload["actionId"], "negative")
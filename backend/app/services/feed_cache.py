@@ -0,0 +1,94 @@
+"""
+Global feed cache
+File: backend/app/services/feed_cache.py
+
+Caches the first pages of the global feed as ready-to-send JSON bytes.
+
+The global feed is identical for every user, so the hottest pages are
+serialized once and served straight from cache. Keys include a generation
+counter that is bumped whenever a post is published, edited or deleted,
+which invalidates every cached page at once (across all processes when the
+shared backend is used). Like/comment counts may lag by up to the TTL.
+Pages are always filled from the primary database, never a read replica.
+"""
+
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache, make_byte_cache
+from app.core.config import settings
+from app.database import connection as database
+from app.schemas.encoders import encode_post_rows
+from app.services.cluster_bus import cluster_bus
+from app.services.feed_service import feed_service
+
+_GENERATION_KEY = "generation"
+
+
+class GlobalFeedCache:
+    """Pre-serialized cache of the first pages of the global feed"""
+
+    def __init__(self):
+        self._local = TTLCache(
+            "global_feed",
+            ttl_seconds=settings.global_feed_cache_ttl_seconds,
+            max_entries=64,
+        )
+        self._shared = (
+            make_byte_cache("global_feed", settings.cache_backend)
+            if settings.cache_backend != "local" else None
+        )
+        self._local_generation = 0
+
+    def is_cacheable(self, skip: int, limit: int) -> bool:
+        """Only the first global_feed_cache_depth posts are cached"""
+        return skip + limit <= settings.global_feed_cache_depth
+
+    def get_page(self, db: Session, skip: int, limit: int) -> bytes:
+        """Get a page of the global feed as serialized JSON"""
+        key = f"{self._generation()}:{skip}:{limit}"
+
+        body = self._local.get(key)
+        if body is not None:
+            return body
+
+        if self._shared is not None:
+            body = self._shared.get(key)
+
+        if body is None:
+            if db.info.get("replica"):
+                # Cached pages outlive replication lag: fill them from the primary,
+                # or a page missing a just-published post is served for the whole TTL
+                with database.SessionLocal() as primary:
+                    rows = feed_service.get_global_feed(db=primary, skip=skip, limit=limit)
+            else:
+                rows = feed_service.get_global_feed(db=db, skip=skip, limit=limit)
+            body = encode_post_rows(rows)
+            if self._shared is not None:
+                self._shared.set(key, body, settings.global_feed_cache_ttl_seconds)
+
+        self._local.set(key, body)
+        return body
+
+    def invalidate(self, broadcast: bool = True) -> None:
+        """Drop every cached page (call after a post is published, edited or deleted)"""
+        self._local_generation += 1
+        self._local.clear()
+        if self._shared is not None:
+            self._shared.incr(_GENERATION_KEY)
+        elif broadcast:
+            # Other workers keep their own local copies
+            cluster_bus.publish("feed.invalidate")
+
+    def _generation(self) -> str:
+        if self._shared is not None:
+            return str(self._shared.get_counter(_GENERATION_KEY))
+        return str(self._local_generation)
+
+
+# Singleton instance
+global_feed_cache = GlobalFeedCache()
+
+
+@cluster_bus.handler("feed.invalidate")
+def _on_feed_invalidated(data) -> None:
+    global_feed_cache.invalidate(broadcast=False)
@@ -5,11 +5,14 @@ File: backend/app/services/feed_service.py
 Handles feed generation and filtering logic.
 """
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, Query
 from typing import List
 
 from app.models.post import Post, PostStatus
-from app.models.connection import Connection, ConnectionStatus
+from app.models.user import User
+from app.schemas.encoders import POST_ROW_COLUMNS
+from app.services.social_graph import social_graph
 
 
 class FeedService:
@@ -17,38 +20,22 @@ class FeedService:
 
     def get_personalized_feed(
         self, user_id: int, db: Session, skip: int = 0, limit: int = 20
-    ) -> List[Post]:
+    ) -> List[Row]:
         """
         Get personalized feed for user showing:
         1. User's own posts (both manual and agent)
         2. Posts from users with accepted connections
         3. Ordered by created_at descending
         """
-        # Get user's accepted connection IDs
-        connections = (
-            db.query(Connection)
-            .filter(
-                ((Connection.user_id == user_id) | (Connection.connected_user_id == user_id)),
-                Connection.status == ConnectionStatus.ACCEPTED,
-            )
-            .all()
-        )
-
-        # Build list of user IDs to include in feed
-        connection_user_ids = set()
-        for conn in connections:
-            if conn.user_id == user_id:
-                connection_user_ids.add(conn.connected_user_id)
-            else:
-                connection_user_ids.add(conn.user_id)
+        # Accepted connections come from the in-memory social graph
+        connection_user_ids = list(social_graph.neighbors(user_id))
 
         # Add current user to see their own posts
-        connection_user_ids.add(user_id)
+        connection_user_ids.append(user_id)
 
         # Query posts from user and connections
         posts = (
-            db.query(Post)
-            .options(joinedload(Post.author))
+            self.post_rows(db)
             .filter(
                 Post.user_id.in_(connection_user_ids),
                 Post.is_deleted == False,
@@ -64,14 +51,13 @@ class FeedService:
 
     def get_global_feed(
         self, db: Session, skip: int = 0, limit: int = 20
-    ) -> List[Post]:
+    ) -> List[Row]:
         """
         Get global feed showing all published posts for discovery.
         Useful for finding new users to connect with.
         """
         posts = (
-            db.query(Post)
-            .options(joinedload(Post.author))
+            self.post_rows(db)
             .filter(
                 Post.is_deleted == False,
                 Post.status == PostStatus.PUBLISHED,
@@ -86,14 +72,13 @@ class FeedService:
 
     def get_user_feed(
         self, user_id: int, db: Session, skip: int = 0, limit: int = 20
-    ) -> List[Post]:
+    ) -> List[Row]:
         """
         Get all published posts for a specific user.
         Same as posts.get_user_posts but kept here for consistency.
         """
         posts = (
-            db.query(Post)
-            .options(joinedload(Post.author))
+            self.post_rows(db)
             .filter(
                 Post.user_id == user_id,
                 Post.is_deleted == False,
@@ -107,6 +92,15 @@ class FeedService:
 
         return posts
 
+    def post_rows(self, db: Session) -> Query:
+        """
+        Query selecting only the columns PostResponse needs (post + author)
+
+        Rows are plain tuples ready for encode_post_rows; no Post/User
+        entities are hydrated and private user columns are never fetched.
+        """
+        return db.query(*POST_ROW_COLUMNS).outerjoin(User, User.id == Post.user_id)
+
 
 # Singleton instance
 feed_service = FeedService()
@@ -0,0 +1,195 @@
+"""
+Health Service
+File: backend/app/services/health_service.py
+
+Liveness and readiness checks for the load balancer.
+
+Liveness only says the process is serving requests. Readiness checks the
+dependencies: a timed SELECT 1, connection pool saturation, the LLM
+circuit breaker, Supabase Storage reachability and read replica lag. The
+database and the pool decide readiness; an open LLM circuit, unreachable
+storage or lagging replicas only mark the instance as degraded, since
+requests still succeed without them (mock content, no avatar uploads,
+reads served by the primary).
+
+Results are cached for settings.health_cache_seconds and concurrent probes
+share one check, so frequent probing stays cheap.
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import text
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.database import connection as database
+
+OK = "ok"
+DEGRADED = "degraded"
+ERROR = "error"
+
+# Checks that make the instance unready when they fail
+CRITICAL_CHECKS = ("database", "pool")
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 2)
+
+
+class HealthService:
+    """Service for liveness and readiness probes"""
+
+    def __init__(self):
+        self._started_at = time.monotonic()
+        self._results = TTLCache("health_probes", ttl_seconds=settings.health_cache_seconds, max_entries=4)
+        self._lock: Optional[asyncio.Lock] = None
+
+    def liveness(self) -> dict:
+        """The process is up and the event loop is responsive"""
+        return {"status": "alive", "uptimeSeconds": int(time.monotonic() - self._started_at)}
+
+    async def warm_up(self) -> dict:
+        """Open the first pooled connection (the database check alone, uncached)"""
+        return await self._check_database()
+
+    async def readiness(self) -> dict:
+        """
+        Dependency checks, cached for a few seconds
+
+        Returns:
+            {"status": healthy|degraded|unhealthy, "ready": bool, "checks": {...}, "checkedAt": str}
+        """
+        cached = self._results.get("ready")
+        if cached is not None:
+            return cached
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            cached = self._results.get("ready")
+            if cached is None:
+                cached = await self._check_all()
+                self._results.set("ready", cached)
+            return cached
+
+    async def _check_all(self) -> dict:
+        database_check, storage_check, replicas_check = await asyncio.gather(
+            self._check_database(), self._check_storage(), asyncio.to_thread(self._check_replicas)
+        )
+        checks = {
+            "database": database_check,
+            "pool": self._check_pool(),
+            "llm": self._check_llm(),
+            "storage": storage_check,
+            "replicas": replicas_check,
+        }
+
+        ready = all(checks[name]["status"] == OK for name in CRITICAL_CHECKS)
+        if not ready:
+            overall = "unhealthy"
+        elif any(check["status"] != OK for check in checks.values()):
+            overall = "degraded"
+        else:
+            overall = "healthy"
+        return {
+            "status": overall,
+            "ready": ready,
+            "checks": checks,
+            "checkedAt": datetime.utcnow().isoformat() + "Z",
+        }
+
+    async def _check_database(self) -> dict:
+        """Round trip of SELECT 1 through the pool"""
+        if database.engine is None:
+            return {"status": ERROR, "detail": "Database engine not initialized"}
+
+        def ping():
+            with database.engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(asyncio.to_thread(ping), timeout=settings.health_check_timeout_seconds)
+        except asyncio.TimeoutError:
+            return {"status": ERROR, "latencyMs": _elapsed_ms(started), "detail": "Timed out"}
+        except Exception as e:
+            return {"status": ERROR, "latencyMs": _elapsed_ms(started), "detail": str(e)[:200]}
+        return {"status": OK, "latencyMs": _elapsed_ms(started)}
+
+    def _check_pool(self) -> dict:
+        """Share of pooled connections currently checked out"""
+        if database.engine is None:
+            return {"status": ERROR, "detail": "Database engine not initialized"}
+
+        pool = database.engine.pool
+        if not hasattr(pool, "checkedout") or not hasattr(pool, "size"):
+            return {"status": OK, "detail": f"{type(pool).__name__} is not bounded"}
+
+        in_use = pool.checkedout()
+        max_overflow = getattr(pool, "_max_overflow", 0)
+        if max_overflow < 0:
+            return {"status": OK, "inUse": in_use, "detail": "Unbounded overflow"}
+        capacity = pool.size() + max_overflow
+        saturation = in_use / capacity if capacity else 0.0
+        return {
+            "status": OK if saturation <= settings.health_pool_saturation_limit else ERROR,
+            "inUse": in_use,
+            "capacity": capacity,
+            "saturation": round(saturation, 3),
+        }
+
+    def _check_replicas(self) -> dict:
+        """Read replicas caught up enough to serve reads"""
+        if not database.replica_engines:
+            return {"status": OK, "detail": "Not configured"}
+
+        from app.database.replicas import replica_router
+
+        lags = [replica_router.lag(index) for index in range(len(database.replica_engines))]
+        usable = sum(1 for lag in lags if lag <= settings.replica_max_lag_seconds)
+        return {
+            "status": OK if usable == len(lags) else DEGRADED,
+            "usable": usable,
+            "total": len(lags),
+            "lagSeconds": [round(lag, 3) if lag != float("inf") else None for lag in lags],
+        }
+
+    def _check_llm(self) -> dict:
+        """LLM provider circuit state (no API call is made)"""
+        from app.services.ai_service import ai_service
+
+        state = ai_service.circuit_state
+        return {"status": DEGRADED if state == "open" else OK, "circuit": state}
+
+    async def _check_storage(self) -> dict:
+        """Supabase Storage answers for the avatar bucket"""
+        if settings.storage_backend != "supabase":
+            return {"status": OK, "detail": f"{settings.storage_backend} storage"}
+        if not settings.supabase_url or not settings.supabase_service_key:
+            return {"status": OK, "detail": "Not configured"}
+
+        import httpx
+
+        from app.services.storage_service import storage_service
+
+        url = f"{settings.supabase_url.rstrip('/')}/storage/v1/bucket/{storage_service.bucket_name}"
+        headers = {
+            "apikey": settings.supabase_service_key,
+            "Authorization": f"Bearer {settings.supabase_service_key}",
+        }
+        started = time.perf_counter()
+        try:
+            async with httpx.AsyncClient(timeout=settings.health_check_timeout_seconds) as client:
+                response = await client.get(url, headers=headers)
+        except httpx.HTTPError as e:
+            return {"status": DEGRADED, "latencyMs": _elapsed_ms(started), "detail": type(e).__name__}
+        if response.status_code != 200:
+            return {"status": DEGRADED, "latencyMs": _elapsed_ms(started), "detail": f"HTTP {response.status_code}"}
+        return {"status": OK, "latencyMs": _elapsed_ms(started)}
+
+
+# Singleton instance
+health_service = HealthService()
@@ -0,0 +1,155 @@
+"""
+Leader election
+File: backend/app/services/leader_election.py
+
+Makes sure background jobs (the outbox dispatcher, action log maintenance)
+run in exactly one process when the API runs as several workers or
+machines.
+
+On PostgreSQL the leader holds a session-level advisory lock on a
+dedicated connection; if that connection dies the lock is released and
+another process takes over on its next attempt. Elsewhere (SQLite in
+development) an exclusive file lock elects one worker per machine.
+
+Every process retries every settings.leader_check_interval_seconds, and the
+leader re-checks that its lock connection is still alive.
+"""
+
+import asyncio
+import os
+import tempfile
+import zlib
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.database import connection as database
+
+Job = Callable[[], Awaitable[None]]
+
+
+class LeaderElection:
+    """Runs registered jobs only while this process holds the leader lock"""
+
+    def __init__(self, name: str = "scheduler"):
+        self.name = name
+        self.is_leader = False
+        self._jobs: List[Tuple[Job, Job]] = []
+        self._task: Optional[asyncio.Task] = None
+        self._lock_conn = None  # PostgreSQL connection holding the advisory lock
+        self._lock_file = None
+
+    @property
+    def lock_key(self) -> int:
+        """Stable advisory lock key derived from the election name"""
+        return zlib.crc32(f"agentsocial:{self.name}".encode())
+
+    def register(self, start: Job, stop: Job) -> None:
+        """Run start() when elected and stop() when demoted or shutting down"""
+        self._jobs.append((start, stop))
+
+    async def start(self) -> None:
+        """Try to become leader now, then keep trying in the background"""
+        await self._check()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the jobs and give up leadership"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        if self.is_leader:
+            await self._demote()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(settings.leader_check_interval_seconds)
+            await self._check()
+
+    async def _check(self) -> None:
+        try:
+            if self.is_leader:
+                if not await asyncio.to_thread(self._still_held):
+                    print(f"⚠️  Lost '{self.name}' leadership")
+                    await self._demote()
+            elif await asyncio.to_thread(self._try_acquire):
+                await self._elect()
+        except Exception as e:
+            print(f"⚠️  Leader election error: {e}")
+
+    async def _elect(self) -> None:
+        self.is_leader = True
+        print(f"✅ Elected '{self.name}' leader (pid {os.getpid()})")
+        for start, _ in self._jobs:
+            await start()
+
+    async def _demote(self) -> None:
+        for _, stop in reversed(self._jobs):
+            try:
+                await stop()
+            except Exception as e:
+                print(f"⚠️  Failed to stop job: {e}")
+        self.is_leader = False
+        await asyncio.to_thread(self._release)
+
+    def _try_acquire(self) -> bool:
+        if database.engine.dialect.name == "postgresql":
+            conn = database.engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+            try:
+                acquired = conn.execute(
+                    text("SELECT pg_try_advisory_lock(:key)"), {"key": self.lock_key}
+                ).scalar()
+            except Exception:
+                conn.close()
+                raise
+            if not acquired:
+                conn.close()
+                return False
+            self._lock_conn = conn
+            return True
+
+        try:
+            import fcntl
+        except ImportError:
+            return True  # No file locking (Windows): assume a single process
+
+        path = os.path.join(tempfile.gettempdir(), f"agentsocial-{self.name}.lock")
+        lock_file = open(path, "w")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self._lock_file = lock_file
+        return True
+
+    def _still_held(self) -> bool:
+        if self._lock_conn is None:
+            return True  # File locks last as long as the process
+        try:
+            self._lock_conn.execute(text("SELECT 1"))
+            return True
+        except Exception:
+            return False
+
+    def _release(self) -> None:
+        if self._lock_conn is not None:
+            try:
+                self._lock_conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": self.lock_key})
+            except Exception:
+                pass  # Connection already gone, which released the lock
+            finally:
+                self._lock_conn.close()
+                self._lock_conn = None
+        if self._lock_file is not None:
+            self._lock_file.close()  # Closing drops the flock
+            self._lock_file = None
+
+
+# Singleton instance
+leader_election = LeaderElection()
@@ -56,3 +56,7 @@ class LearningService:
         # TODO: Identify unsuccessful patterns
         # TODO: Update agent preferences
         pass
+
+
+# Singleton instance
+learning_service = LearningService()
@@ -0,0 +1,243 @@
+"""
+Like Service
+File: backend/app/services/like_service.py
+
+Writes and answers membership questions about likes.
+
+Likes live in the narrow likes table (see app/models/like.py). Writes are a
+single conflict-free insert or delete plus an atomic like_count update on
+the target, so concurrent double-clicks cannot create duplicates or lose
+counts.
+
+For reads, each hot target's likers are kept in a MembershipBitmap in a
+per-process TTL cache, so "has this user liked it" and "which of my friends
+liked it" are bit tests instead of queries. Cached bitmaps are updated
+after commit (never for rolled-back writes) and the change is broadcast on
+the cluster bus to the other workers; the TTL bounds how stale a copy can
+get if a broadcast is missed.
+"""
+
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import case, delete, event, func, insert, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.bitmap import MembershipBitmap
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.database import connection as database
+from app.models.interaction import Interaction
+from app.models.like import Like, LikeTargetType
+from app.models.post import Post
+from app.services.cluster_bus import cluster_bus
+from app.services.social_graph import social_graph
+
+_likes = Like.__table__
+_targets = {
+    LikeTargetType.POST: Post.__table__,
+    LikeTargetType.COMMENT: Interaction.__table__,
+}
+
+
+class LikeService:
+    """Service for liking, unliking and like membership lookups"""
+
+    def __init__(self):
+        self._members = TTLCache(
+            "like_members",
+            ttl_seconds=settings.like_index_ttl_seconds,
+            max_entries=settings.like_index_max_targets,
+        )
+        self._lock = Lock()
+        # Key -> one buffer per bitmap being loaded, collecting the changes
+        # committed meanwhile so they can be replayed onto the loaded copy
+        self._loading: Dict[Tuple[LikeTargetType, int], List[List[Tuple[int, bool]]]] = {}
+
+    def add_like(self, db: Session, target_type: LikeTargetType, target_id: int, user_id: int) -> bool:
+        """
+        Like a target and bump its like_count (does not commit)
+
+        Returns:
+            False if the user had already liked it
+        """
+        row = {"target_type": target_type, "target_id": target_id, "user_id": user_id}
+        dialect = db.get_bind().dialect.name
+
+        if dialect in ("postgresql", "sqlite"):
+            statement = (pg_insert if dialect == "postgresql" else sqlite_insert)(_likes)
+            created = db.execute(statement.on_conflict_do_nothing(), [row]).rowcount == 1
+        else:
+            try:
+                with db.begin_nested():
+                    db.execute(insert(_likes), [row])
+                created = True
+            except IntegrityError:
+                created = False
+
+        if created:
+            self._adjust_like_count(db, target_type, target_id, 1)
+            self._queue_change(db, target_type, target_id, user_id, True)
+        return created
+
+    def remove_like(self, db: Session, target_type: LikeTargetType, target_id: int, user_id: int) -> bool:
+        """
+        Unlike a target and decrement its like_count (does not commit)
+
+        Returns:
+            False if there was no like to remove
+        """
+        result = db.execute(
+            delete(_likes).where(
+                _likes.c.target_type == target_type,
+                _likes.c.target_id == target_id,
+                _likes.c.user_id == user_id,
+            )
+        )
+        if not result.rowcount:
+            return False
+        self._adjust_like_count(db, target_type, target_id, -1)
+        self._queue_change(db, target_type, target_id, user_id, False)
+        return True
+
+    def has_liked(self, db: Session, target_type: LikeTargetType, target_id: int, user_id: int) -> bool:
+        """Whether user_id has liked the target"""
+        members = self.members(db, target_type, target_id)
+        if members is not None:
+            return user_id in members
+        return db.query(Like.user_id).filter(
+            Like.target_type == target_type,
+            Like.target_id == target_id,
+            Like.user_id == user_id,
+        ).first() is not None
+
+    def liked_by_friends(self, db: Session, post_id: int, user_id: int, limit: int = 3) -> Tuple[int, List[int]]:
+        """
+        Which of user_id's connections liked a post
+
+        Returns:
+            (total friends who liked it, up to limit of their ids)
+        """
+        friends = social_graph.neighbors(user_id)
+        if not friends:
+            return 0, []
+
+        members = self.members(db, LikeTargetType.POST, post_id)
+        if members is not None:
+            return members.count_in(friends), members.select(friends, limit)
+
+        liked = [
+            row[0] for row in db.query(Like.user_id).filter(
+                Like.target_type == LikeTargetType.POST,
+                Like.target_id == post_id,
+                Like.user_id.in_(list(friends)),
+            ).order_by(Like.user_id).all()
+        ]
+        return len(liked), liked[:limit]
+
+    def members(self, db: Session, target_type: LikeTargetType, target_id: int) -> Optional[MembershipBitmap]:
+        """Cached bitmap of every user who liked the target (None when the cache is off)"""
+        if not settings.like_index_enabled:
+            return None
+        key = (target_type, target_id)
+        members = self._members.get(key)
+        if members is None:
+            missed: List[Tuple[int, bool]] = []
+            with self._lock:
+                self._loading.setdefault(key, []).append(missed)
+            try:
+                if db.info.get("replica"):
+                    # Committed likes patch the cached bitmap from now on, so it must
+                    # start from the primary: a lagging replica's copy would stay stale
+                    with database.SessionLocal() as primary:
+                        members = self._load_members(primary, target_type, target_id)
+                else:
+                    members = self._load_members(db, target_type, target_id)
+            finally:
+                with self._lock:
+                    buffers = [buffer for buffer in self._loading[key] if buffer is not missed]
+                    if buffers:
+                        self._loading[key] = buffers
+                    else:
+                        del self._loading[key]
+                    if members is not None:
+                        # A like committed during the query may not be in its result,
+                        # and apply_committed found nothing cached to patch
+                        for user_id, liked in missed:
+                            if liked:
+                                members.add(user_id)
+                            else:
+                                members.discard(user_id)
+                        self._members.set(key, members)
+        return members
+
+    def _load_members(self, db: Session, target_type: LikeTargetType, target_id: int) -> MembershipBitmap:
+        return MembershipBitmap(
+            row[0] for row in db.query(Like.user_id).filter(
+                Like.target_type == target_type,
+                Like.target_id == target_id,
+            )
+        )
+
+    def apply_committed(self, changes: List[Tuple[LikeTargetType, int, int, bool]], broadcast: bool = True) -> None:
+        """Reflect committed likes/unlikes in the cached bitmaps (of every worker)"""
+        with self._lock:
+            for target_type, target_id, user_id, liked in changes:
+                for missed in self._loading.get((target_type, target_id), ()):
+                    missed.append((user_id, liked))
+                members = self._members.get((target_type, target_id))
+                if members is None:
+                    continue  # Not cached; the next read loads it fresh
+                if liked:
+                    members.add(user_id)
+                else:
+                    members.discard(user_id)
+        if broadcast:
+            cluster_bus.publish("likes.changed", [
+                [target_type.name, target_id, user_id, liked] for target_type, target_id, user_id, liked in changes
+            ])
+
+    def _adjust_like_count(self, db: Session, target_type: LikeTargetType, target_id: int, delta: int) -> None:
+        """Atomic like_count change on the post or comment"""
+        table = _targets[target_type]
+        current = func.coalesce(table.c.like_count, 0)
+        db.execute(
+            update(table)
+            .where(table.c.id == target_id)
+            # A like is not an edit: keep the target's updated_at
+            .values(
+                like_count=current + delta if delta > 0 else case((current > 0, current + delta), else_=0),
+                updated_at=table.c.updated_at,
+            )
+        )
+
+    def _queue_change(self, db: Session, target_type: LikeTargetType, target_id: int, user_id: int, liked: bool) -> None:
+        db.info.setdefault("like_changes", []).append((target_type, target_id, user_id, liked))
+
+
+# Singleton instance
+like_service = LikeService()
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_like_changes(session: Session) -> None:
+    """Update cached like bitmaps once the write is durable"""
+    changes = session.info.pop("like_changes", None)
+    if changes:
+        like_service.apply_committed(changes)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_like_changes(session: Session, previous_transaction) -> None:
+    session.info.pop("like_changes", None)
+
+
+@cluster_bus.handler("likes.changed")
+def _on_likes_changed(data) -> None:
+    like_service.apply_committed(
+        [(LikeTargetType[target_type], target_id, user_id, liked) for target_type, target_id, user_id, liked in data],
+        broadcast=False,
+    )
@@ -0,0 +1,362 @@
+"""
+Notification Service
+File: backend/app/services/notification_service.py
+
+Writes and reads the notifications inbox.
+
+notify() takes a batch of events and:
+1. drops self-notifications and coalesces events for the same
+   (recipient, group_key) in memory,
+2. folds them into the recipient's existing unread row for that group when
+   there is one ("Ana and 11 others liked your post"), counting each actor
+   once (notification_actors records who was counted until the row is read),
+3. inserts the remaining groups with one executemany INSERT,
+4. bumps the unread counters with one executemany upsert.
+
+It never commits; callers write notifications in the same transaction as
+the change that caused them.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import case, delete, insert, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.core.pagination import decode_cursor, encode_cursor
+from app.models.notification import Notification, NotificationActor, NotificationCounter, NotificationType
+from app.models.user import User
+
+# How many recent actors are kept on a row for display
+MAX_STORED_ACTORS = 3
+
+_VERBS: Dict[NotificationType, str] = {
+    NotificationType.POST_LIKED: "liked your post",
+    NotificationType.POST_COMMENTED: "commented on your post",
+    NotificationType.COMMENT_LIKED: "liked your comment",
+    NotificationType.CONNECTION_REQUESTED: "sent you a connection request",
+    NotificationType.CONNECTION_ACCEPTED: "accepted your connection request",
+}
+
+_counters = NotificationCounter.__table__
+_notifications = Notification.__table__
+_actors = NotificationActor.__table__
+
+
+class NotificationEvent(NamedTuple):
+    """Something that happened to user_id, caused by actor_id"""
+    user_id: int
+    notification_type: NotificationType
+    actor_id: int
+    post_id: Optional[int] = None
+    interaction_id: Optional[int] = None
+
+
+def group_key(event: NotificationEvent) -> str:
+    """Events sharing a key are coalesced into one unread notification"""
+    if event.notification_type in (NotificationType.POST_LIKED, NotificationType.POST_COMMENTED):
+        subject = event.post_id
+    elif event.notification_type == NotificationType.COMMENT_LIKED:
+        subject = event.interaction_id
+    else:
+        # Connection events are per person and never coalesce
+        subject = event.actor_id
+    return f"{event.notification_type.value}:{subject}"
+
+
+def summarize(notification_type: NotificationType, names: List[str], actor_count: int) -> str:
+    """Human-readable line such as "Ana and 11 others liked your post" """
+    verb = _VERBS[notification_type]
+    if not names:
+        return f"Someone {verb}"
+    if actor_count == 1:
+        return f"{names[0]} {verb}"
+    if actor_count == 2 and len(names) > 1:
+        return f"{names[0]} and {names[1]} {verb}"
+    others = actor_count - 1
+    return f"{names[0]} and {others} other{'s' if others > 1 else ''} {verb}"
+
+
+class NotificationService:
+    """Service for writing, coalescing and paging notifications"""
+
+    def notify(self, db: Session, events: Iterable[NotificationEvent]) -> List[int]:
+        """
+        Record a batch of events (does not commit)
+
+        Returns:
+            Ids of users whose unread count went up
+        """
+        now = datetime.utcnow()
+
+        # 1. Coalesce within the batch; later events are more recent
+        groups: Dict[Tuple[int, str], dict] = {}
+        for event in events:
+            if event.user_id == event.actor_id:
+                continue
+            key = (event.user_id, group_key(event))
+            group = groups.get(key)
+            if group is None:
+                groups[key] = {"event": event, "actors": [event.actor_id]}
+            elif event.actor_id not in group["actors"]:
+                group["actors"].insert(0, event.actor_id)
+        if not groups:
+            return []
+
+        # 2. Fold into existing unread rows
+        existing = (
+            db.query(Notification)
+            .filter(
+                tuple_(Notification.user_id, Notification.group_key).in_(list(groups)),
+                Notification.is_read == False,
+            )
+            .all()
+        )
+        folded = [
+            (notification, groups.pop((notification.user_id, notification.group_key)))
+            for notification in existing
+            if (notification.user_id, notification.group_key) in groups
+        ]
+        counted = self._counted_actors(db, [
+            (notification.id, actor)
+            for notification, group in folded
+            for actor in set(group["actors"]) | set(notification.actor_ids or [])
+        ])
+        actor_rows = []
+        for notification, group in folded:
+            stored = list(notification.actor_ids or [])
+            # Rows from before notification_actors only know their displayed actors
+            new_actors = [
+                actor for actor in group["actors"]
+                if actor not in stored and (notification.id, actor) not in counted
+            ]
+            notification.actor_count += len(new_actors)
+            actor_rows.extend(
+                {"notification_id": notification.id, "actor_id": actor}
+                for actor in set(group["actors"]) | set(stored)
+                if (notification.id, actor) not in counted
+            )
+            notification.actor_ids = (group["actors"] + [a for a in stored if a not in group["actors"]])[:MAX_STORED_ACTORS]
+            notification.last_actor_id = group["actors"][0]
+            notification.updated_at = now
+
+        if not groups:
+            self._add_actors(db, actor_rows)
+            return []
+
+        # 3. New groups in one batched insert
+        rows = []
+        group_actors: List[List[int]] = []
+        increments: Dict[int, int] = {}
+        for (user_id, key), group in groups.items():
+            event = group["event"]
+            rows.append({
+                "user_id": user_id,
+                "notification_type": event.notification_type,
+                "group_key": key,
+                "post_id": event.post_id,
+                "interaction_id": event.interaction_id,
+                "actor_count": len(group["actors"]),
+                "actor_ids": group["actors"][:MAX_STORED_ACTORS],
+                "last_actor_id": group["actors"][0],
+                "is_read": False,
+                "created_at": now,
+                "updated_at": now,
+            })
+            group_actors.append(group["actors"])
+            increments[user_id] = increments.get(user_id, 0) + 1
+        ids = db.execute(
+            insert(Notification).returning(Notification.id, sort_by_parameter_order=True), rows
+        ).scalars().all()
+        actor_rows.extend(
+            {"notification_id": notification_id, "actor_id": actor}
+            for notification_id, actors in zip(ids, group_actors)
+            for actor in actors
+        )
+        self._add_actors(db, actor_rows)
+
+        # 4. Unread counters
+        self._increment_counters(db, increments)
+        return list(increments)
+
+    def unread_count(self, db: Session, user_id: int) -> int:
+        """Unread total from the counter row (no COUNT(*) over the inbox)"""
+        count = db.query(NotificationCounter.unread_count).filter(
+            NotificationCounter.user_id == user_id
+        ).scalar()
+        return count or 0
+
+    def get_page(
+        self, db: Session, user_id: int, cursor: Optional[str] = None, limit: int = 20
+    ) -> dict:
+        """
+        Newest-first page of a user's inbox
+
+        Returns:
+            {"items": [...], "next_cursor": str | None}
+        """
+        after = decode_cursor(cursor, 2)
+        query = db.query(
+            Notification.id,
+            Notification.notification_type,
+            Notification.post_id,
+            Notification.interaction_id,
+            Notification.actor_count,
+            Notification.actor_ids,
+            Notification.is_read,
+            Notification.created_at,
+            Notification.updated_at,
+        ).filter(Notification.user_id == user_id)
+
+        if after is not None:
+            try:
+                after_updated = datetime.fromisoformat(after[0])
+                after_id = int(after[1])
+            except (TypeError, ValueError):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid cursor"
+                )
+            query = query.filter(
+                tuple_(Notification.updated_at, Notification.id) < (after_updated, after_id)
+            )
+
+        rows = (
+            query.order_by(Notification.updated_at.desc(), Notification.id.desc())
+            .limit(limit + 1)
+            .all()
+        )
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        # One lookup for every actor shown on the page
+        actor_ids = {actor for row in rows for actor in (row.actor_ids or [])}
+        actors = {}
+        if actor_ids:
+            actors = {
+                actor.id: actor
+                for actor in db.query(User.id, User.full_name, User.profile_picture_url)
+                .filter(User.id.in_(actor_ids))
+                .all()
+            }
+
+        items = []
+        for row in rows:
+            row_actors = [actors[a] for a in (row.actor_ids or []) if a in actors]
+            items.append({
+                "id": row.id,
+                "notification_type": row.notification_type,
+                "post_id": row.post_id,
+                "interaction_id": row.interaction_id,
+                "actor_count": row.actor_count,
+                "actors": row_actors,
+                "message": summarize(
+                    row.notification_type, [a.full_name for a in row_actors], row.actor_count
+                ),
+                "is_read": row.is_read,
+                "created_at": row.created_at,
+                "updated_at": row.updated_at,
+            })
+
+        next_cursor = None
+        if has_more and rows:
+            next_cursor = encode_cursor([rows[-1].updated_at.isoformat(), rows[-1].id])
+        return {"items": items, "next_cursor": next_cursor}
+
+    def mark_read(self, db: Session, user_id: int, notification_id: int) -> bool:
+        """
+        Mark one notification read (does not commit)
+
+        Returns:
+            True if it was unread before
+        """
+        result = db.execute(
+            update(_notifications)
+            .where(
+                _notifications.c.id == notification_id,
+                _notifications.c.user_id == user_id,
+                _notifications.c.is_read == False,
+            )
+            # Keep the inbox order: reading is not activity
+            .values(is_read=True, updated_at=_notifications.c.updated_at)
+        )
+        if result.rowcount:
+            # Read rows are never folded into again
+            db.execute(delete(_actors).where(_actors.c.notification_id == notification_id))
+            db.execute(
+                update(_counters)
+                .where(_counters.c.user_id == user_id)
+                .values(unread_count=case(
+                    (_counters.c.unread_count > 0, _counters.c.unread_count - 1),
+                    else_=0,
+                ))
+            )
+        return bool(result.rowcount)
+
+    def mark_all_read(self, db: Session, user_id: int) -> None:
+        """Mark the whole inbox read and reset the counter (does not commit)"""
+        db.execute(
+            delete(_actors).where(_actors.c.notification_id.in_(
+                select(_notifications.c.id).where(
+                    _notifications.c.user_id == user_id, _notifications.c.is_read == False
+                )
+            ))
+        )
+        db.execute(
+            update(_notifications)
+            .where(_notifications.c.user_id == user_id, _notifications.c.is_read == False)
+            .values(is_read=True, updated_at=_notifications.c.updated_at)
+        )
+        db.execute(
+            update(_counters).where(_counters.c.user_id == user_id).values(unread_count=0)
+        )
+
+    def _counted_actors(self, db: Session, pairs: List[Tuple[int, int]]) -> Set[Tuple[int, int]]:
+        """The (notification_id, actor_id) pairs already counted"""
+        if not pairs:
+            return set()
+        rows = db.execute(
+            select(_actors.c.notification_id, _actors.c.actor_id)
+            .where(tuple_(_actors.c.notification_id, _actors.c.actor_id).in_(pairs))
+        )
+        return {tuple(row) for row in rows}
+
+    def _add_actors(self, db: Session, rows: List[dict]) -> None:
+        """Record counted actors, ignoring ones a concurrent transaction recorded first"""
+        if not rows:
+            return
+        dialect = db.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            db.execute((pg_insert if dialect == "postgresql" else sqlite_insert)(_actors).on_conflict_do_nothing(), rows)
+        else:
+            db.execute(insert(_actors), rows)
+
+    def _increment_counters(self, db: Session, increments: Dict[int, int]) -> None:
+        """Add to unread counters, creating missing rows, in one statement"""
+        rows = [{"user_id": user_id, "unread_count": n} for user_id, n in increments.items()]
+        dialect = db.get_bind().dialect.name
+
+        if dialect in ("postgresql", "sqlite"):
+            upsert = (pg_insert if dialect == "postgresql" else sqlite_insert)(_counters)
+            upsert = upsert.on_conflict_do_update(
+                index_elements=[_counters.c.user_id],
+                set_={"unread_count": _counters.c.unread_count + upsert.excluded.unread_count},
+            )
+            db.execute(upsert, rows)
+            return
+
+        for row in rows:
+            result = db.execute(
+                update(_counters)
+                .where(_counters.c.user_id == row["user_id"])
+                .values(unread_count=_counters.c.unread_count + row["unread_count"])
+            )
+            if not result.rowcount:
+                db.execute(insert(_counters), [row])
+
+
+# Singleton instance
+notification_service = NotificationService()
@@ -0,0 +1,280 @@
+"""
+Quota Service
+File: backend/app/services/quota_service.py
+
+Daily action quota for agents (settings.agent_max_actions_per_day).
+
+The day is a calendar day in the agent's timezone (preferences["timezone"],
+else settings.quota_timezone), identified by a window key such as
+"2025-03-14". Consuming a unit is a single atomic check-and-increment, so
+concurrent requests and multiple instances can never go past the cap:
+
+- database (default): one conditional UPDATE on the agent row that resets
+  the counter when the window changed and otherwise only increments while
+  under the limit,
+- redis: INCR + EXPIRE in a Lua script, shared by every instance,
+- local: an in-process counter (single instance / development).
+
+Whatever the backend, the agent row's actions_today/actions_window mirror
+the current window so API responses show the right count.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime, time as dt_time, timedelta, timezone
+from threading import Lock
+from typing import Dict, NamedTuple, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from sqlalchemy import case, func, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.core.cache import get_redis_client
+from app.core.config import settings
+from app.models.agent import Agent
+
+_agents = Agent.__table__
+
+# Keys outlive their window a little so late refunds still find them
+_EXPIRY_SLACK_SECONDS = 3600
+
+_REDIS_CONSUME = """
+local used = redis.call('INCR', KEYS[1])
+if used == 1 then redis.call('EXPIRE', KEYS[1], ARGV[2]) end
+if used > tonumber(ARGV[1]) then
+    redis.call('DECR', KEYS[1])
+    return -1
+end
+return used
+"""
+
+
+class QuotaStatus(NamedTuple):
+    """Result of a quota check or consume"""
+    allowed: bool
+    limit: int
+    used: int
+    reset_at: datetime  # UTC, naive like the rest of the app
+
+    @property
+    def remaining(self) -> int:
+        return max(self.limit - self.used, 0)
+
+    @property
+    def retry_after_seconds(self) -> int:
+        return max(int((self.reset_at - datetime.utcnow()).total_seconds()), 0)
+
+    def headers(self) -> Dict[str, str]:
+        """Response headers describing the quota"""
+        return {
+            "X-Quota-Limit": str(self.limit),
+            "X-Quota-Remaining": str(self.remaining),
+            "X-Quota-Reset": self.reset_at.isoformat() + "Z",
+        }
+
+    def as_dict(self) -> dict:
+        return {
+            "limit": self.limit,
+            "used": self.used,
+            "remaining": self.remaining,
+            "resetAt": self.reset_at.isoformat() + "Z",
+        }
+
+
+class QuotaBackend(ABC):
+    """Interface for atomic per-window counters"""
+
+    @abstractmethod
+    def consume(self, db: Session, agent_id: int, window: str, limit: int, ttl_seconds: int) -> Optional[int]:
+        """Increment if under limit; returns the new count, or None if the limit was reached"""
+
+    @abstractmethod
+    def refund(self, db: Session, agent_id: int, window: str) -> None:
+        ...
+
+    @abstractmethod
+    def used(self, db: Session, agent: Agent, window: str) -> int:
+        ...
+
+
+class DatabaseQuotaBackend(QuotaBackend):
+    """Counter kept on the agent row, changed by conditional UPDATEs"""
+
+    def consume(self, db: Session, agent_id: int, window: str, limit: int, ttl_seconds: int) -> Optional[int]:
+        same_window = _agents.c.actions_window == window
+        used = func.coalesce(_agents.c.actions_today, 0)
+        now = datetime.utcnow()
+        result = db.execute(
+            update(_agents)
+            .where(
+                _agents.c.id == agent_id,
+                or_(_agents.c.actions_window.is_(None), ~same_window, used < limit),
+            )
+            .values(
+                actions_today=case((same_window, used + 1), else_=1),
+                actions_window=window,
+                last_action_at=now,
+                last_action_date=now,
+                updated_at=_agents.c.updated_at,
+            )
+        )
+        if not result.rowcount:
+            return None
+        return db.execute(select(_agents.c.actions_today).where(_agents.c.id == agent_id)).scalar()
+
+    def refund(self, db: Session, agent_id: int, window: str) -> None:
+        db.execute(
+            update(_agents)
+            .where(
+                _agents.c.id == agent_id,
+                _agents.c.actions_window == window,
+                _agents.c.actions_today > 0,
+            )
+            .values(actions_today=_agents.c.actions_today - 1, updated_at=_agents.c.updated_at)
+        )
+
+    def used(self, db: Session, agent: Agent, window: str) -> int:
+        return (agent.actions_today or 0) if agent.actions_window == window else 0
+
+
+class RedisQuotaBackend(QuotaBackend):
+    """Counter shared by every instance through Redis"""
+
+    def __init__(self, prefix: str = "quota:agent_actions:"):
+        self.prefix = prefix
+        self._client = get_redis_client()
+        self._consume = self._client.register_script(_REDIS_CONSUME)
+
+    def consume(self, db: Session, agent_id: int, window: str, limit: int, ttl_seconds: int) -> Optional[int]:
+        used = int(self._consume(keys=[self._key(agent_id, window)], args=[limit, ttl_seconds]))
+        return None if used < 0 else used
+
+    def refund(self, db: Session, agent_id: int, window: str) -> None:
+        key = self._key(agent_id, window)
+        if int(self._client.decr(key)) < 0:
+            self._client.set(key, 0, keepttl=True)
+
+    def used(self, db: Session, agent: Agent, window: str) -> int:
+        value = self._client.get(self._key(agent.id, window))
+        return int(value) if value is not None else 0
+
+    def _key(self, agent_id: int, window: str) -> str:
+        return f"{self.prefix}{agent_id}:{window}"
+
+
+class LocalQuotaBackend(QuotaBackend):
+    """In-process counter (state is per worker)"""
+
+    def __init__(self):
+        self._counts: Dict[int, Tuple[str, int]] = {}  # agent_id -> (window, used)
+        self._lock = Lock()
+
+    def consume(self, db: Session, agent_id: int, window: str, limit: int, ttl_seconds: int) -> Optional[int]:
+        with self._lock:
+            current_window, used = self._counts.get(agent_id, (window, 0))
+            if current_window != window:
+                used = 0
+            if used >= limit:
+                return None
+            self._counts[agent_id] = (window, used + 1)
+            return used + 1
+
+    def refund(self, db: Session, agent_id: int, window: str) -> None:
+        with self._lock:
+            current_window, used = self._counts.get(agent_id, (window, 0))
+            if current_window == window and used > 0:
+                self._counts[agent_id] = (window, used - 1)
+
+    def used(self, db: Session, agent: Agent, window: str) -> int:
+        current_window, used = self._counts.get(agent.id, (window, 0))
+        return used if current_window == window else 0
+
+
+def make_quota_backend(backend: str) -> QuotaBackend:
+    """Build the quota backend for the configured name ("database", "redis" or "local")"""
+    if backend == "redis":
+        return RedisQuotaBackend()
+    if backend == "local":
+        return LocalQuotaBackend()
+    return DatabaseQuotaBackend()
+
+
+class QuotaService:
+    """Service for the per-agent daily action quota"""
+
+    def __init__(self):
+        self._backend: Optional[QuotaBackend] = None
+
+    @property
+    def backend(self) -> QuotaBackend:
+        if self._backend is None:
+            self._backend = make_quota_backend(settings.quota_backend)
+        return self._backend
+
+    def window(self, agent: Agent, now: Optional[datetime] = None) -> Tuple[str, datetime]:
+        """
+        Current quota window of an agent
+
+        Returns:
+            (window key, UTC time the window ends)
+        """
+        zone = self._zone(agent)
+        local_now = (now or datetime.utcnow()).replace(tzinfo=timezone.utc).astimezone(zone)
+        next_midnight = datetime.combine(local_now.date() + timedelta(days=1), dt_time.min, tzinfo=zone)
+        reset_at = next_midnight.astimezone(timezone.utc).replace(tzinfo=None)
+        return local_now.date().isoformat(), reset_at
+
+    def consume(self, db: Session, agent: Agent) -> QuotaStatus:
+        """
+        Atomically take one action from today's quota (does not commit)
+
+        Returns:
+            QuotaStatus with allowed=False when the limit was already reached
+        """
+        limit = settings.agent_max_actions_per_day
+        window, reset_at = self.window(agent)
+        ttl = int((reset_at - datetime.utcnow()).total_seconds()) + _EXPIRY_SLACK_SECONDS
+
+        used = self.backend.consume(db, agent.id, window, limit, ttl)
+        if used is None:
+            return QuotaStatus(False, limit, limit, reset_at)
+
+        if not isinstance(self.backend, DatabaseQuotaBackend):
+            # Mirror the shared count onto the agent row for API responses
+            now = datetime.utcnow()
+            db.execute(
+                update(_agents)
+                .where(_agents.c.id == agent.id)
+                .values(
+                    actions_today=used, actions_window=window,
+                    last_action_at=now, last_action_date=now,
+                    updated_at=_agents.c.updated_at,
+                )
+            )
+        db.expire(agent)
+        return QuotaStatus(True, limit, used, reset_at)
+
+    def refund(self, db: Session, agent: Agent) -> None:
+        """Give back one unit after the action failed (does not commit)"""
+        window, _ = self.window(agent)
+        self.backend.refund(db, agent.id, window)
+        if not isinstance(self.backend, DatabaseQuotaBackend):
+            DatabaseQuotaBackend().refund(db, agent.id, window)
+        db.expire(agent)
+
+    def peek(self, db: Session, agent: Agent) -> QuotaStatus:
+        """Current usage without consuming anything"""
+        limit = settings.agent_max_actions_per_day
+        window, reset_at = self.window(agent)
+        used = min(self.backend.used(db, agent, window), limit)
+        return QuotaStatus(used < limit, limit, used, reset_at)
+
+    def _zone(self, agent: Agent) -> ZoneInfo:
+        name = (agent.preferences or {}).get("timezone") or settings.quota_timezone
+        try:
+            return ZoneInfo(name)
+        except (ZoneInfoNotFoundError, ValueError):
+            return ZoneInfo("UTC")
+
+
+# Singleton instance
+quota_service = QuotaService()
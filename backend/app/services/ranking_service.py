@@ -0,0 +1,224 @@
+"""
+Ranking Service
+File: backend/app/services/ranking_service.py
+
+Ranked "For You" feed.
+
+Candidates are recent posts from the user's connections (plus their own)
+and globally trending posts. Each scorer maps the whole candidate set to a
+column of scores in one pass; the final score is the weighted sum of those
+columns. The ranked id list is cached per user for a short TTL so paging
+through it only fetches the posts on the requested page.
+"""
+
+import math
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.connection import ConnectionType
+from app.models.post import Post, PostStatus, PostType
+from app.services.cluster_bus import cluster_bus
+from app.services.feed_service import feed_service
+from app.services.social_graph import social_graph
+
+# Relationship strength used by the affinity scorer
+CONNECTION_AFFINITY: Dict[ConnectionType, float] = {
+    ConnectionType.CLOSE_FRIEND: 1.0,
+    ConnectionType.FRIEND: 0.7,
+    ConnectionType.PROFESSIONAL: 0.5,
+    ConnectionType.ACQUAINTANCE: 0.3,
+}
+OWN_POST_AFFINITY = 0.6
+RECENCY_HALF_LIFE_HOURS = 12.0
+AGENT_POST_WEIGHT = 0.6
+
+
+class CandidateColumns:
+    """Column-oriented features for a candidate set (one list per feature)"""
+
+    __slots__ = ("post_ids", "age_hours", "like_counts", "comment_counts", "affinities", "is_agent")
+
+    def __init__(self):
+        self.post_ids: List[int] = []
+        self.age_hours: List[float] = []
+        self.like_counts: List[int] = []
+        self.comment_counts: List[int] = []
+        self.affinities: List[float] = []
+        self.is_agent: List[bool] = []
+
+    def __len__(self) -> int:
+        return len(self.post_ids)
+
+
+Scorer = Callable[[CandidateColumns], Sequence[float]]
+
+
+def recency_scorer(columns: CandidateColumns) -> List[float]:
+    """Exponential decay with a fixed half-life"""
+    decay = math.log(2) / RECENCY_HALF_LIFE_HOURS
+    return [math.exp(-decay * age) for age in columns.age_hours]
+
+
+def velocity_scorer(columns: CandidateColumns) -> List[float]:
+    """Engagement per hour since posting (comments count double), log-damped"""
+    return [
+        math.log1p((likes + 2 * comments) / (age + 2.0))
+        for likes, comments, age in zip(columns.like_counts, columns.comment_counts, columns.age_hours)
+    ]
+
+
+def affinity_scorer(columns: CandidateColumns) -> List[float]:
+    """Strength of the viewer's relationship with the author"""
+    return columns.affinities
+
+
+def author_type_scorer(columns: CandidateColumns) -> List[float]:
+    """Prefer posts written by humans over agent-generated posts"""
+    return [AGENT_POST_WEIGHT if agent else 1.0 for agent in columns.is_agent]
+
+
+class RankingService:
+    """Service for scoring and ranking feed candidates"""
+
+    def __init__(self):
+        self._scorers: List[Tuple[str, float, Scorer]] = [
+            ("recency", 1.0, recency_scorer),
+            ("velocity", 0.8, velocity_scorer),
+            ("affinity", 1.2, affinity_scorer),
+            ("author_type", 0.5, author_type_scorer),
+        ]
+        self._cache = TTLCache(
+            "ranked_feed",
+            ttl_seconds=settings.feed_rank_cache_ttl_seconds,
+            max_entries=10000,
+        )
+
+    def register_scorer(self, name: str, scorer: Scorer, weight: float = 1.0) -> None:
+        """Add or replace a scorer; cached rankings are dropped"""
+        self._scorers = [entry for entry in self._scorers if entry[0] != name]
+        self._scorers.append((name, weight, scorer))
+        self._cache.clear()
+
+    def remove_scorer(self, name: str) -> None:
+        """Remove a scorer by name; cached rankings are dropped"""
+        self._scorers = [entry for entry in self._scorers if entry[0] != name]
+        self._cache.clear()
+
+    def invalidate(self, user_id: Optional[int] = None, broadcast: bool = True) -> None:
+        """Drop the cached ranking for one user, or for everyone (in every worker)"""
+        if user_id is None:
+            self._cache.clear()
+        else:
+            self._cache.delete(user_id)
+        if broadcast:
+            cluster_bus.publish("ranking.invalidate", user_id)
+
+    def get_ranked_feed(
+        self, user_id: int, db: Session, skip: int = 0, limit: int = 20
+    ) -> List[Row]:
+        """Get a page of the user's ranked feed as POST_ROW_COLUMNS rows"""
+        ranked_ids = self._cache.get(user_id)
+        if ranked_ids is None:
+            ranked_ids = self._rank(user_id, db)
+            self._cache.set(user_id, ranked_ids)
+
+        page_ids = ranked_ids[skip:skip + limit]
+        if not page_ids:
+            return []
+
+        rows = (
+            feed_service.post_rows(db)
+            .filter(Post.id.in_(page_ids), Post.is_deleted == False)
+            .all()
+        )
+        by_id = {row[0]: row for row in rows}
+        return [by_id[post_id] for post_id in page_ids if post_id in by_id]
+
+    def score(self, columns: CandidateColumns) -> List[float]:
+        """Weighted sum of every scorer's column"""
+        totals = [0.0] * len(columns)
+        for _, weight, scorer in self._scorers:
+            totals = [total + weight * value for total, value in zip(totals, scorer(columns))]
+        return totals
+
+    def _rank(self, user_id: int, db: Session) -> List[int]:
+        """Build, score and order the candidate set for a user"""
+        columns = self._load_candidates(user_id, db)
+        if not len(columns):
+            return []
+        scores = self.score(columns)
+        order = sorted(range(len(columns)), key=lambda i: scores[i], reverse=True)
+        return [columns.post_ids[i] for i in order]
+
+    def _load_candidates(self, user_id: int, db: Session) -> CandidateColumns:
+        """Recent posts from connections and self, plus trending posts"""
+        now = datetime.utcnow()
+        candidate_columns = (
+            Post.id, Post.user_id, Post.post_type, Post.like_count,
+            Post.comment_count, Post.created_at,
+        )
+        base_filters = (
+            Post.is_deleted == False,
+            Post.status == PostStatus.PUBLISHED,
+        )
+
+        author_ids = list(social_graph.neighbors(user_id))
+        author_ids.append(user_id)
+        network_rows = (
+            db.query(*candidate_columns)
+            .filter(
+                *base_filters,
+                Post.user_id.in_(author_ids),
+                Post.created_at >= now - timedelta(hours=settings.feed_candidate_window_hours),
+            )
+            .order_by(Post.created_at.desc())
+            .limit(settings.feed_network_candidates)
+            .all()
+        )
+
+        trending_rows = (
+            db.query(*candidate_columns)
+            .filter(
+                *base_filters,
+                Post.created_at >= now - timedelta(hours=settings.feed_trending_window_hours),
+            )
+            .order_by((Post.like_count + Post.comment_count).desc(), Post.created_at.desc())
+            .limit(settings.feed_trending_candidates)
+            .all()
+        )
+
+        columns = CandidateColumns()
+        seen = set()
+        for post_id, author_id, post_type, like_count, comment_count, created_at in network_rows + trending_rows:
+            if post_id in seen:
+                continue
+            seen.add(post_id)
+
+            if author_id == user_id:
+                affinity = OWN_POST_AFFINITY
+            else:
+                connection_type = social_graph.connection_type(user_id, author_id)
+                affinity = CONNECTION_AFFINITY.get(connection_type, 0.0)
+
+            columns.post_ids.append(post_id)
+            columns.age_hours.append(max((now - created_at).total_seconds() / 3600.0, 0.0))
+            columns.like_counts.append(like_count or 0)
+            columns.comment_counts.append(comment_count or 0)
+            columns.affinities.append(affinity)
+            columns.is_agent.append(post_type == PostType.AGENT)
+
+        return columns
+
+
+# Singleton instance
+ranking_service = RankingService()
+
+
+@cluster_bus.handler("ranking.invalidate")
+def _on_ranking_invalidated(user_id) -> None:
+    ranking_service.invalidate(user_id, broadcast=False)
@@ -0,0 +1,299 @@
+"""
+Realtime Service
+File: backend/app/services/realtime.py
+
+In-process pub/sub bus that pushes deltas (new posts, likes, comments,
+connection requests) to connected WebSocket/SSE clients.
+
+Routes publish to a list of recipient user ids. Messages go through a
+broker so every API instance sees them: the local broker delivers straight
+back to this process (single instance / development), the Redis broker
+fans out over a pub/sub channel. Each instance then hands the payload to
+its own subscribers for those users.
+
+Wire format between instances: b"<id>,<id>,...\\n" + JSON payload, so the
+payload is encoded once and never re-parsed.
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, Optional, Set
+
+import orjson
+
+from app.core.config import settings
+from app.schemas.connection import ConnectionResponse
+from app.schemas.interaction import InteractionResponse
+from app.schemas.post import PostResponse
+from app.services.social_graph import social_graph
+
+Deliver = Callable[[bytes], None]
+
+
+class Subscription:
+    """One connected client: a bounded queue of encoded events"""
+
+    __slots__ = ("user_id", "_queue")
+
+    def __init__(self, user_id: int, max_pending: int):
+        self.user_id = user_id
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+
+    def push(self, payload: Optional[bytes]) -> None:
+        """Queue a payload; a slow client loses its oldest pending event"""
+        if self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait(payload)
+
+    async def get(self) -> Optional[bytes]:
+        """Next payload, or None once the subscription is closed"""
+        return await self._queue.get()
+
+    def close(self) -> None:
+        self.push(None)
+
+
+# Backoff between attempts to re-subscribe after a Redis disconnect
+_RECONNECT_MIN_SECONDS = 1.0
+_RECONNECT_MAX_SECONDS = 30.0
+
+
+class RealtimeBroker(ABC):
+    """Interface for moving messages between API instances"""
+
+    @abstractmethod
+    async def start(self, deliver: Deliver) -> None:
+        ...
+
+    @abstractmethod
+    def publish(self, message: bytes) -> None:
+        """Send a message to every instance (must not block)"""
+
+    @abstractmethod
+    async def stop(self) -> None:
+        ...
+
+
+class LocalBroker(RealtimeBroker):
+    """Single-process stand-in: delivers messages back to this instance"""
+
+    def __init__(self):
+        self._deliver: Optional[Deliver] = None
+
+    async def start(self, deliver: Deliver) -> None:
+        self._deliver = deliver
+
+    def publish(self, message: bytes) -> None:
+        if self._deliver is not None:
+            self._deliver(message)
+
+    async def stop(self) -> None:
+        self._deliver = None
+
+
+class RedisBroker(RealtimeBroker):
+    """Fans messages out to every instance through a Redis pub/sub channel (re-subscribes after disconnects)"""
+
+    def __init__(self, channel: str = "realtime"):
+        self.channel = channel
+        self._client = None
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+        self._pending: Set[asyncio.Task] = set()
+
+    async def start(self, deliver: Deliver) -> None:
+        try:
+            import redis.asyncio as aioredis
+        except ImportError:
+            raise RuntimeError("The redis realtime broker is configured but the redis package is not installed")
+
+        self._client = aioredis.Redis.from_url(settings.redis_url)
+        self._pubsub = self._client.pubsub()
+        await self._pubsub.subscribe(self.channel)
+        self._listener = asyncio.create_task(self._listen(deliver))
+
+    async def _listen(self, deliver: Deliver) -> None:
+        """Deliver channel messages, re-subscribing with backoff when the connection drops"""
+        delay = _RECONNECT_MIN_SECONDS
+        while True:
+            try:
+                if self._pubsub is None:
+                    self._pubsub = self._client.pubsub()
+                    await self._pubsub.subscribe(self.channel)
+                    print(f"✅ Re-subscribed to '{self.channel}'")
+                async for message in self._pubsub.listen():
+                    delay = _RECONNECT_MIN_SECONDS
+                    if message["type"] != "message":
+                        continue
+                    try:
+                        deliver(message["data"])
+                    except Exception as e:
+                        print(f"⚠️  Failed to deliver '{self.channel}' message: {e}")
+                raise ConnectionError("subscription ended")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️  Lost '{self.channel}' subscription ({e}), retrying in {delay:.0f}s")
+                pubsub, self._pubsub = self._pubsub, None
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:
+                        pass
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _RECONNECT_MAX_SECONDS)
+
+    def publish(self, message: bytes) -> None:
+        task = asyncio.get_running_loop().create_task(self._client.publish(self.channel, message))
+        # Keep a reference until the publish completes
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+        if self._client is not None:
+            await self._client.aclose()
+
+
+def make_broker(backend: str, channel: str = "realtime") -> RealtimeBroker:
+    """Build the broker for the configured backend ("local" or "redis")"""
+    if backend == "redis":
+        return RedisBroker(channel)
+    return LocalBroker()
+
+
+class RealtimeHub:
+    """Per-user subscriptions plus publishing through the broker"""
+
+    def __init__(self):
+        self._subscriptions: Dict[int, Set[Subscription]] = defaultdict(set)
+        self._broker: Optional[RealtimeBroker] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def start(self, broker: Optional[RealtimeBroker] = None) -> None:
+        """Connect the broker; called from the app lifespan"""
+        self._loop = asyncio.get_running_loop()
+        self._broker = broker or make_broker(settings.realtime_broker)
+        await self._broker.start(self._deliver)
+
+    async def stop(self) -> None:
+        """Close every subscription and disconnect the broker"""
+        for subscriptions in list(self._subscriptions.values()):
+            for subscription in list(subscriptions):
+                subscription.close()
+        self._subscriptions.clear()
+        if self._broker is not None:
+            await self._broker.stop()
+        self._broker = None
+
+    def subscribe(self, user_id: int) -> Subscription:
+        """Register a client for a user's events"""
+        subscription = Subscription(user_id, settings.realtime_queue_size)
+        self._subscriptions[user_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscriptions = self._subscriptions.get(subscription.user_id)
+        if subscriptions is None:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._subscriptions[subscription.user_id]
+
+    def connection_count(self) -> int:
+        """Number of open client subscriptions on this instance"""
+        return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+    def publish(self, user_ids: Iterable[int], event_type: str, data: Any) -> None:
+        """
+        Push an event to every connected client of the given users
+
+        Fire-and-forget: never blocks the caller, and is a no-op until the
+        hub has been started.
+        """
+        if self._broker is None:
+            return
+        recipients = ",".join(str(user_id) for user_id in set(user_ids))
+        if not recipients:
+            return
+
+        message = recipients.encode() + b"\n" + orjson.dumps({"type": event_type, "data": data})
+        try:
+            on_loop = asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            self._broker.publish(message)
+        else:
+            self._loop.call_soon_threadsafe(self._broker.publish, message)
+
+    def _deliver(self, message: bytes) -> None:
+        """Hand a broker message to the local subscribers it addresses"""
+        header, _, payload = message.partition(b"\n")
+        for user_id in header.split(b","):
+            for subscription in self._subscriptions.get(int(user_id), ()):
+                subscription.push(payload)
+
+
+# Singleton instance
+realtime_hub = RealtimeHub()
+
+
+def publish_post_created(post) -> None:
+    """Push a newly published post to its author and the author's connections"""
+    realtime_hub.publish(
+        [post.user_id, *social_graph.neighbors(post.user_id)],
+        "post.created",
+        PostResponse.model_validate(post).model_dump(mode="json", by_alias=True),
+    )
+
+
+def publish_post_liked(post, liker_id: int) -> None:
+    """Tell a post's author about a new like"""
+    if post.user_id == liker_id:
+        return
+    realtime_hub.publish(
+        [post.user_id],
+        "post.liked",
+        {"postId": post.id, "userId": liker_id, "likeCount": post.like_count},
+    )
+
+
+def publish_comment_created(post, comment) -> None:
+    """Tell a post's author about a new comment"""
+    if post.user_id == comment.user_id:
+        return
+    realtime_hub.publish(
+        [post.user_id],
+        "comment.created",
+        InteractionResponse.model_validate(comment).model_dump(mode="json", by_alias=True),
+    )
+
+
+def publish_comment_liked(comment, liker_id: int) -> None:
+    """Tell a comment's author about a new like"""
+    if comment.user_id == liker_id:
+        return
+    realtime_hub.publish(
+        [comment.user_id],
+        "comment.liked",
+        {
+            "commentId": comment.id,
+            "postId": comment.post_id,
+            "userId": liker_id,
+            "likeCount": comment.like_count,
+        },
+    )
+
+
+def publish_connection_event(connection, event_type: str, recipient_id: int) -> None:
+    """Push a connection request/acceptance to the other party"""
+    realtime_hub.publish(
+        [recipient_id],
+        event_type,
+        ConnectionResponse.model_validate(connection).model_dump(mode="json", by_alias=True),
+    )
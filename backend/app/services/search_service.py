@@ -0,0 +1,128 @@
+"""
+Search Service
+File: backend/app/services/search_service.py
+
+Ranked full-text search over posts and users.
+
+Uses the inverted indexes created by the 0003_full_text_search migration:
+tsvector + GIN on Postgres and FTS5 on SQLite. Any other backend falls back
+to a plain substring match.
+"""
+
+import re
+from sqlalchemy import column, func, literal_column, table
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+from typing import List
+
+from app.models.post import Post, PostStatus
+from app.models.user import User
+from app.services.feed_service import feed_service
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# Lightweight handles on the FTS5 virtual tables (not mapped models)
+_posts_fts = table("posts_fts", column("rowid"))
+_users_fts = table("users_fts", column("rowid"))
+
+
+def _fts5_query(query: str) -> str:
+    """
+    Turn free text into a safe FTS5 MATCH expression.
+
+    Every token is quoted so user input can never be parsed as FTS5 syntax,
+    and the last token matches as a prefix for search-as-you-type.
+    """
+    tokens = _TOKEN_RE.findall(query)
+    if not tokens:
+        return ""
+    quoted = [f'"{token}"' for token in tokens]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+class SearchService:
+    """Service for full-text search over posts and users"""
+
+    def search_posts(
+        self, db: Session, query: str, skip: int = 0, limit: int = 20
+    ) -> List[Row]:
+        """
+        Search published, non-deleted posts by content, best match first
+
+        Returns POST_ROW_COLUMNS rows for encode_post_rows.
+        """
+        base = (
+            feed_service.post_rows(db)
+            .filter(
+                Post.is_deleted == False,
+                Post.status == PostStatus.PUBLISHED,
+            )
+        )
+        dialect = db.get_bind().dialect.name
+
+        if dialect == "postgresql":
+            vector = literal_column("posts.search_vector")
+            tsquery = func.websearch_to_tsquery("english", query)
+            base = base.filter(vector.op("@@")(tsquery)).order_by(
+                func.ts_rank_cd(vector, tsquery).desc(), Post.id.desc()
+            )
+        elif dialect == "sqlite":
+            match = _fts5_query(query)
+            if not match:
+                return []
+            # bm25() is lower-is-better
+            base = (
+                base.join(_posts_fts, _posts_fts.c.rowid == Post.id)
+                .filter(literal_column("posts_fts").op("MATCH")(match))
+                .order_by(func.bm25(literal_column("posts_fts")), Post.id.desc())
+            )
+        else:
+            base = base.filter(Post.content.ilike(f"%{query}%")).order_by(Post.created_at.desc())
+
+        return base.offset(skip).limit(limit).all()
+
+    def search_users(
+        self, db: Session, query: str, skip: int = 0, limit: int = 20
+    ) -> List[Row]:
+        """
+        Search active users by full name and bio (name matches rank higher)
+        """
+        base = db.query(
+            User.id,
+            User.email,
+            User.full_name,
+            User.profile_picture_url,
+        ).filter(User.is_active == True)
+        dialect = db.get_bind().dialect.name
+
+        if dialect == "postgresql":
+            vector = literal_column("users.search_vector")
+            # Names are indexed unstemmed, bios stemmed - match either form
+            tsquery = func.websearch_to_tsquery("simple", query).op("||")(
+                func.websearch_to_tsquery("english", query)
+            )
+            base = base.filter(vector.op("@@")(tsquery)).order_by(
+                func.ts_rank_cd(vector, tsquery).desc(), User.id
+            )
+        elif dialect == "sqlite":
+            match = _fts5_query(query)
+            if not match:
+                return []
+            base = (
+                base.join(_users_fts, _users_fts.c.rowid == User.id)
+                .filter(literal_column("users_fts").op("MATCH")(match))
+                # Weight full_name matches 4x over bio matches
+                .order_by(func.bm25(literal_column("users_fts"), 4.0, 1.0), User.id)
+            )
+        else:
+            pattern = f"%{query}%"
+            base = base.filter(
+                User.full_name.ilike(pattern) | User.bio.ilike(pattern)
+            ).order_by(User.full_name, User.id)
+
+        return base.offset(skip).limit(limit).all()
+
+
+# Singleton instance
+search_service = SearchService()
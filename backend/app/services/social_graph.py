@@ -0,0 +1,207 @@
+"""
+Social graph service
+File: backend/app/services/social_graph.py
+
+In-memory adjacency index of accepted connections.
+
+Connections are stored as directed rows, so every lookup against the
+connections table has to OR over user_id/connected_user_id. The graph keeps
+the accepted edges as undirected, per-user sorted int arrays (a mutable CSR
+layout) so neighbour, mutual-friend and 2-hop queries never touch the DB.
+
+Each worker holds its own copy; edge changes are broadcast on the cluster
+bus so the other workers apply them too.
+"""
+
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from threading import RLock
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.connection import Connection, ConnectionStatus, ConnectionType, canonical_pair
+from app.services.cluster_bus import cluster_bus
+
+_EMPTY = array("l")
+
+
+class SocialGraph:
+    """Undirected graph of accepted connections kept as sorted int arrays"""
+
+    def __init__(self):
+        self._adjacency: Dict[int, array] = {}
+        self._edge_types: Dict[Tuple[int, int], ConnectionType] = {}
+        self._lock = RLock()
+        self.loaded = False
+
+    def load(self, db: Session) -> None:
+        """Rebuild the graph from all accepted connections"""
+        rows = (
+            db.query(Connection.user_id, Connection.connected_user_id, Connection.connection_type)
+            .filter(Connection.status == ConnectionStatus.ACCEPTED)
+            .all()
+        )
+        self.load_edges(rows)
+
+    def load_edges(self, edges: Iterable[Tuple]) -> None:
+        """
+        Rebuild the graph from (user_id, other_user_id[, connection_type]) tuples
+        """
+        buckets: Dict[int, set] = {}
+        edge_types: Dict[Tuple[int, int], ConnectionType] = {}
+        for edge in edges:
+            a, b = edge[0], edge[1]
+            if a == b:
+                continue
+            buckets.setdefault(a, set()).add(b)
+            buckets.setdefault(b, set()).add(a)
+            if len(edge) > 2 and edge[2] is not None:
+                edge_types[canonical_pair(a, b)] = edge[2]
+
+        adjacency = {
+            user_id: array("l", sorted(neighbours))
+            for user_id, neighbours in buckets.items()
+        }
+
+        with self._lock:
+            self._adjacency = adjacency
+            self._edge_types = edge_types
+            self.loaded = True
+
+    def add_edge(self, a: int, b: int, connection_type: Optional[ConnectionType] = None, broadcast: bool = True) -> None:
+        """Add an accepted connection between two users"""
+        if a == b:
+            return
+        with self._lock:
+            self._insert(a, b)
+            self._insert(b, a)
+            if connection_type is not None:
+                self._edge_types[canonical_pair(a, b)] = connection_type
+        if broadcast:
+            cluster_bus.publish("graph.add_edge", [a, b, connection_type.name if connection_type else None])
+
+    def remove_edge(self, a: int, b: int, broadcast: bool = True) -> None:
+        """Remove the connection between two users if present"""
+        with self._lock:
+            self._delete(a, b)
+            self._delete(b, a)
+            self._edge_types.pop(canonical_pair(a, b), None)
+        if broadcast:
+            cluster_bus.publish("graph.remove_edge", [a, b])
+
+    def set_connection_type(self, a: int, b: int, connection_type: ConnectionType, broadcast: bool = True) -> None:
+        """Record a relationship type change on an existing edge"""
+        with self._lock:
+            if self.are_connected(a, b):
+                self._edge_types[canonical_pair(a, b)] = connection_type
+        if broadcast:
+            cluster_bus.publish("graph.set_connection_type", [a, b, connection_type.name])
+
+    def connection_type(self, a: int, b: int) -> Optional[ConnectionType]:
+        """Relationship type of the edge between a and b, if connected"""
+        return self._edge_types.get(canonical_pair(a, b))
+
+    def neighbors(self, user_id: int) -> array:
+        """Sorted ids of users connected to user_id"""
+        return self._adjacency.get(user_id, _EMPTY)
+
+    def degree(self, user_id: int) -> int:
+        """Number of accepted connections for user_id"""
+        return len(self.neighbors(user_id))
+
+    def are_connected(self, a: int, b: int) -> bool:
+        """Whether a and b have an accepted connection"""
+        row = self.neighbors(a)
+        i = bisect_left(row, b)
+        return i < len(row) and row[i] == b
+
+    def mutual_count(self, a: int, b: int) -> int:
+        """Number of connections shared by a and b"""
+        left, right = self.neighbors(a), self.neighbors(b)
+        if len(left) > len(right):
+            left, right = right, left
+        if not left:
+            return 0
+
+        # Probe the shorter array into the longer one; both are sorted so the
+        # search window only ever moves forward.
+        count = 0
+        lo = 0
+        hi = len(right)
+        for value in left:
+            lo = bisect_left(right, value, lo, hi)
+            if lo == hi:
+                break
+            if right[lo] == value:
+                count += 1
+                lo += 1
+        return count
+
+    def two_hop(self, user_id: int, limit: int = 20) -> List[Tuple[int, int]]:
+        """
+        Friends-of-friends that user_id is not yet connected to.
+
+        Returns:
+            List of (candidate_user_id, mutual_count), highest count first
+        """
+        direct = self.neighbors(user_id)
+        counts: Counter = Counter()
+        for friend in direct:
+            counts.update(self.neighbors(friend))
+
+        counts.pop(user_id, None)
+        for friend in direct:
+            counts.pop(friend, None)
+
+        return sorted(counts.items(), key=lambda item: (-item[1], item[0]))[:limit]
+
+    def _insert(self, user_id: int, other: int) -> None:
+        row = self._adjacency.get(user_id)
+        if row is None:
+            self._adjacency[user_id] = array("l", [other])
+            return
+        i = bisect_left(row, other)
+        if i < len(row) and row[i] == other:
+            return
+        # Copy-on-write so readers iterating the old array are never affected
+        updated = row[:i]
+        updated.append(other)
+        updated.extend(row[i:])
+        self._adjacency[user_id] = updated
+
+    def _delete(self, user_id: int, other: int) -> None:
+        row = self._adjacency.get(user_id)
+        if row is None:
+            return
+        i = bisect_left(row, other)
+        if i == len(row) or row[i] != other:
+            return
+        updated = row[:i]
+        updated.extend(row[i + 1:])
+        if updated:
+            self._adjacency[user_id] = updated
+        else:
+            del self._adjacency[user_id]
+
+
+# Singleton instance
+social_graph = SocialGraph()
+
+
+@cluster_bus.handler("graph.add_edge")
+def _on_edge_added(data) -> None:
+    a, b, connection_type = data
+    social_graph.add_edge(a, b, ConnectionType[connection_type] if connection_type else None, broadcast=False)
+
+
+@cluster_bus.handler("graph.remove_edge")
+def _on_edge_removed(data) -> None:
+    social_graph.remove_edge(data[0], data[1], broadcast=False)
+
+
+@cluster_bus.handler("graph.set_connection_type")
+def _on_connection_type_set(data) -> None:
+    a, b, connection_type = data
+    social_graph.set_connection_type(a, b, ConnectionType[connection_type], broadcast=False)
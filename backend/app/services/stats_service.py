@@ -0,0 +1,114 @@
+"""
+Stats Service
+File: backend/app/services/stats_service.py
+
+Maintains the denormalized user_stats rows behind the agent dashboard.
+
+Route handlers call bump() next to the write being counted, before they
+commit, so a counter changes if and only if the write does. All changes of
+one request go out as a single executemany upsert (row-level, so
+concurrent requests never lose increments). Agent actions also push an
+entry onto the recent_activity ring buffer of the owner's row.
+"""
+
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import insert, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models.agent_action import AgentAction
+from app.models.post import Post, PostStatus, PostType
+from app.models.user_stats import COUNTER_FIELDS, RECENT_ACTIVITY_SIZE, UserStats
+
+_stats = UserStats.__table__
+
+Change = Tuple[int, str, int]
+
+
+def post_changes(post: Post, delta: int) -> Tuple[Change, ...]:
+    """Counter changes for a post entering (+1) or leaving (-1) the published set"""
+    changes = [(post.user_id, "post_count", delta)]
+    if post.post_type == PostType.AGENT:
+        changes.append((post.user_id, "agent_post_count", delta))
+    return tuple(changes)
+
+
+def is_counted(post: Post) -> bool:
+    """Whether a post counts towards post_count"""
+    return post.status == PostStatus.PUBLISHED and not post.is_deleted
+
+
+def action_activity(action: AgentAction) -> dict:
+    """Ring buffer entry for an agent action"""
+    return {
+        "actionId": action.id,
+        "actionType": action.action_type.value,
+        "status": action.status.value,
+        "postId": action.post_id,
+        "description": action.description,
+        "at": datetime.utcnow().isoformat() + "Z",
+    }
+
+
+class StatsService:
+    """Service for incremental user/agent counters and recent activity"""
+
+    def bump(self, db: Session, *changes: Change) -> None:
+        """
+        Apply (user_id, counter, delta) changes in one statement (does not commit)
+
+        Changes for the same user are merged, so a user liking their own
+        post is one row update.
+        """
+        merged: Dict[int, Dict[str, int]] = defaultdict(lambda: dict.fromkeys(COUNTER_FIELDS, 0))
+        for user_id, field, delta in changes:
+            if field not in COUNTER_FIELDS:
+                raise ValueError(f"Unknown stats counter: {field}")
+            merged[user_id][field] += delta
+        if not merged:
+            return
+
+        now = datetime.utcnow()
+        rows = [{"user_id": user_id, **counters, "updated_at": now} for user_id, counters in merged.items()]
+        dialect = db.get_bind().dialect.name
+
+        if dialect in ("postgresql", "sqlite"):
+            upsert = (pg_insert if dialect == "postgresql" else sqlite_insert)(_stats)
+            set_ = {field: _stats.c[field] + upsert.excluded[field] for field in COUNTER_FIELDS}
+            set_["updated_at"] = upsert.excluded.updated_at
+            db.execute(upsert.on_conflict_do_update(index_elements=[_stats.c.user_id], set_=set_), rows)
+            return
+
+        for row in rows:
+            result = db.execute(
+                update(_stats)
+                .where(_stats.c.user_id == row["user_id"])
+                .values({field: _stats.c[field] + row[field] for field in COUNTER_FIELDS}, updated_at=now)
+            )
+            if not result.rowcount:
+                db.execute(insert(_stats), [row])
+
+    def record_activity(self, db: Session, user_id: int, entry: dict) -> None:
+        """Push an entry onto the user's recent_activity ring buffer (does not commit)"""
+        # A zero upsert makes sure the row exists; then lock it so concurrent pushes serialize
+        self.bump(db, (user_id, "agent_action_count", 0))
+        stats = (
+            db.query(UserStats)
+            .filter(UserStats.user_id == user_id)
+            .with_for_update()
+            .populate_existing()
+            .one()
+        )
+        stats.recent_activity = [entry] + list(stats.recent_activity or [])[:RECENT_ACTIVITY_SIZE - 1]
+
+    def get(self, db: Session, user_id: int) -> Optional[UserStats]:
+        """The user's stats row (None until something was counted)"""
+        return db.get(UserStats, user_id)
+
+
+# Singleton instance
+stats_service = StatsService()
@@ -1,95 +1,391 @@
 """
-Supabase Storage Service
+Storage Service
 File: backend/app/services/storage_service.py
 
-Handles file uploads to Supabase Storage.
+Handles media uploads (profile pictures) through a storage backend chosen by
+settings.storage_backend:
+
+- "supabase": Supabase Storage (the bucket is public)
+- "local": a content-addressed directory under settings.media_root, served
+  by the app at settings.media_url
+
+Uploads are streamed to a temporary file while being hashed, never held in
+memory whole. Objects are named after the SHA-256 of their content, so the
+same image uploaded twice is stored once and a URL always points at the same
+bytes, which lets browsers and CDNs cache media forever. Resized WebP
+thumbnails (settings.avatar_thumbnail_sizes) are made in a worker thread
+with Pillow, and the profile picture URL points at the largest one.
+
+Uploads are checked by content, not by the declared type: only JPEG, PNG,
+GIF and WebP signatures are accepted. Supabase uploads stream the spooled
+file over a pooled async HTTP client (created on first use, so importing
+the app stays cheap on cold starts).
 """
 
+import asyncio
+import hashlib
 import os
-import uuid
+import re
+import tempfile
+from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional
-from supabase import create_client, Client
+from typing import TYPE_CHECKING, AsyncIterator, BinaryIO, List, NamedTuple, Optional, Tuple
+
+from fastapi import UploadFile
 
 from app.core.config import settings
+from app.database import connection as database
+from app.models.user import User
+
+if TYPE_CHECKING:
+    import httpx
+
+CHUNK_SIZE = 64 * 1024
+
+# Content-addressed objects never change
+IMMUTABLE_CACHE_SECONDS = 365 * 24 * 3600
+
+# Original and thumbnails of one image share this key prefix
+CONTENT_KEY = re.compile(r"avatars/[0-9a-f]{2}/[0-9a-f]{64}")
+
+MIME_TO_EXT = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+}
+
+
+class UploadTooLarge(Exception):
+    """The upload went over settings.upload_max_bytes"""
+
+
+class UnsupportedMediaType(Exception):
+    """The upload isn't one of the accepted image formats"""
+
+
+class SpooledUpload(NamedTuple):
+    """An upload copied to a temporary file"""
+    path: str
+    sha256: str
+    size: int
+    content_type: str
+
+
+def sniff_image_type(header: bytes) -> Optional[str]:
+    """MIME type from an image's leading bytes (None if not an accepted format)"""
+    if header.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if header.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if header[:6] in (b"GIF87a", b"GIF89a"):
+        return "image/gif"
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+class StorageBackend(ABC):
+    """Interface for storing media objects under a key"""
+
+    @abstractmethod
+    async def put(self, key: str, source_path: str, content_type: str) -> str:
+        """Store the file at source_path under key (no-op if present); returns its public URL"""
+
+    @abstractmethod
+    async def delete(self, key: str) -> bool:
+        ...
+
+    async def close(self) -> None:
+        """Release connections; called on shutdown"""
+
+
+class LocalStorageBackend(StorageBackend):
+    """Content-addressed files under settings.media_root"""
+
+    def __init__(self, root: str, base_url: str):
+        self.root = Path(root)
+        self.base_url = base_url.rstrip("/")
+
+    async def put(self, key: str, source_path: str, content_type: str) -> str:
+        await asyncio.to_thread(self._put, key, source_path)
+        return f"{self.base_url}/{key}"
+
+    def _put(self, key: str, source_path: str) -> None:
+        destination = self.root / key
+        if destination.exists():
+            return  # Same name, same content
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        # Copy next to the destination, then rename: readers never see a partial file
+        fd, partial = tempfile.mkstemp(dir=destination.parent, prefix=".partial-")
+        try:
+            with os.fdopen(fd, "wb") as out, open(source_path, "rb") as source:
+                while chunk := source.read(CHUNK_SIZE):
+                    out.write(chunk)
+                out.flush()
+                os.fsync(out.fileno())
+            os.chmod(partial, 0o644)
+            os.replace(partial, destination)
+        except BaseException:
+            os.unlink(partial)
+            raise
+
+    async def delete(self, key: str) -> bool:
+        try:
+            await asyncio.to_thread((self.root / key).unlink)
+            return True
+        except FileNotFoundError:
+            return False
+
+
+class SupabaseStorageBackend(StorageBackend):
+    """
+    Objects in a public Supabase Storage bucket
+
+    Talks to the Storage REST API through one pooled async HTTP client,
+    streaming files from disk, so uploads never block the event loop.
+    """
+
+    def __init__(self, bucket_name: str):
+        self.bucket_name = bucket_name
+        self.base_url = f"{settings.supabase_url.rstrip('/')}/storage/v1"
+        self._client: Optional["httpx.AsyncClient"] = None
+
+    @property
+    def client(self) -> "httpx.AsyncClient":
+        """HTTP client, created on first use"""
+        if self._client is None:
+            import httpx
+            self._client = httpx.AsyncClient(
+                headers={
+                    "apikey": settings.supabase_service_key,
+                    "Authorization": f"Bearer {settings.supabase_service_key}",
+                },
+                timeout=settings.storage_timeout_seconds,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            )
+        return self._client
+
+    async def put(self, key: str, source_path: str, content_type: str) -> str:
+        response = await self.client.post(
+            f"{self.base_url}/object/{self.bucket_name}/{key}",
+            content=_read_chunks(source_path),
+            headers={
+                "Content-Type": content_type,
+                "Content-Length": str(os.path.getsize(source_path)),
+                "Cache-Control": f"max-age={IMMUTABLE_CACHE_SECONDS}",
+                "x-upsert": "true",
+            },
+        )
+        response.raise_for_status()
+        return f"{self.base_url}/object/public/{self.bucket_name}/{key}"
+
+    async def delete(self, key: str) -> bool:
+        try:
+            response = await self.client.request(
+                "DELETE", f"{self.base_url}/object/{self.bucket_name}", json={"prefixes": [key]}
+            )
+            response.raise_for_status()
+            return True
+        except Exception as e:
+            print(f"Error deleting file: {e}")
+            return False
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+async def _read_chunks(path: str) -> AsyncIterator[bytes]:
+    """Read a file in chunks without blocking the event loop"""
+    with open(path, "rb") as source:
+        while chunk := await asyncio.to_thread(source.read, CHUNK_SIZE):
+            yield chunk
+
+
+def make_storage_backend(backend: str, bucket_name: str) -> StorageBackend:
+    """Build the storage backend for the configured name ("supabase" or "local")"""
+    if backend == "local":
+        return LocalStorageBackend(settings.media_root, settings.media_url)
+    return SupabaseStorageBackend(bucket_name)
+
+
+def make_thumbnails(source_path: str, sizes: List[int], directory: str) -> List[Tuple[int, str]]:
+    """
+    Square WebP thumbnails of an image (blocking: run in a thread)
+
+    Returns:
+        [(size, temporary file path)], empty when Pillow is missing or the
+        image can't be decoded
+    """
+    try:
+        from PIL import Image, ImageOps
+    except ImportError:
+        print("⚠️  Pillow not installed; storing images without thumbnails")
+        return []
+
+    thumbnails: List[Tuple[int, str]] = []
+    try:
+        with Image.open(source_path) as image:
+            image.seek(0)  # First frame of animations
+            image = ImageOps.exif_transpose(image)
+            image = image.convert("RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB")
+            for size in sorted(sizes):
+                thumbnail = ImageOps.fit(image, (size, size), Image.Resampling.LANCZOS)
+                fd, path = tempfile.mkstemp(dir=directory, suffix=".webp")
+                with os.fdopen(fd, "wb") as out:
+                    thumbnail.save(out, "WEBP", quality=80, method=4)
+                thumbnails.append((size, path))
+    except Exception as e:
+        print(f"⚠️  Could not make thumbnails: {e}")
+        for _, path in thumbnails:
+            os.unlink(path)
+        return []
+    return thumbnails
 
 
 class StorageService:
-    """Service for managing file uploads to Supabase Storage"""
+    """Service for managing media uploads"""
 
     def __init__(self):
-        self.supabase: Client = create_client(
-            settings.supabase_url,
-            settings.supabase_service_key
-        )
         self.bucket_name = "profile-pictures"
+        self._backend: Optional[StorageBackend] = None
+
+    @property
+    def backend(self) -> StorageBackend:
+        """Storage backend, created on first use"""
+        if self._backend is None:
+            self._backend = make_storage_backend(settings.storage_backend, self.bucket_name)
+        return self._backend
+
+    @property
+    def spool_dir(self) -> str:
+        """Where uploads and thumbnails are staged before being stored (never served)"""
+        return tempfile.gettempdir()
 
-    async def upload_profile_picture(
-        self, user_id: int, file_content: bytes, content_type: str
-    ) -> str:
+    async def spool(self, upload: UploadFile) -> SpooledUpload:
         """
-        Upload a profile picture to Supabase Storage.
+        Copy an upload to a temporary file in chunks, hashing it on the way
+
+        Memory use is one chunk whatever the file size.
+
+        Raises:
+            UnsupportedMediaType: not a JPEG, PNG, GIF or WebP image
+            UploadTooLarge: past settings.upload_max_bytes (nothing is kept)
+        """
+        return await asyncio.to_thread(self._spool, upload.file)
+
+    def _spool(self, source: BinaryIO) -> SpooledUpload:
+        digest = hashlib.sha256()
+        size = 0
+        content_type = None
+        fd, path = tempfile.mkstemp(dir=self.spool_dir)
+        try:
+            with os.fdopen(fd, "wb") as out:
+                while chunk := source.read(CHUNK_SIZE):
+                    if content_type is None:
+                        content_type = sniff_image_type(chunk)
+                        if content_type is None:
+                            raise UnsupportedMediaType()
+                    size += len(chunk)
+                    if size > settings.upload_max_bytes:
+                        raise UploadTooLarge()
+                    digest.update(chunk)
+                    out.write(chunk)
+            if content_type is None:
+                raise UnsupportedMediaType()  # Empty file
+        except BaseException:
+            os.unlink(path)
+            raise
+        return SpooledUpload(path, digest.hexdigest(), size, content_type)
+
+    async def upload_profile_picture(self, upload: UploadFile) -> str:
+        """
+        Store a profile picture and its thumbnails
 
         Args:
-            user_id: User ID for file naming
-            file_content: Binary file content
-            content_type: MIME type (e.g., 'image/jpeg')
+            upload: Uploaded image file (its declared content type is ignored)
 
         Returns:
-            Public URL of the uploaded file
+            Public URL of the largest thumbnail (the original if none could be made)
+
+        Raises:
+            UnsupportedMediaType: If the file isn't a JPEG, PNG, GIF or WebP image
+            UploadTooLarge: If the file is over settings.upload_max_bytes
         """
-        # Generate unique filename
-        file_extension = self._get_extension_from_mime(content_type)
-        unique_filename = f"{user_id}_{uuid.uuid4()}{file_extension}"
-        file_path = f"avatars/{unique_filename}"
-
-        # Upload to Supabase Storage
-        response = self.supabase.storage.from_(self.bucket_name).upload(
-            path=file_path,
-            file=file_content,
-            file_options={"content-type": content_type, "upsert": "true"}
-        )
+        spooled = await self.spool(upload)
+        return await self.store_profile_picture(spooled)
 
-        # Get public URL
-        public_url = self.supabase.storage.from_(self.bucket_name).get_public_url(
-            file_path
-        )
+    async def store_profile_picture(self, spooled: SpooledUpload) -> str:
+        """Store a spooled profile picture and its thumbnails, then remove the temporary files"""
+        prefix = f"avatars/{spooled.sha256[:2]}/{spooled.sha256}"
+        thumbnails: List[Tuple[int, str]] = []
+        try:
+            # Upload the original while the thumbnails are made
+            url, thumbnails = await asyncio.gather(
+                self.backend.put(prefix + MIME_TO_EXT[spooled.content_type], spooled.path, spooled.content_type),
+                asyncio.to_thread(make_thumbnails, spooled.path, settings.avatar_thumbnail_sizes_list, self.spool_dir),
+                return_exceptions=True,
+            )
+            if isinstance(thumbnails, BaseException):
+                thumbnails = []
+            if isinstance(url, BaseException):
+                raise url
+            thumbnail_urls = await asyncio.gather(*(
+                self.backend.put(f"{prefix}_{size}.webp", path, "image/webp") for size, path in thumbnails
+            ))
+        finally:
+            for path in [spooled.path] + [path for _, path in thumbnails]:
+                os.unlink(path)
+        return thumbnail_urls[-1] if thumbnail_urls else url
 
-        return public_url
+    async def close(self) -> None:
+        """Release the backend's connections; called on shutdown"""
+        if self._backend is not None:
+            await self._backend.close()
 
     async def delete_profile_picture(self, file_path: str) -> bool:
         """
-        Delete a profile picture from Supabase Storage.
+        Delete a stored profile picture and its thumbnails.
+
+        Content-addressed objects can be shared by several users, so nothing
+        is deleted while any user's profile_picture_url still points at the
+        same content. Call it after the owner's URL has been changed.
 
         Args:
-            file_path: Path to the file in storage (e.g., 'avatars/123_abc.jpg')
+            file_path: Key of the object (e.g., 'avatars/ab/ab12...cd.jpg') or its public URL
 
         Returns:
-            True if deleted successfully, False otherwise
+            True if anything was deleted, False otherwise
         """
-        try:
-            # Extract path from full URL if needed
-            if file_path.startswith("http"):
-                # Parse path from URL
-                path_parts = file_path.split(f"{self.bucket_name}/")
-                if len(path_parts) > 1:
-                    file_path = path_parts[1]
-
-            self.supabase.storage.from_(self.bucket_name).remove([file_path])
-            return True
-        except Exception as e:
-            print(f"Error deleting file: {e}")
+        # Extract key from full URL if needed
+        for marker in (f"{self.bucket_name}/", f"{settings.media_url.rstrip('/')}/"):
+            if marker in file_path:
+                file_path = file_path.split(marker, 1)[1]
+                break
+
+        match = CONTENT_KEY.match(file_path)
+        if match is None:
+            # Not content-addressed: only this exact object can be referenced
+            prefix, keys = file_path, [file_path]
+        else:
+            prefix = match.group(0)
+            keys = [prefix + ext for ext in MIME_TO_EXT.values()]
+            keys += [f"{prefix}_{size}.webp" for size in settings.avatar_thumbnail_sizes_list]
+
+        if await asyncio.to_thread(self._is_referenced, prefix):
             return False
+        deleted = await asyncio.gather(*(self.backend.delete(key) for key in keys))
+        return any(deleted)
 
-    def _get_extension_from_mime(self, content_type: str) -> str:
-        """Get file extension from MIME type"""
-        mime_to_ext = {
-            "image/jpeg": ".jpg",
-            "image/png": ".png",
-            "image/gif": ".gif",
-            "image/webp": ".webp",
-        }
-        return mime_to_ext.get(content_type, ".jpg")
+    def _is_referenced(self, prefix: str) -> bool:
+        """Whether any user's profile picture URL points at objects under prefix"""
+        db = database.SessionLocal()
+        try:
+            return db.query(User.id).filter(User.profile_picture_url.contains(prefix)).first() is not None
+        finally:
+            db.close()
 
 
 # Singleton instance
@@ -0,0 +1,123 @@
+"""
+Full-text search benchmark
+File: backend/benchmarks/search_benchmark.py
+
+Builds a synthetic post corpus and times ranked search queries through
+SearchService against it.
+
+Usage (from backend/):
+    python -m benchmarks.search_benchmark                      # 1M posts, temp SQLite
+    python -m benchmarks.search_benchmark --posts 100000
+    python -m benchmarks.search_benchmark --database-url postgresql://...
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime
+
+from sqlalchemy import text
+
+from app.database import connection as database
+from app.services.search_service import search_service
+
+VOCABULARY = (
+    "agent social coffee running travel music design python startup product "
+    "launch weekend hiking photo garden recipe book movie podcast climate "
+    "market team hiring remote office city ocean mountain science space "
+    "learning teaching health sleep focus habit writing journal family friend"
+).split()
+
+QUERIES = ["coffee", "running travel", "python startup", "ocean", "habit focus", "podcast launch", "zebra"]
+
+
+def build_corpus(total_posts: int, batch_size: int = 20000, seed: int = 42) -> None:
+    """Insert a single author and total_posts synthetic posts"""
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+
+    with database.engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO users (id, email, hashed_password, full_name, is_active, is_verified) "
+            "VALUES (1, 'bench@example.com', 'x', 'Bench Author', :t, :f)"
+        ), {"t": True, "f": False})
+
+    insert = text(
+        "INSERT INTO posts (user_id, content, post_type, status, is_edited, edited_by_user, "
+        "is_deleted, like_count, comment_count, created_at, updated_at) "
+        "VALUES (1, :content, 'HUMAN', :status, :f, :f, :deleted, 0, 0, :now, :now)"
+    )
+
+    start = time.perf_counter()
+    inserted = 0
+    while inserted < total_posts:
+        size = min(batch_size, total_posts - inserted)
+        rows = [
+            {
+                "content": " ".join(rng.choices(VOCABULARY, k=rng.randint(8, 30))),
+                "status": "DRAFT" if rng.random() < 0.05 else "PUBLISHED",
+                "deleted": rng.random() < 0.02,
+                "f": False,
+                "now": now,
+            }
+            for _ in range(size)
+        ]
+        with database.engine.begin() as conn:
+            conn.execute(insert, rows)
+        inserted += size
+        print(f"  inserted {inserted:,}/{total_posts:,}", end="\r", flush=True)
+
+    print(f"\n  corpus built in {time.perf_counter() - start:.1f}s")
+
+
+def run_queries(repeats: int, limit: int) -> None:
+    """Time each query `repeats` times on a fresh session"""
+    print(f"\n{'query':<18}{'hits':>6}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}")
+    for query in QUERIES:
+        timings = []
+        hits = 0
+        for _ in range(repeats):
+            db = database.SessionLocal()
+            try:
+                start = time.perf_counter()
+                results = search_service.search_posts(db=db, query=query, limit=limit)
+                timings.append((time.perf_counter() - start) * 1000)
+                hits = len(results)
+            finally:
+                db.close()
+        timings.sort()
+        p95 = timings[max(0, int(len(timings) * 0.95) - 1)]
+        print(f"{query:<18}{hits:>6}{statistics.median(timings):>10.2f}{p95:>10.2f}{timings[-1]:>10.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--posts", type=int, default=1_000_000, help="Synthetic corpus size")
+    parser.add_argument("--repeats", type=int, default=20, help="Runs per query")
+    parser.add_argument("--limit", type=int, default=20, help="Page size")
+    parser.add_argument("--database-url", default=None, help="Empty database to use (default: temp SQLite)")
+    args = parser.parse_args()
+
+    tmp_path = None
+    database_url = args.database_url
+    if database_url is None:
+        fd, tmp_path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        database_url = f"sqlite:///{tmp_path}"
+
+    try:
+        database.init_db_engine(database_url)
+        database.init_db()
+        print(f"Building {args.posts:,}-post corpus on {database.engine.dialect.name}...")
+        build_corpus(args.posts)
+        run_queries(args.repeats, args.limit)
+    finally:
+        if tmp_path:
+            os.remove(tmp_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+List serialization benchmark
+File: backend/benchmarks/serialization_benchmark.py
+
+Compares per-item cost of serializing feed posts and comments through
+Pydantic (ORM instance -> response model -> JSON, as response_model does)
+against the orjson fast path built from column tuples.
+
+Usage (from backend/):
+    python -m benchmarks.serialization_benchmark
+    python -m benchmarks.serialization_benchmark --items 5000 --repeats 20
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List
+
+from pydantic import TypeAdapter
+
+from app.models.interaction import ActorType, Interaction, InteractionType
+from app.models.post import Post, PostStatus, PostType
+from app.models.user import User
+from app.schemas.encoders import encode_interaction_rows, encode_post_rows
+from app.schemas.interaction import InteractionResponse
+from app.schemas.post import PostResponse
+
+
+def make_fixtures(count: int):
+    """Build matching ORM instances and column tuples"""
+    base = datetime(2026, 1, 1, 12, 0, 0, 123456)
+    users = [
+        User(id=i, email=f"user{i}@example.com", hashed_password="x", full_name=f"User {i}",
+             bio="Bio " * 20, profile_picture_url=f"https://cdn.example.com/{i}.webp")
+        for i in range(1, 51)
+    ]
+
+    posts, post_rows, comments, comment_rows = [], [], [], []
+    for i in range(count):
+        author = users[i % len(users)]
+        created = base + timedelta(seconds=i)
+        post = Post(
+            id=i, user_id=author.id, agent_id=None, content=f"Post number {i} " * 8,
+            post_type=PostType.HUMAN, status=PostStatus.PUBLISHED, is_edited=False,
+            edited_by_user=False, is_deleted=False, like_count=i % 17, comment_count=i % 5,
+            created_at=created, updated_at=created,
+        )
+        post.author = author
+        posts.append(post)
+        post_rows.append((
+            post.id, post.user_id, post.agent_id, post.content, post.post_type, post.status,
+            post.is_edited, post.edited_by_user, post.is_deleted, post.like_count,
+            post.comment_count, post.created_at, post.updated_at,
+            author.id, author.full_name, author.profile_picture_url,
+        ))
+
+        comment = Interaction(
+            id=i, user_id=author.id, post_id=i, parent_interaction_id=None,
+            interaction_type=InteractionType.COMMENT, actor_type=ActorType.HUMAN,
+            content=f"Comment {i}", like_count=i % 3, thread_id=i, depth=0, reply_count=0,
+            is_edited=False, is_deleted=False, created_at=created, updated_at=created,
+        )
+        comment.user = author
+        comments.append(comment)
+        comment_rows.append((
+            comment.id, comment.user_id, comment.post_id, comment.parent_interaction_id,
+            comment.interaction_type, comment.actor_type, comment.content, comment.like_count,
+            comment.thread_id, comment.depth, comment.reply_count, comment.is_edited,
+            comment.is_deleted, comment.created_at, comment.updated_at,
+            author.id, author.full_name, author.email, author.profile_picture_url,
+        ))
+
+    return posts, post_rows, comments, comment_rows
+
+
+def pydantic_encoder(model) -> Callable[[list], bytes]:
+    """Serialize like FastAPI's response_model=List[model]"""
+    adapter = TypeAdapter(List[model])
+
+    def encode(objects: list) -> bytes:
+        return adapter.dump_json(adapter.validate_python(objects, from_attributes=True), by_alias=True)
+    return encode
+
+
+def per_item_us(func: Callable[[list], bytes], items: list, repeats: int) -> float:
+    """Best-of-N per-item time in microseconds"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(items)
+        best = min(best, time.perf_counter() - start)
+    return best / len(items) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=2000, help="Items per serialized list")
+    parser.add_argument("--repeats", type=int, default=10, help="Runs per measurement (best is kept)")
+    args = parser.parse_args()
+
+    posts, post_rows, comments, comment_rows = make_fixtures(args.items)
+
+    cases = [
+        ("posts", pydantic_encoder(PostResponse), posts, encode_post_rows, post_rows),
+        ("comments", pydantic_encoder(InteractionResponse), comments, encode_interaction_rows, comment_rows),
+    ]
+
+    print(f"{'list':<10}{'pydantic us/item':>18}{'fast us/item':>14}{'speedup':>10}")
+    for name, slow, objects, fast, rows in cases:
+        slow_us = per_item_us(slow, objects, args.repeats)
+        fast_us = per_item_us(fast, rows, args.repeats)
+        print(f"{name:<10}{slow_us:>18.2f}{fast_us:>14.2f}{slow_us / fast_us:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
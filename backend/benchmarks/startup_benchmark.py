@@ -0,0 +1,86 @@
+"""
+Cold start benchmark
+File: backend/benchmarks/startup_benchmark.py
+
+Imports app.main in fresh interpreters with `python -X importtime` and
+reports the total import time and the slowest modules, to keep
+scale-from-zero latency in check. Exits non-zero when the median import
+time is over the budget, so it can gate CI.
+
+Usage (from backend/):
+    python -m benchmarks.startup_benchmark
+    python -m benchmarks.startup_benchmark --runs 10 --budget-ms 2000 --top 15
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# "import time: self [us] | cumulative | imported package"
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def import_once(module: str) -> Tuple[float, Dict[str, int]]:
+    """
+    Import module in a fresh interpreter
+
+    Returns:
+        (cumulative ms of module, {top-level-ish module: cumulative us})
+    """
+    env = {**os.environ, "APP_ENV": os.environ.get("APP_ENV", "production")}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    total_us = 0
+    modules: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            continue
+        cumulative, indent, name = int(match.group(2)), len(match.group(3)), match.group(4)
+        if name == module:
+            total_us = cumulative
+        elif indent <= 3:
+            # Direct imports of the app and its first-level dependencies
+            modules[name] = max(modules.get(name, 0), cumulative)
+    return total_us / 1000, modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="app.main", help="Module to import")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to time")
+    parser.add_argument("--budget-ms", type=float, default=2000, help="Median import time budget")
+    parser.add_argument("--top", type=int, default=10, help="Slowest modules to list")
+    args = parser.parse_args()
+
+    totals: List[float] = []
+    slowest: Dict[str, List[int]] = {}
+    for _ in range(args.runs):
+        total_ms, modules = import_once(args.module)
+        totals.append(total_ms)
+        for name, cumulative in modules.items():
+            slowest.setdefault(name, []).append(cumulative)
+
+    median = statistics.median(totals)
+    print(f"import {args.module}: median {median:.0f} ms, min {min(totals):.0f} ms, max {max(totals):.0f} ms "
+          f"over {args.runs} runs (budget {args.budget_ms:.0f} ms)")
+
+    print(f"\n{'module':<48}{'median ms':>10}")
+    ranked = sorted(slowest.items(), key=lambda item: statistics.median(item[1]), reverse=True)
+    for name, samples in ranked[:args.top]:
+        print(f"{name:<48}{statistics.median(samples) / 1000:>10.1f}")
+
+    if median > args.budget_ms:
+        print(f"\n⚠️  Over budget by {median - args.budget_ms:.0f} ms")
+        sys.exit(1)
+    print("\n✅ Within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Gunicorn configuration
+File: backend/gunicorn.conf.py
+
+Multi-worker mode: gunicorn supervises WEB_CONCURRENCY uvicorn workers
+(default: one per CPU) so the API uses every core of the VM.
+
+    gunicorn -c gunicorn.conf.py app.main:app
+
+The app is imported once in the master before forking (preload_app), so
+workers share its memory pages and start faster. Nothing connection-like
+is created at import: the database engine, Redis clients and background
+tasks are set up per worker in the lifespan.
+
+State in multi-worker mode:
+- shared: database, Redis caches/rate limits/quotas when configured
+  (CACHE_BACKEND / RATE_LIMIT_BACKEND / QUOTA_BACKEND=redis),
+- per worker, kept in step over the cluster bus (REALTIME_BROKER=redis):
+  social graph, like bitmaps, local feed cache generation, realtime clients,
+- per worker by design: TTL caches, metrics (each scrape sees one worker),
+- one worker only: outbox dispatcher and action log maintenance (leader
+  election, app/services/leader_election.py).
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn_worker.UvicornWorker"
+preload_app = True
+
+# Long-lived SSE/WebSocket clients are fine: the timeout only covers a stuck worker heartbeat
+timeout = 60
+graceful_timeout = 30
+keepalive = 5
+
+accesslog = "-"
+errorlog = "-"
@@ -7,6 +7,7 @@ import { useState, useEffect } from 'react'
 import PostCard from './PostCard'
 import Loading from '../Common/Loading'
 import { postsService } from '../../services/posts'
+import { subscribeToRealtime } from '../../services/realtime'
 import type { Post } from '../../types/post'
 
 interface FeedProps {
@@ -22,6 +23,29 @@ export default function Feed({ type = 'personalized' }: FeedProps) {
     loadFeed()
   }, [type])
 
+  // Apply pushed deltas instead of re-polling the feed
+  useEffect(() => {
+    return subscribeToRealtime((event) => {
+      if (event.type === 'post.created') {
+        setPosts((current) =>
+          current.some((p) => p.id === event.data.id) ? current : [event.data, ...current]
+        )
+      } else if (event.type === 'post.liked') {
+        setPosts((current) =>
+          current.map((p) =>
+            p.id === event.data.postId ? { ...p, likeCount: event.data.likeCount } : p
+          )
+        )
+      } else if (event.type === 'comment.created') {
+        setPosts((current) =>
+          current.map((p) =>
+            p.id === event.data.postId ? { ...p, commentCount: p.commentCount + 1 } : p
+          )
+        )
+      }
+    })
+  }, [])
+
   const loadFeed = async () => {
     try {
       setIsLoading(true)
@@ -8,13 +8,15 @@ import { Link } from 'react-router-dom'
 import Navbar from '../components/Common/Navbar'
 import Loading from '../components/Common/Loading'
 import Avatar from '../components/Common/Avatar'
-import { connectionsService, Connection, User } from '../services/connections'
+import { connectionsService, Connection, UserDirectoryEntry } from '../services/connections'
 import { useAuth } from '../context/AuthContext'
 
 export default function ConnectionsPage() {
   const { user } = useAuth()
   const [activeTab, setActiveTab] = useState<'browse' | 'pending' | 'accepted'>('browse')
-  const [users, setUsers] = useState<User[]>([])
+  const [users, setUsers] = useState<UserDirectoryEntry[]>([])
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
+  const [isLoadingMore, setIsLoadingMore] = useState(false)
   const [connections, setConnections] = useState<Connection[]>([])
   const [allConnections, setAllConnections] = useState<Connection[]>([])
   const [isLoading, setIsLoading] = useState(true)
@@ -31,11 +33,12 @@ export default function ConnectionsPage() {
       setError(null)
 
       if (activeTab === 'browse') {
-        const [allUsers, allConns] = await Promise.all([
-          connectionsService.getAllUsers(),
+        const [userPage, allConns] = await Promise.all([
+          connectionsService.getUsers(),
           connectionsService.getConnections()
         ])
-        setUsers(allUsers)
+        setUsers(userPage.items)
+        setNextCursor(userPage.nextCursor)
         setAllConnections(allConns)
       } else {
         const statusFilter = activeTab === 'pending' ? 'pending' : 'accepted'
@@ -50,6 +53,21 @@ export default function ConnectionsPage() {
     }
   }
 
+  const loadMoreUsers = async () => {
+    if (!nextCursor) return
+    try {
+      setIsLoadingMore(true)
+      const userPage = await connectionsService.getUsers({ cursor: nextCursor })
+      setUsers((prev) => [...prev, ...userPage.items])
+      setNextCursor(userPage.nextCursor)
+    } catch (err) {
+      console.error('Error loading more users:', err)
+      setError('Failed to load more users')
+    } finally {
+      setIsLoadingMore(false)
+    }
+  }
+
   const getConnectionStatus = (userId: number): 'none' | 'pending_out' | 'pending_in' | 'connected' => {
     const conn = allConnections.find(
       (c) =>
@@ -123,7 +141,7 @@ export default function ConnectionsPage() {
     }
   }
 
-  const renderConnectionButton = (targetUser: User) => {
+  const renderConnectionButton = (targetUser: UserDirectoryEntry) => {
     const status = getConnectionStatus(targetUser.id)
     const connId = getConnectionId(targetUser.id)
 
@@ -264,6 +282,17 @@ export default function ConnectionsPage() {
                       </div>
                     ))
                   )}
+                  {nextCursor && (
+                    <div className="p-4 text-center">
+                      <button
+                        onClick={loadMoreUsers}
+                        disabled={isLoadingMore}
+                        className="text-sm font-medium text-blue-600 hover:text-blue-800 disabled:opacity-50"
+                      >
+                        {isLoadingMore ? 'Loading...' : 'Load more'}
+                      </button>
+                    </div>
+                  )}
                 </div>
               )}
 
@@ -38,8 +38,7 @@ export default function UserProfilePage() {
       const parsedUserId = parseInt(userId!)
       const isOwnProfile = parsedUserId === currentUser?.id
 
-      const [allUsers, userPosts, connections] = await Promise.all([
-        connectionsService.getAllUsers(),
+      const [userPosts, connections] = await Promise.all([
         postsService.getUserPosts(parsedUserId),
         connectionsService.getConnections()
       ])
@@ -55,7 +54,7 @@ export default function UserProfilePage() {
           createdAt: currentUser.createdAt
         }
       } else {
-        targetUser = allUsers.find((u) => u.id === parsedUserId)
+        targetUser = await connectionsService.getUser(parsedUserId).catch(() => undefined)
       }
 
       if (!targetUser) {
@@ -4,7 +4,7 @@
  */
 
 import apiClient from './api'
-import type { Agent, AgentConfig, AgentDashboard, AgentAction } from '../types/agent'
+import type { Agent, AgentConfig, AgentDashboard, AgentAction, AgentActionPage, AgentActionFilters } from '../types/agent'
 
 export const agentService = {
   /**
@@ -65,11 +65,16 @@ export const agentService = {
   /**
    * Get agent action history
    */
-  async getActions(_skip: number = 0, _limit: number = 20): Promise<AgentAction[]> {
-    // TODO: Implement get actions
-    // const response = await apiClient.get('/api/agents/me/actions', { params: { skip, limit } })
-    // return response.data
-    throw new Error('Not implemented')
+  async getActions(filters: AgentActionFilters = {}): Promise<AgentActionPage> {
+    const response = await apiClient.get('/api/agents/me/actions', {
+      params: {
+        cursor: filters.cursor,
+        limit: filters.limit ?? 20,
+        action_type: filters.actionType,
+        status: filters.status,
+      },
+    })
+    return response.data
   },
 
   /**
@@ -35,6 +35,25 @@ export interface User {
   createdAt: string
 }
 
+export interface UserDirectoryEntry {
+  id: number
+  email: string
+  fullName: string
+  profilePictureUrl?: string
+}
+
+export interface UserDirectoryPage {
+  items: UserDirectoryEntry[]
+  nextCursor: string | null
+}
+
+export interface UserDirectoryParams {
+  q?: string
+  cursor?: string | null
+  limit?: number
+  excludeConnected?: boolean
+}
+
 export const connectionsService = {
   /**
    * Get all connections for current user
@@ -77,10 +96,25 @@ export const connectionsService = {
   },
 
   /**
-   * Get all users (for browsing)
+   * Get a page of the user directory (for browsing)
+   */
+  async getUsers(params: UserDirectoryParams = {}): Promise<UserDirectoryPage> {
+    const response = await apiClient.get('/api/auth/users', {
+      params: {
+        q: params.q || undefined,
+        cursor: params.cursor || undefined,
+        limit: params.limit,
+        exclude_connected: params.excludeConnected || undefined,
+      },
+    })
+    return response.data
+  },
+
+  /**
+   * Get a single user's profile
    */
-  async getAllUsers(): Promise<User[]> {
-    const response = await apiClient.get('/api/auth/users')
+  async getUser(userId: number): Promise<User> {
+    const response = await apiClient.get(`/api/auth/users/${userId}`)
     return response.data
   },
 }
@@ -4,7 +4,16 @@
  */
 
 import apiClient from './api'
-import type { Post, CreatePostData, UpdatePostData, Interaction, CreateCommentData } from '../types/post'
+import type {
+  Post,
+  CreatePostData,
+  UpdatePostData,
+  Interaction,
+  Like,
+  CreateCommentData,
+  CommentThreadPage,
+  CommentReplyPage,
+} from '../types/post'
 
 export const postsService = {
   /**
@@ -57,7 +66,7 @@ export const postsService = {
   /**
    * Like a post
    */
-  async likePost(postId: number): Promise<Interaction> {
+  async likePost(postId: number): Promise<Like> {
     const response = await apiClient.post(`/api/posts/${postId}/like`)
     return response.data
   },
@@ -85,6 +94,30 @@ export const postsService = {
     return response.data
   },
 
+  /**
+   * Get top-level comments with their first replies
+   */
+  async getCommentThreads(
+    postId: number,
+    cursor?: string,
+    replies: number = 3
+  ): Promise<CommentThreadPage> {
+    const response = await apiClient.get(`/api/posts/${postId}/threads`, {
+      params: { cursor, replies },
+    })
+    return response.data
+  },
+
+  /**
+   * Load more replies under a comment
+   */
+  async getCommentReplies(commentId: number, cursor?: string): Promise<CommentReplyPage> {
+    const response = await apiClient.get(`/api/comments/${commentId}/replies`, {
+      params: { cursor },
+    })
+    return response.data
+  },
+
   /**
    * Update a comment
    */
@@ -111,7 +144,7 @@ export const postsService = {
   /**
    * Like a comment
    */
-  async likeComment(commentId: number): Promise<Interaction> {
+  async likeComment(commentId: number): Promise<Like> {
     const response = await apiClient.post(`/api/comments/${commentId}/like`)
     return response.data
   },
@@ -0,0 +1,57 @@
+/**
+ * Realtime push service (WebSocket)
+ * File: frontend/src/services/realtime.ts
+ */
+
+import type { Post, Interaction } from '../types/post'
+import type { Connection } from './connections'
+
+const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000'
+const RECONNECT_DELAY_MS = 3000
+
+export type RealtimeEvent =
+  | { type: 'post.created'; data: Post }
+  | { type: 'post.liked'; data: { postId: number; userId: number; likeCount: number } }
+  | { type: 'comment.created'; data: Interaction }
+  | { type: 'comment.liked'; data: { commentId: number; postId: number; userId: number; likeCount: number } }
+  | { type: 'connection.requested'; data: Connection }
+  | { type: 'connection.accepted'; data: Connection }
+
+/**
+ * Listen for pushed events for the logged-in user.
+ * Reconnects automatically; returns a function that closes the stream.
+ */
+export function subscribeToRealtime(onEvent: (event: RealtimeEvent) => void): () => void {
+  let socket: WebSocket | null = null
+  let reconnectTimer: ReturnType<typeof setTimeout> | undefined
+  let closed = false
+
+  const connect = () => {
+    const token = localStorage.getItem('token')
+    if (!token || closed) return
+
+    const url = `${API_URL.replace(/^http/, 'ws')}/api/realtime/ws?token=${encodeURIComponent(token)}`
+    socket = new WebSocket(url)
+
+    socket.onmessage = (message) => {
+      const event = JSON.parse(message.data)
+      if (event.type !== 'ping') {
+        onEvent(event as RealtimeEvent)
+      }
+    }
+
+    socket.onclose = () => {
+      if (!closed) {
+        reconnectTimer = setTimeout(connect, RECONNECT_DELAY_MS)
+      }
+    }
+  }
+
+  connect()
+
+  return () => {
+    closed = true
+    clearTimeout(reconnectTimer)
+    socket?.close()
+  }
+}
@@ -39,6 +39,7 @@ export interface AgentDashboard {
 
 export interface AgentAction {
   id: number
+  postId: number | null
   actionType: string
   status: string
   description: string
@@ -48,6 +49,18 @@ export interface AgentAction {
   createdAt: string
 }
 
+export interface AgentActionPage {
+  items: AgentAction[]
+  nextCursor: string | null
+}
+
+export interface AgentActionFilters {
+  cursor?: string
+  limit?: number
+  actionType?: string
+  status?: string
+}
+
 export interface OnboardingQuestionnaireData {
   use_case: 'productivity' | 'social'
   posting_frequency: 'daily' | 'weekly' | 'rarely'
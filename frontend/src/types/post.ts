@@ -39,6 +39,13 @@ export interface UpdatePostData {
 export type InteractionType = 'like' | 'comment' | 'reaction'
 export type ActorType = 'agent' | 'human'
 
+export interface Like {
+  targetType: 'post' | 'comment'
+  targetId: number
+  userId: number
+  likeCount: number
+}
+
 export interface Interaction {
   id: number
   userId: number
@@ -48,6 +55,9 @@ export interface Interaction {
   actorType: ActorType
   content: string | null
   likeCount: number
+  threadId: number | null
+  depth: number
+  replyCount: number
   isEdited: boolean
   isDeleted: boolean
   createdAt: string
@@ -62,4 +72,20 @@ export interface Interaction {
 
 export interface CreateCommentData {
   content: string
+  parentId?: number
+}
+
+export interface CommentThread extends Interaction {
+  replies: Interaction[]
+  repliesCursor: string | null
+}
+
+export interface CommentThreadPage {
+  items: CommentThread[]
+  nextCursor: string | null
+}
+
+export interface CommentReplyPage {
+  items: Interaction[]
+  nextCursor: string | null
 }